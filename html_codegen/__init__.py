@@ -1,4 +1,12 @@
-from .core import HTML, HTMLNode
+import importlib
+
+from . import tags
+from .core import (
+    HTML,
+    HTMLNode,
+    collect_errors,
+    trusted,
+)
 from .exceptions import (
     HTMLCodeGenError,
     BrythonNotEnabledError,
@@ -6,29 +14,79 @@ from .exceptions import (
     NodeAlreadyHasParentError,
     NodeValidationError,
     OnlyTextContentError,
+    SharedNodeError,
     SingleTagNestingError,
     TagOutsideHtmlError,
     TextNodeNestingError,
 )
-from .renderer import Renderer
 from .tags import (
     __all__ as _tags_all,
 )
 
+# Модули, загружаемые при первом обращении к их именам
+_LAZY_ATTRIBUTES = {
+    "AssetPipeline": "assets",
+    "Bundle": "bundler",
+    "Fragment": "components",
+    "InternPool": "interning",
+    "ParallelRenderer": "parallel",
+    "PersistentTree": "persistent",
+    "Placeholder": "streaming",
+    "RenderCache": "cache",
+    "Renderer": "renderer",
+    "Site": "build",
+    "StreamingRenderer": "streaming",
+    "TreeStats": "stats",
+    "component": "components",
+    "intern_strings": "interning",
+    "save_many": "output",
+}
+
 __all__ = [
     "HTML",
     "HTMLNode",
+    "AssetPipeline",
+    "Bundle",
+    "Fragment",
+    "InternPool",
+    "ParallelRenderer",
+    "PersistentTree",
+    "Placeholder",
+    "RenderCache",
     "Renderer",
+    "Site",
+    "StreamingRenderer",
+    "TreeStats",
+    "collect_errors",
+    "component",
+    "intern_strings",
+    "save_many",
+    "trusted",
     "HTMLCodeGenError",
     "BrythonNotEnabledError",
     "DuplicateTagError",
     "NodeAlreadyHasParentError",
     "NodeValidationError",
     "OnlyTextContentError",
+    "SharedNodeError",
     "SingleTagNestingError",
     "TagOutsideHtmlError",
     "TextNodeNestingError",
     *_tags_all,
 ]
 
-from .tags import *
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    elif name in _tags_all:
+        value = getattr(tags, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,115 @@
+"""
+External asset emission.
+
+This module copies the files used by ``style``, ``script`` and ``link`` tags into an
+output directory under names containing a hash of their content, so pages reference
+one cached file instead of each inlining its own copy.
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+from typing import (
+    Optional,
+    Union,
+)
+
+from .build import record_dependency
+
+_digest_cache: dict[Path, tuple[int, int, str]] = {}  # path -> (mtime_ns, size, digest)
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Hash the content of a file, reading it only when its size or mtime changed.
+
+    Args:
+        path (Union[str, Path]): File path
+
+    Returns:
+        str: First 12 hex digits of the SHA-256 of the file content
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+
+    cached = _digest_cache.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, "rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()[:12]
+
+    _digest_cache[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+class AssetPipeline:
+    """
+    AssetPipeline - directory of content-hashed asset files.
+
+    Files are copied once as "<stem>.<hash><suffix>"; a changed file gets a new name,
+    an unchanged one keeps it, so browsers can cache assets across pages and builds.
+    Files not larger than ``inline_threshold`` bytes are left to be inlined.
+
+    Attributes:
+        output_dir (Path): Directory the assets are copied to
+        url_prefix (str): Prefix of the URLs placed into "href"/"src" attributes
+        inline_threshold (int): Size in bytes up to which files are inlined instead
+    """
+
+    def __init__(self, output_dir: Union[str, Path], url_prefix: str = "", inline_threshold: int = 0) -> None:
+        self.output_dir = Path(output_dir)
+        self.url_prefix = url_prefix
+        self.inline_threshold = inline_threshold
+        self._written: set[str] = set()
+
+    def should_inline(self, path: Union[str, Path]) -> bool:
+        """
+        Check whether a file is small enough to be inlined.
+
+        Args:
+            path (Union[str, Path]): File path
+
+        Returns:
+            bool: True if the file size does not exceed ``inline_threshold``
+        """
+        record_dependency(path)
+        return Path(path).stat().st_size <= self.inline_threshold
+
+    def emit(self, path: Union[str, Path]) -> str:
+        """
+        Copy a file into the output directory, unless already there.
+
+        Args:
+            path (Union[str, Path]): File path
+
+        Returns:
+            str: URL of the copied file
+        """
+        path = Path(path)
+        record_dependency(path)
+        filename = f"{path.stem}.{file_digest(path)}{path.suffix}"
+
+        if filename not in self._written:
+            target = self.output_dir / filename
+            if not target.exists():
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, target)
+            self._written.add(filename)
+
+        return self.url_prefix + filename
+
+    def emit_or_inline(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        Copy a file into the output directory if it is too big to be inlined.
+
+        Args:
+            path (Union[str, Path]): File path
+
+        Returns:
+            Optional[str]: URL of the copied file, None if the file should be inlined
+        """
+        if self.should_inline(path):
+            return None
+
+        return self.emit(path)
@@ -0,0 +1,262 @@
+"""
+Incremental static site build.
+
+``Site`` keeps a list of pages, each built by a function into a file of the output
+directory, and a manifest of the inputs every page used last time: the source of
+the builder module, the files read while building (stylesheets, scripts, Brython
+modules, assets) and the declared data values. A build only runs the builders of
+pages whose inputs changed, and only writes the files whose content changed.
+"""
+
+import hashlib
+import json
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+_MANIFEST_VERSION = 1
+
+# set of resolved paths read by the page being built, None outside of builds
+_recorded_files: ContextVar[Optional[set[str]]] = ContextVar("html_codegen_recorded_files", default=None)
+
+
+def record_dependency(path: Union[str, Path]) -> None:
+    """
+    Declare that the page being built depends on a file.
+
+    Tags reading files call it, so ``Site`` rebuilds the page when the file changes.
+    Outside of a ``Site`` build it does nothing.
+
+    Args:
+        path (Union[str, Path]): File path
+    """
+    files = _recorded_files.get()
+    if files is not None:
+        files.add(str(Path(path).resolve()))
+
+
+@contextmanager
+def _record_dependencies() -> Iterator[set[str]]:
+    files: set[str] = set()
+    token = _recorded_files.set(files)
+    try:
+        yield files
+    finally:
+        _recorded_files.reset(token)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _file_digest(path: str) -> Optional[str]:
+    from .assets import file_digest
+
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+class BuildReport(NamedTuple):
+    """
+    BuildReport - outcome of ``Site.build``.
+
+    Attributes:
+        rebuilt (list[str]): Pages whose builder ran, because an input changed
+        written (list[str]): Rebuilt pages whose file was written, because the output changed
+        skipped (list[str]): Pages left untouched, because no input changed
+    """
+
+    rebuilt: list[str]
+    written: list[str]
+    skipped: list[str]
+
+
+class _Page(NamedTuple):
+    builder: Callable[..., "HTML"]
+    args: tuple
+    kwargs: dict
+    data_keys: tuple[str, ...]
+
+
+class Site:
+    """
+    Site - set of pages built incrementally into an output directory.
+
+    Attributes:
+        output_dir (Path): Directory the pages are written to
+        manifest_path (Path): JSON file with the inputs and output hash of every page
+        data (dict): Data values pages can declare a dependency on by key
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        manifest: Optional[Union[str, Path]] = None,
+        data: Optional[dict] = None,
+    ) -> None:
+        """
+        Args:
+            output_dir (Union[str, Path]): Directory the pages are written to
+            manifest (Union[str, Path], optional): Manifest file, ".html-codegen-manifest.json"
+                in the output directory by default
+            data (dict, optional): Data values pages can declare a dependency on by key
+        """
+        self.output_dir = Path(output_dir)
+        self.manifest_path = Path(manifest) if manifest else self.output_dir / ".html-codegen-manifest.json"
+        self.data = data if data is not None else {}
+        self._pages: dict[str, _Page] = {}
+
+    def add(self, path: str, builder: Callable[..., "HTML"], *args, data: tuple[str, ...] = (), **kwargs) -> None:
+        """
+        Add a page.
+
+        The builder is called with the given arguments followed by the declared data
+        values as keyword arguments, and must return the document of the page.
+
+        Args:
+            path (str): File path relative to the output directory
+            builder (Callable[..., HTML]): Function building the page
+            *args: Positional arguments of the builder
+            data (tuple[str, ...]): Keys of ``Site.data`` the page depends on
+            **kwargs: Keyword arguments of the builder
+        """
+        self._pages[path] = _Page(builder, args, kwargs, tuple(data))
+
+    def page(
+        self, path: str, *, data: tuple[str, ...] = ()
+    ) -> Callable[[Callable[..., "HTML"]], Callable[..., "HTML"]]:
+        """
+        Add a page built by the decorated function.
+
+        Args:
+            path (str): File path relative to the output directory
+            data (tuple[str, ...]): Keys of ``Site.data`` the page depends on
+
+        Returns:
+            Callable: Decorator returning the function unchanged
+        """
+
+        def decorator(builder: Callable[..., "HTML"]) -> Callable[..., "HTML"]:
+            self.add(path, builder, data=data)
+            return builder
+
+        return decorator
+
+    def build(self, force: bool = False) -> BuildReport:
+        """
+        Build the pages whose inputs changed since the last build.
+
+        The manifest is saved even if a builder raises, so pages built before the
+        error are not rebuilt next time.
+
+        Args:
+            force (bool): Rebuild every page
+
+        Returns:
+            BuildReport: Rebuilt, written and skipped pages
+        """
+        previous = self._load_manifest()
+        manifest = {path: previous[path] for path in self._pages if path in previous}
+        report = BuildReport([], [], [])
+
+        try:
+            for path, page in self._pages.items():
+                # dropped until built, so a page whose builder raises is rebuilt next time
+                entry = manifest.pop(path, None)
+                inputs = self._static_inputs(page)
+                if not force and entry is not None and self._is_up_to_date(path, entry, inputs):
+                    manifest[path] = entry
+                    report.skipped.append(path)
+                    continue
+
+                manifest[path] = self._build_page(path, page, inputs, entry, report)
+        finally:
+            self._save_manifest(manifest)
+
+        return report
+
+    def _build_page(self, path: str, page: _Page, inputs: dict, entry: Optional[dict], report: BuildReport) -> dict:
+        from .output import atomic_write
+        from .renderer import Renderer
+
+        kwargs = {**page.kwargs, **{key: self.data[key] for key in page.data_keys}}
+        with _record_dependencies() as files:
+            content = Renderer(page.builder(*page.args, **kwargs)).render_bytes()
+
+        inputs.update({f"file:{file}": _file_digest(file) for file in sorted(files)})
+        output = _digest(content)
+        report.rebuilt.append(path)
+
+        target = self.output_dir / path
+        if entry is None or entry["output"] != output or not target.exists():
+            with atomic_write(target) as file:
+                file.write(content)
+            report.written.append(path)
+
+        return {"inputs": inputs, "output": output}
+
+    def _static_inputs(self, page: _Page) -> dict[str, Optional[str]]:
+        # inputs known before building: builder source, arguments and data
+        module = sys.modules.get(page.builder.__module__)
+        module_file = getattr(module, "__file__", None)
+
+        inputs = {
+            "builder": f"{page.builder.__module__}.{page.builder.__qualname__}",
+            "module": _file_digest(module_file) if module_file else None,
+            "args": _digest(repr((page.args, sorted(page.kwargs.items()))).encode()),
+        }
+        for key in page.data_keys:
+            inputs[f"data:{key}"] = _digest(repr(self.data.get(key)).encode())
+
+        return inputs
+
+    def _is_up_to_date(self, path: str, entry: dict, inputs: dict) -> bool:
+        recorded = entry.get("inputs", {})
+        if inputs["module"] is None or not (self.output_dir / path).exists():
+            return False
+
+        if any(recorded.get(name) != digest for name, digest in inputs.items()):
+            return False
+
+        files = [name for name in recorded if name.startswith("file:")]
+        if len(recorded) != len(inputs) + len(files):
+            # the page no longer declares the same data keys
+            return False
+
+        for name in files:
+            digest = recorded[name]
+            if digest is None or _file_digest(name.removeprefix("file:")) != digest:
+                return False
+
+        return True
+
+    def _load_manifest(self) -> dict[str, dict]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return {}
+
+        return manifest.get("pages", {})
+
+    def _save_manifest(self, pages: dict[str, dict]) -> None:
+        from .output import atomic_write
+
+        with atomic_write(self.manifest_path) as file:
+            file.write(json.dumps({"version": _MANIFEST_VERSION, "pages": pages}, indent=1).encode())
@@ -0,0 +1,187 @@
+"""
+Brython source bundling.
+
+This module finds the source files of the Python modules used by ``pyscript`` tags on
+the import path, without importing them or their packages, caches their source per
+file and modification time, and can write them once
+as external files named after their content hash, so pages reference a cached file
+instead of carrying their own inline copy of the code.
+"""
+
+import ast
+import hashlib
+from functools import lru_cache
+from importlib.machinery import PathFinder
+from pathlib import Path
+from typing import (
+    Optional,
+    Union,
+)
+
+from .build import record_dependency
+
+_DOCSTRING_OWNERS = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+_source_cache: dict[tuple[Path, bool], tuple[int, str]] = {}  # (path, strip) -> (mtime_ns, source)
+
+
+def _has_docstring(node: ast.AST) -> bool:
+    first = node.body[0] if node.body else None
+    return isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str)
+
+
+@lru_cache(maxsize=1024)
+def _content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()[:12]
+
+
+def resolve_module(module_name: str) -> Optional[Path]:
+    """
+    Find the source file of a module by its dotted name.
+
+    The module is looked up on ``sys.path`` one package at a time, as the import
+    system would, but nothing is imported: packages written for Brython, e.g. with
+    ``from browser import document`` in their ``__init__``, are found as well.
+
+    Args:
+        module_name (str): Dotted module name, e.g. "web.scripts.py.hello"
+
+    Returns:
+        Optional[Path]: Path of the module source, None if it cannot be found
+    """
+    search_path = None  # sys.path for the top-level package
+    spec = None
+    for part in module_name.split("."):
+        if spec is not None and search_path is None:
+            # a module, not a package, cannot have submodules
+            return None
+        try:
+            # looked up by its own name: under a dotted one, the path of a namespace package
+            # would be computed from its parent package in sys.modules, which is not imported
+            spec = PathFinder.find_spec(part, search_path)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+        locations = spec.submodule_search_locations
+        search_path = list(locations) if locations is not None else None
+
+    if spec is None or not spec.has_location or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+
+    return Path(spec.origin)
+
+
+def strip_python_source(source: str) -> str:
+    """
+    Remove comments and docstrings from Python source.
+
+    The source is parsed and printed back, so the result is equivalent code.
+    Source that cannot be parsed is returned unchanged.
+
+    Args:
+        source (str): Python source
+
+    Returns:
+        str: Source without comments and docstrings
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return source
+
+    for node in ast.walk(tree):
+        if isinstance(node, _DOCSTRING_OWNERS) and _has_docstring(node):
+            node.body = node.body[1:] or [ast.Pass()]
+
+    return ast.unparse(tree)
+
+
+def get_module_source(module_name: str, strip: bool = False) -> Optional[str]:
+    """
+    Get the source of a module, read from disk only when the file has changed.
+
+    Args:
+        module_name (str): Dotted module name
+        strip (bool): Remove comments and docstrings
+
+    Returns:
+        Optional[str]: Module source, None if the module cannot be found
+    """
+    path = resolve_module(module_name)
+    if path is None:
+        return None
+
+    record_dependency(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _source_cache.get((path, strip))
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    source = path.read_text(encoding="utf-8").strip()
+    if strip:
+        source = strip_python_source(source)
+
+    _source_cache[(path, strip)] = (mtime, source)
+    return source
+
+
+class Bundle:
+    """
+    Bundle - directory of content-hashed Brython module files.
+
+    Every module is written once, as "<module name>.<hash>.py", and referenced by
+    ``pyscript`` tags through their "src" attribute. Files whose content did not
+    change keep their name, so browsers can cache them across pages and builds.
+
+    Attributes:
+        output_dir (Path): Directory the module files are written to
+        url_prefix (str): Prefix of the URLs placed into "src" attributes
+        strip (bool): Remove comments and docstrings from the written modules
+    """
+
+    def __init__(self, output_dir: Union[str, Path], url_prefix: str = "", strip: bool = False) -> None:
+        self.output_dir = Path(output_dir)
+        self.url_prefix = url_prefix
+        self.strip = strip
+        self._urls: dict[str, str] = {}
+        self._written: set[str] = set()
+
+    def add(self, module_name: str) -> Optional[str]:
+        """
+        Write the module into the bundle directory, unless already there.
+
+        Args:
+            module_name (str): Dotted module name
+
+        Returns:
+            Optional[str]: URL of the module file, None if the module cannot be found
+        """
+        source = get_module_source(module_name, self.strip)
+        if source is None:
+            return None
+
+        filename = f"{module_name}.{_content_digest(source)}.py"
+        if filename not in self._written:
+            path = self.output_dir / filename
+            if not path.exists():
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path.write_text(source, encoding="utf-8")
+            self._written.add(filename)
+
+        url = self._urls[module_name] = self.url_prefix + filename
+        return url
+
+    @property
+    def files(self) -> list[str]:
+        """
+        URLs of the modules added to the bundle.
+
+        Returns:
+            list[str]: Module file URLs in the order modules were first added
+        """
+        return list(self._urls.values())
@@ -0,0 +1,501 @@
+"""
+Caching of rendered pages.
+
+``RenderCache`` stores the rendered output of pages built by a function of a small
+key, so repeated requests for the same page become cache lookups. Entries expire
+after a TTL; within the stale-while-revalidate window an expired entry is still
+served while a background thread rebuilds it. Entries live in a pluggable backend:
+process memory, a sharded directory of files or an SQLite database, each bounded in
+size with least-recently-used eviction.
+"""
+
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import OrderedDict
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import update_wrapper
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+    Union,
+)
+
+from .output import atomic_write
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+_HEADER = struct.Struct("<d")  # time the entry was stored, before the rendered bytes
+
+
+class CacheBackend(ABC):
+    """
+    CacheBackend - storage of rendered pages by string key.
+
+    Values are pairs of the time they were stored at and the rendered bytes.
+    Implementations must be safe to use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[tuple[float, bytes]]:
+        """
+        Get an entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key
+
+        Returns:
+            Optional[tuple[float, bytes]]: Time the entry was stored at and its content, None if missing
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, stored_at: float, content: bytes) -> None:
+        """
+        Store an entry, evicting the least recently used ones above the size limit.
+
+        Args:
+            key (str): Entry key
+            stored_at (float): Time the entry is stored at
+            content (bytes): Rendered page
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key (str): Entry key
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """
+    MemoryBackend - in-process LRU cache.
+
+    Attributes:
+        maxsize (Optional[int]): Maximum number of entries, None if unbounded
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[float, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, stored_at: float, content: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, content)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DirectoryBackend(CacheBackend):
+    """
+    DirectoryBackend - cache of files in a local directory.
+
+    Every entry is a file named after the SHA-256 of its key, in a subdirectory named
+    after the first hex digits of the hash, so no directory holds too many files.
+    Files are replaced atomically and their modification time tracks the last use.
+    Above ``maxsize`` files, the least recently used ones are removed.
+
+    Attributes:
+        path (Path): Cache directory
+        maxsize (Optional[int]): Maximum number of entries, None if unbounded
+    """
+
+    def __init__(self, path: Union[str, Path], maxsize: Optional[int] = None, shard_width: int = 2) -> None:
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._shard_width = shard_width
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None  # number of files, counted on the first write
+
+    def _file(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.path / digest[: self._shard_width] / digest
+
+    def _files(self) -> list[Path]:
+        return [file for file in self.path.glob("*/*") if not file.name.startswith(".")]
+
+    def get(self, key: str) -> Optional[tuple[float, bytes]]:
+        file = self._file(key)
+        try:
+            data = file.read_bytes()
+            os.utime(file)
+        except FileNotFoundError:
+            return None
+
+        if len(data) < _HEADER.size:
+            return None
+
+        return _HEADER.unpack_from(data)[0], data[_HEADER.size :]
+
+    def set(self, key: str, stored_at: float, content: bytes) -> None:
+        file = self._file(key)
+        existed = file.exists()
+        with atomic_write(file) as output:
+            output.write(_HEADER.pack(stored_at))
+            output.write(content)
+
+        if self.maxsize is None or existed:
+            return
+
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._files())
+            else:
+                self._count += 1
+
+            if self._count > self.maxsize:
+                self._evict()
+
+    def _evict(self) -> None:
+        # one scan brings the cache a tenth below the limit, so scans stay rare
+        files = []
+        for file in self._files():
+            try:
+                files.append((file.stat().st_mtime_ns, file))
+            except FileNotFoundError:
+                pass
+
+        files.sort()
+        excess = len(files) - (self.maxsize - self.maxsize // 10)
+        for _, file in files[: max(excess, 0)]:
+            file.unlink(missing_ok=True)
+
+        self._count = len(files) - max(excess, 0)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._file(key).unlink()
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            if self._count is not None:
+                self._count -= 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for file in self._files():
+                file.unlink(missing_ok=True)
+            self._count = 0
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    SQLiteBackend - cache stored in an SQLite database file.
+
+    Above ``maxsize`` entries, the least recently used ones are removed.
+
+    Attributes:
+        path (Path): Database file, ":memory:" for a private in-memory database
+        maxsize (Optional[int]): Maximum number of entries, None if unbounded
+    """
+
+    def __init__(self, path: Union[str, Path], maxsize: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, used_at INTEGER NOT NULL, content BLOB NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS pages_used_at ON pages (used_at)")
+        self._last_use = 0  # time of the last use in ns, kept increasing to order entries
+
+    def _tick(self) -> int:
+        self._last_use = max(time.time_ns(), self._last_use + 1)
+        return self._last_use
+
+    def get(self, key: str) -> Optional[tuple[float, bytes]]:
+        with self._lock:
+            row = self._connection.execute("SELECT stored_at, content FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute("UPDATE pages SET used_at = ? WHERE key = ?", (self._tick(), key))
+            return row[0], row[1]
+
+    def set(self, key: str, stored_at: float, content: bytes) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (key, stored_at, used_at, content) VALUES (?, ?, ?, ?)",
+                (key, stored_at, self._tick(), content),
+            )
+            if self.maxsize is not None:
+                self._connection.execute(
+                    "DELETE FROM pages WHERE key NOT IN (SELECT key FROM pages ORDER BY used_at DESC LIMIT ?)",
+                    (self.maxsize,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM pages WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM pages")
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class CachedPage:
+    """
+    CachedPage - page builder whose rendered output is cached, see ``RenderCache.page``.
+
+    Attributes:
+        builder (Callable[..., HTML]): Wrapped function building the page
+        cache (RenderCache): Cache the output is stored in
+    """
+
+    def __init__(self, cache: "RenderCache", builder: Callable[..., "HTML"], key: Optional[Callable[..., str]]) -> None:
+        self.cache = cache
+        self.builder = builder
+        self._key = key
+        self._prefix = f"{builder.__module__}.{builder.__qualname__}:"
+        update_wrapper(self, builder)
+
+    def __call__(self, *args, **kwargs) -> str:
+        return self.render(*args, **kwargs)
+
+    def key(self, *args, **kwargs) -> str:
+        """
+        Cache key of the page built from the given arguments.
+
+        Returns:
+            str: Builder name followed by the result of the key function
+        """
+        if self._key is not None:
+            return self._prefix + str(self._key(*args, **kwargs))
+
+        return self._prefix + repr((args, sorted(kwargs.items())))
+
+    def render_bytes(self, *args, **kwargs) -> bytes:
+        """
+        Rendered page, built and rendered only if not cached.
+
+        Returns:
+            bytes: UTF-8 encoded document
+        """
+        return self.cache.get(self.key(*args, **kwargs), lambda: self.builder(*args, **kwargs))
+
+    def render(self, *args, **kwargs) -> str:
+        """
+        Rendered page, built and rendered only if not cached.
+
+        Returns:
+            str: Document
+        """
+        return self.render_bytes(*args, **kwargs).decode()
+
+    def save(self, filename: Union[str, Path], *args, **kwargs) -> Path:
+        """
+        Write the rendered page to a file, replacing it atomically.
+
+        Args:
+            filename (Union[str, Path]): File path
+            *args: Arguments of the builder
+            **kwargs: Keyword arguments of the builder
+
+        Returns:
+            Path: Absolute path of the written file
+        """
+        path = Path(filename).absolute()
+        with atomic_write(path) as file:
+            file.write(self.render_bytes(*args, **kwargs))
+
+        return path
+
+    def invalidate(self, *args, **kwargs) -> None:
+        """
+        Drop the cached page built from the given arguments.
+        """
+        self.cache.invalidate(self.key(*args, **kwargs))
+
+
+class RenderCache:
+    """
+    RenderCache - cache of rendered pages with expiry and background revalidation.
+
+    An entry younger than ``ttl`` seconds is served as is. An older one is still served
+    for ``stale_while_revalidate`` more seconds while the page is rebuilt on a background
+    thread; past that, the page is rebuilt before being returned.
+
+    Attributes:
+        backend (CacheBackend): Storage of the entries
+        ttl (Optional[float]): Seconds an entry stays fresh, None if it never expires
+        stale_while_revalidate (float): Seconds an expired entry is served while rebuilt
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        stale_while_revalidate: float = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            backend (Optional[CacheBackend]): Storage of the entries, a ``MemoryBackend`` by default
+            ttl (Optional[float]): Seconds an entry stays fresh, None if it never expires
+            stale_while_revalidate (float): Seconds an expired entry is served while rebuilt
+            clock (Callable[[], float]): Source of the current time in seconds
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._revalidating: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def page(
+        self, builder: Optional[Callable[..., "HTML"]] = None, /, *, key: Optional[Callable[..., str]] = None
+    ) -> Union[CachedPage, Callable[[Callable[..., "HTML"]], CachedPage]]:
+        """
+        Cache the rendered output of a page builder.
+
+        Can be used as ``@cache.page`` or ``@cache.page(key=...)``.
+
+        Args:
+            builder (Callable[..., HTML], optional): Function building the page
+            key (Callable[..., str], optional): Function mapping the builder arguments to the
+                cache key, by default the ``repr`` of the arguments
+
+        Returns:
+            CachedPage: Wrapper with ``render``, ``render_bytes``, ``save`` and ``invalidate`` methods
+        """
+        if builder is None:
+            return lambda builder: CachedPage(self, builder, key)
+
+        return CachedPage(self, builder, key)
+
+    def get(self, key: str, build: Callable[[], "HTML"]) -> bytes:
+        """
+        Get the rendered page stored under a key, building it if needed.
+
+        Args:
+            key (str): Cache key
+            build (Callable[[], HTML]): Function building the page
+
+        Returns:
+            bytes: UTF-8 encoded document
+        """
+        entry = self.backend.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            age = self._clock() - stored_at
+            if self.ttl is None or age <= self.ttl:
+                return content
+            if age <= self.ttl + self.stale_while_revalidate:
+                self._revalidate(key, build)
+                return content
+
+        return self._build(key, build)
+
+    def _build(self, key: str, build: Callable[[], "HTML"]) -> bytes:
+        from .renderer import Renderer
+
+        content = Renderer(build()).render_bytes()
+        self.backend.set(key, self._clock(), content)
+        return content
+
+    def _revalidate(self, key: str, build: Callable[[], "HTML"]) -> None:
+        with self._lock:
+            if key in self._revalidating:
+                return
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-codegen-revalidate")
+            future = self._revalidating[key] = self._executor.submit(self._build, key, build)
+
+        # a failed rebuild keeps serving the stale entry until it is too old
+        future.add_done_callback(lambda _: self._revalidated(key))
+
+    def _revalidated(self, key: str) -> None:
+        with self._lock:
+            self._revalidating.pop(key, None)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove the page stored under a key.
+
+        Args:
+            key (str): Cache key
+        """
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        """
+        Remove all stored pages.
+        """
+        self.backend.clear()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the background rebuilds started so far.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait
+        """
+        with self._lock:
+            futures = list(self._revalidating.values())
+
+        wait(futures, timeout)
+
+    def close(self) -> None:
+        """
+        Wait for the background rebuilds and stop the rebuild thread.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,265 @@
+"""
+Components with memoized rendering.
+
+A component is a function building an HTML subtree from its arguments ("props").
+``@component`` builds the subtree once per distinct set of props and keeps it in an
+LRU cache together with its rendered output, so repeated calls return a ``Fragment``
+node that the renderer writes as one pre-rendered string instead of walking the
+subtree again.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import update_wrapper
+from typing import (
+    Callable,
+    Hashable,
+    NamedTuple,
+    Optional,
+)
+
+from .build import (
+    _record_dependencies,
+    record_dependency,
+)
+from .core import (
+    HTML,
+    FrozenAttributes,
+    _build_state,
+)
+from .exceptions import SharedNodeError
+
+
+class ComponentInfo(NamedTuple):
+    """
+    ComponentInfo - cache statistics of a component.
+
+    Attributes:
+        hits (int): Calls served from the cache
+        misses (int): Calls that built the subtree
+        maxsize (Optional[int]): Maximum number of cached prop sets, None if unbounded
+        currsize (int): Number of cached prop sets
+    """
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _CacheEntry:
+    """
+    Subtree built for one set of props, the files read while building it, and its
+    output rendered at each depth it was used at.
+    """
+
+    __slots__ = ("tree", "files", "attrs", "_text", "_bytes")
+
+    def __init__(self, tree: HTML, files: tuple[str, ...] = ()) -> None:
+        self.tree = tree
+        self.files = files
+        self.attrs = FrozenAttributes(tree._attrs)
+        self._text: dict[tuple[int, int], str] = {}  # (html_indent, layer) -> output
+        self._bytes: dict[tuple[int, int], bytes] = {}
+
+    def text(self, html_indent: int, layer: int) -> str:
+        key = (html_indent, layer)
+        output = self._text.get(key)
+        if output is None:
+            from .renderer import (
+                Renderer,
+                _TextWriter,
+            )
+
+            renderer = Renderer(self.tree, html_indent)
+            writer = _TextWriter(renderer)
+            renderer._write_tag(self.tree, layer, writer)
+            output = self._text[key] = writer.getvalue()
+
+        return output
+
+    def bytes(self, html_indent: int, layer: int) -> bytes:
+        key = (html_indent, layer)
+        output = self._bytes.get(key)
+        if output is None:
+            output = self._bytes[key] = self.text(html_indent, layer).encode()
+
+        return output
+
+
+class Fragment(HTML):
+    """
+    Fragment - pre-rendered subtree returned by a component.
+
+    The fragment stands for the root element of the component subtree: it has the
+    same tag name and (read-only) attributes, but no children of its own. Renderers
+    write the cached output of the subtree in its place.
+
+    Attributes:
+        source (HTML): Subtree the fragment was rendered from, shared by all fragments
+            of the same props and not to be modified
+    """
+
+    is_fragment = True
+
+    def __init__(self, entry: _CacheEntry) -> None:
+        super().__init__(entry.tree.tag_name)
+        self._attrs = entry.attrs
+        self.is_single = entry.tree.is_single
+        self._entry = entry
+
+    @property
+    def source(self) -> HTML:
+        return self._entry.tree
+
+    def rendered(self, html_indent: int, layer: int) -> str:
+        """
+        Output of the subtree placed at the given depth, without the indent before its open tag.
+
+        Args:
+            html_indent (int): Indent width
+            layer (int): Depth of the fragment in the rendered tree
+
+        Returns:
+            str: Rendered subtree
+        """
+        return self._entry.text(html_indent, layer)
+
+    def rendered_bytes(self, html_indent: int, layer: int) -> bytes:
+        """
+        UTF-8 encoded ``rendered`` output.
+
+        Args:
+            html_indent (int): Indent width
+            layer (int): Depth of the fragment in the rendered tree
+
+        Returns:
+            bytes: Rendered subtree
+        """
+        return self._entry.bytes(html_indent, layer)
+
+    def add_node_validation(self, new_node: HTML) -> None:
+        raise SharedNodeError("pre-rendered fragment cannot have new children")
+
+
+class Component:
+    """
+    Component - memoizing wrapper of a subtree builder, see ``component``.
+
+    Attributes:
+        builder (Callable[..., HTML]): Wrapped builder function
+        maxsize (Optional[int]): Maximum number of cached prop sets, None if unbounded
+    """
+
+    def __init__(self, builder: Callable[..., HTML], maxsize: Optional[int] = 1024) -> None:
+        self.builder = builder
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+        update_wrapper(self, builder)
+
+    def __call__(self, *args, **kwargs) -> Fragment:
+        key = self._make_key(args, kwargs)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+
+        if entry is None:
+            entry = self._build(args, kwargs)
+            with self._lock:
+                self._misses += 1
+                self._cache[key] = entry
+                if self.maxsize is not None and len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        # every page using the component depends on the files it read, not only the first one built
+        for path in entry.files:
+            record_dependency(path)
+
+        return Fragment(entry)
+
+    def _build(self, args: tuple, kwargs: dict) -> _CacheEntry:
+        # the subtree belongs to the cache, not to the with blocks open around the call
+        token = _build_state.set(None)
+        try:
+            with _record_dependencies() as files:
+                tree = self.builder(*args, **kwargs)
+        finally:
+            _build_state.reset(token)
+
+        if not isinstance(tree, HTML) or tree.is_text:
+            raise TypeError(f"component {self.__name__!r} must return an HTML element, not {tree!r}")
+
+        return _CacheEntry(tree, tuple(sorted(files)))
+
+    @staticmethod
+    def _make_key(args: tuple, kwargs: dict) -> Hashable:
+        # types are part of the key: equal props such as 1 and True render differently
+        items = tuple(sorted(kwargs.items()))
+        return args, items, tuple(map(type, args)), tuple(type(value) for _, value in items)
+
+    def invalidate(self, *args, **kwargs) -> bool:
+        """
+        Drop the cached subtree of the given props.
+
+        Args:
+            *args: Positional props
+            **kwargs: Keyword props
+
+        Returns:
+            bool: True if the props were cached
+        """
+        with self._lock:
+            return self._cache.pop(self._make_key(args, kwargs), None) is not None
+
+    def cache_clear(self) -> None:
+        """
+        Drop all cached subtrees and reset the statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> ComponentInfo:
+        """
+        Cache statistics of the component.
+
+        Returns:
+            ComponentInfo: Hits, misses, maximum and current size
+        """
+        with self._lock:
+            return ComponentInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+
+def component(
+    builder: Optional[Callable[..., HTML]] = None, /, *, maxsize: Optional[int] = 1024
+) -> Callable[..., Fragment]:
+    """
+    Memoize the rendered output of a subtree builder by its props.
+
+    The builder runs once per distinct set of hashable arguments, outside of the with
+    blocks open around the call, and must return an HTML element. Every call returns a
+    new ``Fragment`` of the cached subtree, added to the current with block like any
+    other node. The subtree must not depend on where it is placed.
+
+    Can be used as ``@component`` or ``@component(maxsize=...)``.
+
+    Args:
+        builder (Callable[..., HTML], optional): Function building the subtree
+        maxsize (Optional[int]): Maximum number of cached prop sets, None for no limit
+
+    Returns:
+        Callable[..., Fragment]: ``Component`` wrapper with ``cache_info``, ``cache_clear``
+            and ``invalidate`` methods
+
+    Raises:
+        TypeError: when called with unhashable props, or if the builder does not return an element
+    """
+    if builder is None:
+        return lambda builder: Component(builder, maxsize)
+
+    return Component(builder, maxsize)
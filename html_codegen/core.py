@@ -8,26 +8,239 @@ as well as saving HTML documents to files.
 
 The HTMLNode class also implements a context manager that creates code blocks using the with operator.
 When an HTMLNode instance is created inside a with block, it is added to the context stack
-of the current execution context. When exiting the with block, all elements of the current context
+of the current execution context (a thread or an asyncio task, tracked with a context variable).
+When exiting the with block, all elements of the current context
 are added as child elements to the current HTMLNode instance if they don't have a parent element. 
 The HTMLNode context manager allows creating hierarchical element structures in HTML documents using with blocks.
 
 The HTML class also allows dynamic creation of child elements through method calls with tag names.
 """
-import threading
-from collections import defaultdict, namedtuple
-from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Optional
-
-from .exceptions import NodeAlreadyHasParentError
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
+
+from .exceptions import (
+    HTMLCodeGenError,
+    NodeAlreadyHasParentError,
+    SharedNodeError,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .interning import InternPool
+    from .stats import TreeStats
     from .tags.document_ import html
 
 
-def _get_thread_context() -> int:
-    context = [threading.current_thread()]
-    return hash(tuple(context))
+class _BuildState:
+    """
+    Construction state of one execution context: the stack of open with frames.
+    """
+
+    __slots__ = ("stack", "token")
+
+    def __init__(self) -> None:
+        self.stack: list = []
+        self.token: Optional[Token] = None
+
+
+# set when the outermost with block of the context is entered, reset when it exits
+_build_state: ContextVar[Optional[_BuildState]] = ContextVar("html_codegen_build_state", default=None)
+# list receiving callback errors inside collect_errors(), None to raise them at once
+_collected_errors: ContextVar[Optional[list[HTMLCodeGenError]]] = ContextVar(
+    "html_codegen_collected_errors", default=None
+)
+
+
+# True inside trusted(): placement rules and add_node_validation are not checked
+_trusted: ContextVar[bool] = ContextVar("html_codegen_trusted", default=False)
+
+
+# pool deduplicating text and attribute values of new nodes, see interning.intern_strings()
+_intern_pool: ContextVar[Optional["InternPool"]] = ContextVar("html_codegen_intern_pool", default=None)
+
+
+@contextmanager
+def trusted() -> Iterator[None]:
+    """
+    Build trees without validating each node as it is added.
+
+    Inside the block ``add_node`` skips ``add_node_validation`` and the parent check,
+    and parent callbacks skip placement rules (e.g. a single "head" per "html") while
+    still applying their effects (e.g. Brython scripts). The whole construction,
+    including the exit of the outermost with block, should happen inside the block.
+    Use ``HTML.validate`` to check the finished tree in one pass.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def _run_check(check: Callable[[], None]) -> None:
+    errors = _collected_errors.get()
+    if errors is None:
+        check()
+        return
+
+    try:
+        check()
+    except HTMLCodeGenError as error:
+        errors.append(error)
+
+
+@contextmanager
+def collect_errors() -> Iterator[list[HTMLCodeGenError]]:
+    """
+    Collect validation errors of deferred parent callbacks instead of raising the first one.
+
+    Every with block exited inside runs all its callbacks, and ``HTML.validate`` checks
+    the whole tree; the errors they raise are raised together as an ``ExceptionGroup``
+    when the ``collect_errors`` block exits.
+
+    Yields:
+        list[HTMLCodeGenError]: Errors collected so far
+
+    Raises:
+        ExceptionGroup: if any deferred callback failed
+    """
+    errors: list[HTMLCodeGenError] = []
+    token = _collected_errors.set(errors)
+    try:
+        yield errors
+    finally:
+        _collected_errors.reset(token)
+
+    if errors:
+        raise ExceptionGroup("deferred parent callbacks failed", errors)
+
+
+@lru_cache(maxsize=4096)
+def _render_attributes(items: tuple) -> str:
+    return ''.join([f' {name}="{value}"' for name, value in items])
+
+
+class Attributes(dict):
+    """
+    Attributes - dictionary of element attributes with a cached rendered form.
+
+    Keys are interned on construction. The rendered fragment (' name="value"...')
+    is computed once per distinct attribute set and shared by all elements having
+    the same attributes; any mutation of the dictionary invalidates it.
+    """
+
+    __slots__ = ("_fragment", "_fragment_bytes")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    @property
+    def fragment(self) -> str:
+        """
+        Rendered attributes, e.g. ' class="row" id="main"'.
+
+        Returns:
+            str: Rendered attributes, empty string if there are none
+        """
+        if self._fragment is None:
+            items = tuple(self.items())
+            if all(type(value) is str for value in self.values()):
+                self._fragment = _render_attributes(items)
+            else:  # 1 == True == 1.0 would share a cache entry, unhashable values have none
+                self._fragment = _render_attributes.__wrapped__(items)
+        return self._fragment
+
+    @property
+    def fragment_bytes(self) -> bytes:
+        """
+        UTF-8 encoded rendered attributes.
+
+        Returns:
+            bytes: Encoded ``fragment``
+        """
+        if self._fragment_bytes is None:
+            self._fragment_bytes = self.fragment.encode()
+        return self._fragment_bytes
+
+    def copy(self) -> "Attributes":
+        """
+        Copy the attributes together with the cached rendered fragment.
+
+        Returns:
+            Attributes: Mutable copy of the attributes
+        """
+        attrs = Attributes.__new__(Attributes)
+        dict.update(attrs, self)
+        attrs._fragment = self._fragment
+        attrs._fragment_bytes = self._fragment_bytes
+        return attrs
+
+    def _invalidate(self) -> None:
+        self._fragment = None
+        self._fragment_bytes = None
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(sys.intern(key) if type(key) is str else key, value)
+        self._invalidate()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other) -> "Attributes":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._invalidate()
+        return value
+
+    def popitem(self) -> tuple:
+        item = super().popitem()
+        self._invalidate()
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(sys.intern(key) if type(key) is str else key, value)
+        self._invalidate()
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),)
+
+
+class FrozenAttributes(Attributes):
+    """
+    FrozenAttributes - read-only attributes of a shared node.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise SharedNodeError("attributes of a shared node cannot be changed")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = _readonly
+
+    def update(self, *args, **kwargs) -> None:
+        if self:
+            self._readonly()
+        super().update(*args, **kwargs)
 
 
 class HTMLNode:
@@ -40,11 +253,16 @@ class HTMLNode:
     Attributes:
         _parent (Optional[HTMLNode]): Parent node of the current HTML node.
         _nodes (list[HTMLNode]): List of child nodes of the current HTML node.
+        _frozen (bool): Flag indicating whether the node belongs to a shared subtree.
     """
 
-    frame = namedtuple("frame", ["tag", "items"])
-    _with_contexts = defaultdict(list)
-    _pending_callbacks = defaultdict(list)  # thread_id -> list of callbacks
+    frame = namedtuple("frame", ["tag", "items", "callbacks"])
+    _frozen = False
+    is_text = False
+    # defaults for nodes that do not set them, such as text nodes
+    _parent: Optional["HTMLNode"] = None
+    _ctx = None
+    _created_in_with_context = False
 
     def __init__(self):
         self._parent: Optional[HTMLNode] = None
@@ -60,26 +278,35 @@ class HTMLNode:
         Returns:
             HTMLNode: HTML node object.
         """
-        stack = HTMLNode._with_contexts[_get_thread_context()]
-        stack.append(HTMLNode.frame(self, []))
+        state = _build_state.get()
+        if state is None:
+            state = _BuildState()
+            state.token = _build_state.set(state)
+
+        state.stack.append(HTMLNode.frame(self, [], []))
         return self
 
-    def __exit__(self, *_) -> None:
-        thread_id = _get_thread_context()
-        stack = HTMLNode._with_contexts[thread_id]
-        frame = stack.pop()
-        
-        # Сначала устанавливаем всех родителей
-        for item in frame.items:
-            if item.parent:
-                continue
-            self.add_node(item)
-        
-        # Затем выполняем все отложенные колбэки
-        HTMLNode._execute_pending_callbacks(thread_id)
-        
-        if not stack:
-            del HTMLNode._with_contexts[thread_id]
+    def __exit__(self, exc_type, *_) -> None:
+        state = _build_state.get()
+        frame = state.stack.pop()
+        try:
+            # Сначала устанавливаем всех родителей
+            for item in frame.items:
+                if item.parent:
+                    continue
+                self.add_node(item)
+
+            # Затем выполняем отложенные колбэки узлов этого блока,
+            # если блок не завершился исключением
+            if exc_type is None:
+                HTMLNode._execute_pending_callbacks(frame)
+        finally:
+            for item in frame.items:
+                item._ctx = None
+
+            if not state.stack:
+                # the outermost with block releases the whole construction state
+                _build_state.reset(state.token)
 
     @property
     def parent(self) -> Optional["HTMLNode"]:
@@ -106,40 +333,53 @@ class HTMLNode:
         self.parent_setted_callback()
 
     def parent_setted_callback(self) -> None:
+        cls = type(self)
+        if cls._execute_parent_callback is HTMLNode._execute_parent_callback:
+            # nothing but placement rules, which may be absent or not checked
+            if cls._validate_placement is HTMLNode._validate_placement or _trusted.get():
+                return
+
         if self._created_in_with_context:
             self._schedule_deferred_callback()
         else:
             self._execute_parent_callback()
     
     def _schedule_deferred_callback(self) -> None:
-        thread_id = _get_thread_context()
-        HTMLNode._pending_callbacks[thread_id].append(self._execute_parent_callback)
+        frame = self._ctx
+        if frame is None:
+            # the with block that created the node is already closed
+            self._execute_parent_callback()
+            return
+
+        frame.callbacks.append(self._execute_parent_callback)
     
     def _execute_parent_callback(self) -> None:
-        pass
+        if not _trusted.get():
+            self._validate_placement()
+
+    def _validate_placement(self) -> None:
+        """
+        Check rules on where the node may be placed, once it has a parent.
+
+        Raises:
+            HTMLCodeGenError: if the node is placed where it is not allowed
+        """
     
-    @classmethod
-    def _execute_pending_callbacks(cls, thread_id: int) -> None:
+    @staticmethod
+    def _execute_pending_callbacks(frame: "HTMLNode.frame") -> None:
         """
-        Execute all pending callbacks for the given thread.
+        Execute the callbacks deferred by the nodes created in a with block.
+
+        Callbacks run once, in the order they were scheduled, including the ones
+        scheduled while running. Errors are raised, or collected inside ``collect_errors``.
         
         Args:
-            thread_id (int): Thread identifier
-        """
-        callbacks = cls._pending_callbacks.get(thread_id, [])
-        for callback in callbacks:
-            try:
-                callback()
-            except Exception as e:
-                # Логируем ошибку, но не прерываем выполнение других колбэков
-                print(f"Error executing deferred callback: {e}")
+            frame (HTMLNode.frame): Frame of the with block being exited
+        """
+        for callback in frame.callbacks:
+            _run_check(callback)
         
-        # Очищаем очередь колбэков для этого потока
-        cls._pending_callbacks[thread_id].clear()
-    
-    @staticmethod
-    def _get_thread_context() -> int:
-        return _get_thread_context()
+        frame.callbacks.clear()
     
     def _find_html_tag(self) -> Optional["HTML"]:
         current = self.parent
@@ -148,9 +388,8 @@ class HTMLNode:
                 return current
             current = current.parent
         
-        thread_id = self._get_thread_context()
-        stack = self._with_contexts.get(thread_id, [])
-        for frame in stack:
+        state = _build_state.get()
+        for frame in state.stack if state else ():
             if getattr(frame.tag, 'tag_name', None) == 'html':
                 return frame.tag
         
@@ -192,6 +431,99 @@ class HTMLNode:
 
         return root
 
+    def walk(
+        self, order: str = "pre", prune: Optional[Callable[["HTMLNode"], bool]] = None
+    ) -> Iterator["HTMLNode"]:
+        """
+        Iterate over the node and its subtree in document order, without recursion.
+
+        In "pre" order each node comes before its descendants, in "post" order after
+        them. Nodes for which ``prune`` returns True are yielded, but not their
+        descendants. The pre-rendered content of components and placeholders is not
+        walked. The tree must not change while it is walked.
+
+        Args:
+            order (str): "pre" or "post"
+            prune (Optional[Callable[[HTMLNode], bool]]): Check of the nodes whose descendants are skipped
+
+        Returns:
+            Iterator[HTMLNode]: Nodes of the subtree
+
+        Raises:
+            ValueError: if the order is neither "pre" nor "post"
+        """
+        if order == "pre":
+            return self._walk_pre([self], prune)
+        if order == "post":
+            return self._walk_post(prune)
+        raise ValueError(f'walk order must be "pre" or "post", not {order!r}')
+
+    def descendants(self, prune: Optional[Callable[["HTMLNode"], bool]] = None) -> Iterator["HTMLNode"]:
+        """
+        Iterate over the subtree of the node, without the node itself, in pre-order (see ``walk``).
+
+        Args:
+            prune (Optional[Callable[[HTMLNode], bool]]): Check of the nodes whose descendants are skipped
+
+        Returns:
+            Iterator[HTMLNode]: Descendants of the node
+        """
+        return self._walk_pre(self._nodes[::-1], prune)
+
+    def ancestors(self) -> Iterator["HTMLNode"]:
+        """
+        Iterate over the parent of the node, the parent of the parent and so on up to the root.
+
+        Yields:
+            HTMLNode: Next ancestor
+        """
+        node = self._parent
+        while node is not None:
+            yield node
+            node = node._parent
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Iterate over the content of the text nodes of the subtree in document order.
+
+        Yields:
+            str: Content of the next text node
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.is_text:
+                yield node.content
+            elif node._nodes:
+                stack.extend(reversed(node._nodes))
+
+    @staticmethod
+    def _walk_pre(stack: list["HTMLNode"], prune: Optional[Callable[["HTMLNode"], bool]]) -> Iterator["HTMLNode"]:
+        # nodes left to walk, the next one last
+        while stack:
+            node = stack.pop()
+            yield node
+            if node._nodes and (prune is None or not prune(node)):
+                stack.extend(reversed(node._nodes))
+
+    def _walk_post(self, prune: Optional[Callable[["HTMLNode"], bool]]) -> Iterator["HTMLNode"]:
+        # path to the current node, and the position of the next child to walk for each node on it;
+        # pruned nodes start past their last child
+        nodes = [self]
+        positions = [len(self._nodes) if prune is not None and prune(self) else 0]
+        while nodes:
+            node = nodes[-1]
+            position = positions[-1]
+            if position < len(node._nodes):
+                positions[-1] = position + 1
+                child = node._nodes[position]
+                nodes.append(child)
+                positions.append(len(child._nodes) if prune is not None and prune(child) else 0)
+            else:
+                nodes.pop()
+                positions.pop()
+                yield node
+
     def add_node_validation(self, new_node: "HTMLNode") -> None:
         """
         Method for validating a child node before adding it to the current HTML node.
@@ -204,18 +536,35 @@ class HTMLNode:
         """
         ...
 
-    def add_node(self, new_node: "HTMLNode") -> None:
+    def add_node(self, new_node: Union["HTMLNode", str]) -> None:
         """
         Method for adding a child node to the current HTML node.
 
+        A shared node (see ``HTML.share``) is added by reference: it keeps no parent
+        pointer and may be added to any number of parents. A string is added as a
+        text node.
+
         Args:
-            new_node (HTMLNode): New child node to add.
+            new_node (Union[HTMLNode, str]): New child node to add.
 
         Returns:
             None
         """
-        self.add_node_validation(new_node)
-        new_node.parent = self
+        if self._frozen:
+            raise SharedNodeError("shared node cannot have new children")
+
+        if isinstance(new_node, str):
+            from .tags.base_ import text
+
+            new_node = text._detached(new_node)
+
+        if not _trusted.get():
+            if new_node.parent:
+                raise NodeAlreadyHasParentError("node already has parent")
+            self.add_node_validation(new_node)
+
+        if not new_node._frozen:
+            new_node.parent = self
         self._nodes.append(new_node)
 
     def _add_to_ctx(self) -> None:
@@ -225,8 +574,8 @@ class HTMLNode:
         Returns:
             None
         """
-        stack = HTMLNode._with_contexts.get(_get_thread_context())
-        if stack:
+        state = _build_state.get()
+        if state and (stack := state.stack):
             self._ctx = stack[-1]
             stack[-1].items.append(self)
             self._created_in_with_context = True
@@ -243,13 +592,20 @@ class HTML(HTMLNode):
         tag_name (str): Tag name of the element
         is_single (bool): Flag indicating whether the element is single (e.g., <img>)
         is_text (bool): Flag indicating whether the element is text
-        _attrs (dict): Dictionary of element attributes
+        is_fragment (bool): Flag indicating whether the element is pre-rendered (see ``components.Fragment``)
+        is_placeholder (bool): Flag indicating whether the element is resolved later (see ``streaming.Placeholder``)
+        reindent (bool): Flag indicating whether the lines of text content are indented when rendered
+        _attrs (Attributes): Dictionary of element attributes
         parent (HTML): Parent element
         root (HTML): Root element
         _nodes (list): List of child elements
 
     """
 
+    is_fragment = False
+    is_placeholder = False
+    reindent = True
+
     def __init__(self, tag_name: str, attrs: Optional[dict] = None):
         """
         Initialize an HTML class instance.
@@ -263,7 +619,8 @@ class HTML(HTMLNode):
         self.tag_name = tag_name
         self.is_single: bool = False
         self.is_text: bool = False
-        self._attrs = attrs or {}
+        pool = _intern_pool.get()
+        self._attrs = Attributes(attrs or ()) if pool is None or not attrs else pool.attributes(attrs)
 
         self.parent: "HTML"
         self.root: "HTML"
@@ -282,6 +639,10 @@ class HTML(HTMLNode):
         return Renderer(self).get_open_tag(self).strip() + Renderer(self).get_close_tag(self).strip()
 
     def __getattr__(self, tag_name: str) -> Callable[..., "HTML"]:
+        if tag_name.startswith("__"):
+            # protocol lookups (__deepcopy__, __setstate__, ...) are not tag names
+            raise AttributeError(tag_name)
+
         from . import tags
 
         keyword_conflicts = {'input', 'object', 'map', 'del'}
@@ -342,27 +703,160 @@ class HTML(HTMLNode):
 
         return False
 
-    def add_node_validation(self, new_node: "HTML") -> None:
-        if new_node.parent:
+    def validate(self) -> None:
+        """
+        Check the whole tree in one pass.
+
+        Applies the checks skipped inside ``trusted()``: every child must point back to
+        its parent (shared nodes excepted) and pass the parent's ``add_node_validation``,
+        and every node must satisfy its placement rules.
+
+        Raises:
+            HTMLCodeGenError: the first invalid node found, or all of them as an
+                ``ExceptionGroup`` when called inside ``collect_errors()``
+
+        """
+        self._validate_placement_of(self)
+
+        for node in self.walk():
+            for child in node._nodes:
+                _run_check(lambda: node._validate_child(child))
+                self._validate_placement_of(child)
+
+    def _validate_child(self, child: "HTML") -> None:
+        if child._parent is not self and not (child._frozen and child._parent is None):
             raise NodeAlreadyHasParentError("node already has parent")
+        self.add_node_validation(child)
 
-    def save(self, filename: str) -> Path:
+    @staticmethod
+    def _validate_placement_of(node: "HTML") -> None:
+        if type(node)._validate_placement is not HTMLNode._validate_placement and node._parent is not None:
+            _run_check(node._validate_placement)
+
+    def clone(self, deep: bool = True) -> "HTML":
         """
-        Save the HTML document to a file.
+        Copy the element, and its subtree if deep, without its parent.
+
+        The copy is made iteratively and only covers the subtree: attribute values are
+        shared with the original, shared nodes are referenced rather than copied, and
+        validation and parent callbacks are not run again for the copied nodes.
 
         Args:
-            filename (str): File name
+            deep (bool): Copy the children as well, otherwise the copy has no children
 
         Returns:
-            Path: Path object representing the file path
+            HTML: Detached copy of the element
 
         """
-        from .renderer import Renderer
+        root = self._clone_node()
+        if not deep:
+            return root
+
+        stack = [(self, root)]
+        while stack:
+            original, copy = stack.pop()
+            for child in original._nodes:
+                if child._frozen and child._parent is None:
+                    copy._nodes.append(child)
+                    continue
+
+                child_copy = child._clone_node()
+                child_copy._parent = copy
+                copy._nodes.append(child_copy)
+                if child._nodes:
+                    stack.append((child, child_copy))
+
+        return root
+
+    def _clone_node(self) -> "HTML":
+        node = self.__class__.__new__(self.__class__)
+        state = self.__dict__.copy()
+        state.pop("_frozen", None)
+        state.update(_parent=None, _nodes=[], _ctx=None, _created_in_with_context=False, _attrs=self._attrs.copy())
+        node.__dict__ = state
+        return node
 
-        if not (html_path := Path(filename)).is_absolute():
-            html_path = Path(__name__).parent.resolve() / "index.html"
+    def __copy__(self) -> "HTML":
+        return self.clone(deep=False)
+
+    def __deepcopy__(self, memo: dict) -> "HTML":
+        return self.clone()
+
+    def share(self) -> "HTML":
+        """
+        Turn the element into an immutable shared node.
+
+        The element and its subtree become read-only, and the element can then be added
+        under any number of parents without copying. It keeps no parent pointer and is
+        rendered at the depth of each place it appears in. It is only placed where it is
+        added explicitly, not in the element of the with block it was created in.
+
+        Returns:
+            HTML: The element itself
+
+        Raises:
+            NodeAlreadyHasParentError: if the element already has a parent
+            SharedNodeError: if the element relies on parent callbacks (e.g. "head", "body")
+
+        """
+        if self.parent:
+            raise NodeAlreadyHasParentError("node already has parent")
+        cls = type(self)
+        if (
+            cls._execute_parent_callback is not HTMLNode._execute_parent_callback
+            or cls._validate_placement is not HTMLNode._validate_placement
+        ):
+            raise SharedNodeError(f'Tag "{self.tag_name}" depends on its parent and cannot be shared')
+
+        frame = self._ctx
+        if frame is not None:
+            # without a parent pointer, the with block would add it once more on exit
+            frame.items.remove(self)
+            self._ctx = None
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not node._frozen:
+                node._frozen = True
+                if not node.is_text:
+                    node._attrs = FrozenAttributes(node._attrs)
+                stack.extend(node._nodes)
 
-        with open(html_path, "w") as html_file:
-            html_file.write(Renderer(self).render())
+        return self
+
+    def stats(self, html_indent: int = 2) -> "TreeStats":
+        """
+        Collect size statistics of the tree rooted at this element.
+
+        Args:
+            html_indent (int): Indent width the rendered size is predicted for
+
+        Returns:
+            TreeStats: Node count, depth, text and attribute bytes, per-tag counts,
+                estimated memory and predicted rendered size
+
+        """
+        from .stats import collect_stats
+
+        return collect_stats(self, html_indent)
+
+    def save(self, filename: Union[str, "Path"], buffer_size: int = 64 * 1024, memory_map: bool = False) -> "Path":
+        """
+        Save the HTML document to a file.
+
+        The document is rendered straight into a buffered (or memory-mapped) temporary
+        file next to the target, which then atomically replaces it.
+
+        Args:
+            filename (Union[str, Path]): File path, relative paths are relative to the working directory
+            buffer_size (int): Size of the write buffer in bytes
+            memory_map (bool): Render into a memory-mapped file, for very large documents
+
+        Returns:
+            Path: Absolute path of the written file
+
+        """
+        from .output import save
 
-        return html_path
+        return save(self, filename, buffer_size, memory_map)
@@ -0,0 +1,263 @@
+"""
+Pruning of unused CSS in inlined stylesheets.
+
+``prune_unused_css`` collects the tag names, classes and ids present in a finished
+tree and removes from the stylesheets inlined by ``style`` tags the rules none of
+whose selectors can match. Selectors are checked conservatively: a selector is
+kept unless it needs a tag name, class or id absent from the tree; pseudo-classes,
+attribute selectors and at-rules other than conditional groups never cause removal.
+Stylesheets are parsed once per file and modification time.
+"""
+
+import re
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+# at-rules whose block contains style rules that can be pruned one by one
+_GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container", "@document")
+
+_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+# parts of a selector that never make it unused: attributes, pseudo-classes with their arguments
+_IGNORED_PARTS = re.compile(r"\[(?:\"[^\"]*\"|'[^']*'|[^\]\"'])*\]|::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?")
+_TOKEN = re.compile(r"([.#]?)(-?[^\W\d][\w-]*)")  # names may hold any letter, e.g. ".élan"
+
+_stylesheet_cache: dict[Path, tuple[int, int, "Stylesheet"]] = {}  # path -> (mtime_ns, size, stylesheet)
+
+
+class _Usage(NamedTuple):
+    tags: frozenset[str]
+    classes: frozenset[str]
+    ids: frozenset[str]
+
+
+class _Rule(NamedTuple):
+    text: str  # whole rule, or prelude of a grouping at-rule
+    selectors: Optional[tuple[_Usage, ...]]  # requirements of each selector, None to keep the rule
+    children: Optional[list["_Rule"]]  # rules of a grouping at-rule
+
+
+class Stylesheet:
+    """
+    Stylesheet - parsed list of CSS rules.
+
+    Attributes:
+        rules (list): Top-level rules in source order
+    """
+
+    def __init__(self, css: str) -> None:
+        self.rules = _parse_rules(_COMMENT.sub(lambda match: match.group(1) or "", css))
+
+    def prune(self, tags: set[str], classes: set[str], ids: set[str]) -> str:
+        """
+        Stylesheet text without the rules that cannot match.
+
+        Args:
+            tags (set[str]): Tag names present in the document
+            classes (set[str]): Classes present in the document
+            ids (set[str]): Ids present in the document
+
+        Returns:
+            str: CSS text of the kept rules, one per line
+        """
+        return "\n".join(_prune_rules(self.rules, tags, classes, ids))
+
+
+def _selector_usage(selector: str) -> Optional[_Usage]:
+    if "\\" in selector or "|" in selector:
+        # escaped or namespaced names are not parsed, the selector is kept
+        return None
+
+    tags, classes, ids = set(), set(), set()
+    for prefix, name in _TOKEN.findall(_IGNORED_PARTS.sub(" ", selector)):
+        if prefix == ".":
+            classes.add(name)
+        elif prefix == "#":
+            ids.add(name)
+        else:
+            tags.add(name.lower())
+
+    return _Usage(frozenset(tags), frozenset(classes), frozenset(ids))
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    # commas inside :is(), :not() and similar, attribute selectors and strings do not separate selectors
+    selectors, depth, start, quote = [], 0, 0, None
+    for index, char in enumerate(prelude):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _find_block_end(css: str, start: int) -> int:
+    # index of the brace closing the block opened at start, strings skipped
+    depth, index, quote = 0, start, None
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+
+    return len(css) - 1
+
+
+def _parse_rules(css: str) -> list[_Rule]:
+    rules = []
+    index = 0
+    while index < len(css):
+        brace = css.find("{", index)
+        semicolon = css.find(";", index)
+        prelude_end = brace if brace != -1 else len(css)
+
+        if css[index:prelude_end].lstrip().startswith("@") and semicolon != -1 and semicolon < prelude_end:
+            # statement at-rule, e.g. @import or @charset
+            rules.append(_Rule(css[index : semicolon + 1].strip(), None, None))
+            index = semicolon + 1
+            continue
+
+        if brace == -1:
+            break
+
+        end = _find_block_end(css, brace)
+        prelude = css[index:brace].strip()
+        if prelude.startswith(_GROUPING_AT_RULES):
+            rules.append(_Rule(prelude, None, _parse_rules(css[brace + 1 : end])))
+        elif prelude.startswith("@"):
+            rules.append(_Rule(css[index : end + 1].strip(), None, None))
+        else:
+            selectors = tuple(_selector_usage(selector) for selector in _split_selectors(prelude))
+            rules.append(_Rule(css[index : end + 1].strip(), None if None in selectors else selectors, None))
+        index = end + 1
+
+    return rules
+
+
+def _prune_rules(rules: list[_Rule], tags: set[str], classes: set[str], ids: set[str]) -> list[str]:
+    kept = []
+    for rule in rules:
+        if rule.children is not None:
+            children = _prune_rules(rule.children, tags, classes, ids)
+            if children:
+                kept.append(rule.text + " {\n" + "\n".join(children) + "\n}")
+            continue
+
+        if rule.selectors is None or any(
+            usage.tags <= tags and usage.classes <= classes and usage.ids <= ids for usage in rule.selectors
+        ):
+            kept.append(rule.text)
+
+    return kept
+
+
+def parse_stylesheet(path: Union[str, Path]) -> Stylesheet:
+    """
+    Parse a stylesheet file, reading it only when its size or mtime changed.
+
+    Args:
+        path (Union[str, Path]): File path
+
+    Returns:
+        Stylesheet: Parsed stylesheet
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+
+    cached = _stylesheet_cache.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    stylesheet = Stylesheet(path.read_text(encoding="utf-8"))
+    _stylesheet_cache[path] = (stat.st_mtime_ns, stat.st_size, stylesheet)
+    return stylesheet
+
+
+def prune_unused_css(tag: "HTML") -> int:
+    """
+    Remove the rules that match no element of the tree from its inlined stylesheets.
+
+    The tree must be finished: elements added afterwards are not taken into account.
+    Stylesheets inside component fragments are shared and left unchanged, but the
+    elements of fragments count as present. The elements of placeholders count with
+    their fallback, and with their section only if it is already built: resolve them
+    first to keep the rules of their sections.
+
+    Args:
+        tag (HTML): Root of the tree, usually the "html" element
+
+    Returns:
+        int: Number of characters removed from the inlined stylesheets
+    """
+    from .minify import minify_css
+    from .tags.metadata_ import style
+
+    tags: set[str] = set()
+    classes: set[str] = set()
+    ids: set[str] = set()
+    styles = []
+
+    stack = [(tag, False)]
+    while stack:
+        node, shared = stack.pop()
+        if node.is_text:
+            continue
+
+        tags.add(node.tag_name.lower())
+        if "class" in node._attrs:
+            classes.update(str(node._attrs["class"]).split())
+        if "id" in node._attrs:
+            ids.add(str(node._attrs["id"]))
+
+        if node.is_placeholder:
+            # streamed with its fallback, and its section once built; not waited for
+            if node.resolved:
+                stack.append((node.source, True))
+        elif node.is_fragment:
+            stack.append((node.source, True))
+            continue
+        if isinstance(node, style) and node._source_path and node._nodes and not (shared or node._frozen):
+            styles.append(node)
+
+        stack.extend((child, shared) for child in node._nodes)
+
+    removed = 0
+    for element in styles:
+        content = element._nodes[0].content
+        pruned = parse_stylesheet(element._source_path).prune(tags, classes, ids)
+        if not element._nodes[0].reindent:
+            # the stylesheet was inlined minified
+            pruned = minify_css(pruned)
+        if len(pruned) < len(content):
+            element._nodes[0].content = pruned
+            removed += len(content) - len(pruned)
+
+    return removed
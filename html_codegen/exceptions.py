@@ -18,6 +18,10 @@ class SingleTagNestingError(NodeValidationError):
     pass
 
 
+class SharedNodeError(NodeValidationError):
+    pass
+
+
 class TagPlacementError(HTMLCodeGenError):
     pass
 
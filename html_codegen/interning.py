@@ -0,0 +1,155 @@
+"""
+Interning of repeated text and attribute values.
+
+Generated pages repeat the same strings many times: labels, classes, table headers.
+Inside an ``intern_strings`` block every text node and attribute set created gets its
+values from an ``InternPool``, so equal strings are stored once and compare by
+identity. Attribute sets with the same values also share their rendered fragment,
+so the renderer encodes each of them once. A pool can serve one document (the
+default) or be kept and reused by every build of the process.
+"""
+
+from contextlib import contextmanager
+from typing import (
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+
+from .core import (
+    Attributes,
+    _intern_pool,
+    _render_attributes,
+)
+
+
+class PoolInfo(NamedTuple):
+    """
+    PoolInfo - statistics of an intern pool.
+
+    Attributes:
+        hits (int): Values replaced by an equal pooled string
+        misses (int): Values seen for the first time, or not pooled
+        maxsize (Optional[int]): Maximum number of pooled strings, None if unbounded
+        currsize (int): Number of pooled strings
+    """
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class InternPool:
+    """
+    InternPool - bounded pool of canonical strings.
+
+    Once the pool is full, new values are kept as they are: the strings already
+    pooled stay canonical, so identity comparisons remain valid. Strings longer than
+    ``max_length`` are never pooled, long texts seldom repeat. A pool may be shared
+    by several threads; its statistics are then approximate.
+
+    Attributes:
+        maxsize (Optional[int]): Maximum number of pooled strings, None if unbounded
+        max_length (int): Length of the longest string pooled
+    """
+
+    def __init__(self, maxsize: Optional[int] = 65536, max_length: int = 256) -> None:
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self._values: dict[str, str] = {}
+        self._attributes: dict[tuple, Attributes] = {}  # attribute items -> attributes with rendered fragment
+        self._hits = self._misses = 0
+
+    def intern(self, value: str) -> str:
+        """
+        Canonical string equal to the value.
+
+        Args:
+            value (str): Text or attribute value
+
+        Returns:
+            str: Pooled string, or the value itself if it is not pooled
+        """
+        if type(value) is not str:
+            return value
+
+        canonical = self._values.get(value)
+        if canonical is not None:
+            self._hits += 1
+            return canonical
+
+        self._misses += 1
+        if len(value) > self.max_length or self._is_full(self._values):
+            return value
+        return self._values.setdefault(value, value)
+
+    def attributes(self, attrs: dict) -> Attributes:
+        """
+        Attributes with pooled values, sharing the rendered fragment of equal attribute sets.
+
+        Args:
+            attrs (dict): Attributes of a new element
+
+        Returns:
+            Attributes: Attributes of the element
+        """
+        items = tuple(attrs.items())
+        if not all(type(value) is str for _, value in items):
+            # 1 == True: only string values identify the rendered fragment
+            return Attributes({name: self.intern(value) for name, value in items})
+
+        template = self._attributes.get(items)
+        if template is not None:
+            self._hits += len(items)
+            return template.copy()
+
+        result = Attributes({name: self.intern(value) for name, value in items})
+        items = tuple(result.items())
+        result._fragment = _render_attributes(items)
+        result._fragment_bytes = result._fragment.encode()
+        if not self._is_full(self._attributes):
+            self._attributes[items] = result.copy()
+        return result
+
+    def _is_full(self, pool: dict) -> bool:
+        return self.maxsize is not None and len(pool) >= self.maxsize
+
+    def info(self) -> PoolInfo:
+        """
+        Statistics of the pool.
+
+        Returns:
+            PoolInfo: Hits, misses, maximum and current size
+        """
+        return PoolInfo(self._hits, self._misses, self.maxsize, len(self._values))
+
+    def clear(self) -> None:
+        """
+        Drop the pooled strings and attribute sets and reset the statistics.
+        """
+        self._values.clear()
+        self._attributes.clear()
+        self._hits = self._misses = 0
+
+
+@contextmanager
+def intern_strings(pool: Optional[InternPool] = None) -> Iterator[InternPool]:
+    """
+    Intern the text and attribute values of the nodes created inside the block.
+
+    Args:
+        pool (InternPool, optional): Pool to use, e.g. one kept for the whole process;
+            a new pool for this block by default
+
+    Yields:
+        InternPool: Pool in use
+    """
+    if pool is None:
+        pool = InternPool()
+
+    token = _intern_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _intern_pool.reset(token)
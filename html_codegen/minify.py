@@ -0,0 +1,245 @@
+"""
+Minification of inlined stylesheets and scripts.
+
+The minifiers only remove what cannot change the meaning of the code: comments and
+insignificant whitespace. String, template and regular expression literals are
+copied unchanged, and line breaks of scripts are kept, so automatic semicolon
+insertion works as before. Results are cached by content.
+"""
+
+import re
+from functools import lru_cache
+
+# characters and keywords after which "/" starts a regular expression rather than a division
+_REGEX_AFTER_CHARS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_AFTER_WORDS = {
+    "return",
+    "typeof",
+    "case",
+    "do",
+    "else",
+    "in",
+    "of",
+    "void",
+    "yield",
+    "await",
+    "delete",
+    "instanceof",
+    "new",
+    "throw",
+}
+# keywords whose parenthesized condition may be followed by a regular expression, e.g. "if (a) /x/.test(b)"
+_CONDITION_WORDS = {"if", "while", "for", "with"}
+_LAST_WORD = re.compile(r"([A-Za-z_$][\w$]*)\s*$")
+
+_JS_LINE_BREAK = re.compile(r"\s*\n\s*")
+_JS_SPACES = re.compile(r"[ \t\f\v]+")
+_CSS_SPACES = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r" ?([{};,>]) ?")
+
+
+def _skip_quoted(source: str, start: int) -> int:
+    # end of the string literal starting at start
+    quote, index = source[start], start + 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote:
+            return index + 1
+        if char == "\n" and quote != "`":
+            break
+        if char == "$" and quote == "`" and source.startswith("${", index):
+            index = _skip_template_expression(source, index + 2)
+            continue
+        index += 1
+
+    return index
+
+
+def _skip_template_expression(source: str, index: int) -> int:
+    # end of a "${...}" placeholder, nested literals included
+    depth = 1
+    while index < len(source):
+        char = source[index]
+        if char in "\"'`":
+            index = _skip_quoted(source, index)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+
+    return index
+
+
+def _skip_regex(source: str, start: int) -> int:
+    # end of the regular expression literal starting at start, start + 1 if there is none
+    index, in_class = start + 1, False
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "\n":
+            return start + 1
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            index += 1
+            while index < len(source) and source[index].isalpha():
+                index += 1
+            return index
+        index += 1
+
+    return start + 1
+
+
+def _split_js(source: str) -> list[tuple[bool, str]]:
+    # (is code, text) segments with comments removed
+    segments: list[tuple[bool, str]] = []
+    code_start = index = 0
+    last = ""  # last non-space character of the code
+    last_index = -1  # index of the last code character, to tell "++" and "--" from "+" and "-"
+    conditions: list[bool] = []  # whether each open parenthesis starts the condition of a statement
+    after_condition = False  # whether the last character closes such a condition
+
+    def add_code(end: int) -> None:
+        if end > code_start:
+            segments.append((True, source[code_start:end]))
+
+    while index < len(source):
+        char = source[index]
+        if char in "\"'`":
+            add_code(index)
+            end = _skip_quoted(source, index)
+            segments.append((False, source[index:end]))
+            code_start = index = end
+            last = char
+            continue
+
+        if char == "/" and source.startswith("//", index):
+            add_code(index)
+            end = source.find("\n", index)
+            code_start = index = len(source) if end == -1 else end
+            continue
+
+        if char == "/" and source.startswith("/*", index):
+            add_code(index)
+            end = source.find("*/", index + 2)
+            segments.append((True, " "))
+            code_start = index = len(source) if end == -1 else end + 2
+            continue
+
+        if char == "/":
+            word = _LAST_WORD.search(source, code_start, index) if last.isalnum() or last in "_$" else None
+            if (
+                not last
+                or (last in _REGEX_AFTER_CHARS and not (last in "+-" and source[last_index - 1] == last))
+                or (last == ")" and after_condition)
+                or (word and word.group(1) in _REGEX_AFTER_WORDS)
+            ):
+                end = _skip_regex(source, index)
+                if end > index + 1:
+                    add_code(index)
+                    segments.append((False, source[index:end]))
+                    code_start = index = end
+                    last = "/"
+                    continue
+
+        if char == "(":
+            conditions.append(last.isalpha() and _word_before(source, code_start, index) in _CONDITION_WORDS)
+        elif char == ")":
+            after_condition = conditions.pop() if conditions else False
+        if not char.isspace():
+            last, last_index = char, index
+        index += 1
+
+    add_code(index)
+    return segments
+
+
+def _word_before(source: str, start: int, end: int) -> str:
+    # identifier ending at end, trailing whitespace skipped, not looking before start
+    while end > start and source[end - 1].isspace():
+        end -= 1
+    begin = end
+    while begin > start and (source[begin - 1].isalnum() or source[begin - 1] in "_$"):
+        begin -= 1
+    return source[begin:end]
+
+
+@lru_cache(maxsize=256)
+def minify_js(source: str) -> str:
+    """
+    Remove comments, indentation and blank lines from JavaScript.
+
+    Args:
+        source (str): JavaScript source
+
+    Returns:
+        str: Minified source
+    """
+    return "".join(
+        _JS_SPACES.sub(" ", _JS_LINE_BREAK.sub("\n", text)) if is_code else text
+        for is_code, text in _merge_code(_split_js(source))
+    ).strip()
+
+
+@lru_cache(maxsize=256)
+def minify_css(source: str) -> str:
+    """
+    Remove comments and insignificant whitespace from CSS.
+
+    Args:
+        source (str): CSS source
+
+    Returns:
+        str: Minified source, on one line
+    """
+    parts = []
+    index = code_start = 0
+    while index < len(source):
+        char = source[index]
+        if char in "\"'":
+            end = _skip_quoted(source, index)
+        elif source.startswith("/*", index):
+            end = source.find("*/", index + 2)
+            end = len(source) if end == -1 else end + 2
+        else:
+            index += 1
+            continue
+
+        parts.append((True, source[code_start:index]))
+        if char in "\"'":
+            parts.append((False, source[index:end]))
+        else:
+            parts.append((True, " "))
+        code_start = index = end
+
+    parts.append((True, source[code_start:]))
+
+    return "".join(_minify_css_code(text) if is_code else text for is_code, text in _merge_code(parts)).strip()
+
+
+def _minify_css_code(code: str) -> str:
+    code = _CSS_PUNCTUATION.sub(r"\1", _CSS_SPACES.sub(" ", code))
+    return code.replace(": ", ":").replace(";}", "}")
+
+
+def _merge_code(parts: list[tuple[bool, str]]) -> list[tuple[bool, str]]:
+    # adjacent code parts are minified together, so whitespace around removed comments collapses
+    merged: list[tuple[bool, str]] = []
+    for is_code, text in parts:
+        if merged and is_code and merged[-1][0]:
+            merged[-1] = (True, merged[-1][1] + text)
+        else:
+            merged.append((is_code, text))
+
+    return merged
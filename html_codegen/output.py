@@ -0,0 +1,273 @@
+"""
+Writing rendered documents to files and memory.
+
+This module streams the output of ``Renderer`` into files through a buffered binary
+writer. Files are replaced atomically: the document is written to a temporary file in
+the target directory and renamed over the target, so readers never see a partial page.
+``save_many`` renders pages on the calling thread while a background thread writes
+the previous ones.
+
+For very large documents, ``BufferSink`` and ``MmapSink`` collect the encoded output in
+a preallocated buffer growing geometrically, and expose it as a ``memoryview`` that can
+be handed to sockets or files without another copy.
+"""
+
+import mmap
+import os
+import queue
+import secrets
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Union,
+)
+
+from .renderer import Renderer
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_SINK_SIZE = 1024 * 1024
+
+# read access too, for MmapSink
+_TEMP_FLAGS = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+class BufferSink:
+    """
+    BufferSink - preallocated in-memory output buffer.
+
+    The buffer doubles when full and keeps its capacity when cleared, so a sink reused
+    for many documents stops allocating once it fits the largest one. While a view
+    returned by ``getbuffer`` is alive, the sink cannot grow.
+
+    Attributes:
+        length (int): Number of bytes written
+    """
+
+    def __init__(self, initial_size: int = DEFAULT_SINK_SIZE) -> None:
+        self._buffer = bytearray(max(initial_size, 1))
+        self.length = 0
+
+    def write(self, data: bytes) -> int:
+        end = self.length + len(data)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end, 2 * len(self._buffer)) - len(self._buffer)))
+
+        self._buffer[self.length : end] = data
+        self.length = end
+        return len(data)
+
+    def getbuffer(self) -> memoryview:
+        """
+        View of the written bytes, sharing memory with the sink.
+
+        Returns:
+            memoryview: Written bytes
+        """
+        return memoryview(self._buffer)[: self.length]
+
+    def clear(self) -> None:
+        """
+        Forget the written bytes, keeping the allocated capacity.
+        """
+        self.length = 0
+
+
+class MmapSink:
+    """
+    MmapSink - output buffer mapped onto a file.
+
+    The file is extended geometrically while rendering and truncated to the written
+    length on ``close``, so the document never exists as a Python object. Views
+    returned by ``getbuffer`` must be released before the sink grows or is closed.
+
+    Attributes:
+        length (int): Number of bytes written
+    """
+
+    def __init__(self, file: BinaryIO, initial_size: int = DEFAULT_SINK_SIZE) -> None:
+        """
+        Map a file opened for reading and writing.
+
+        Args:
+            file (BinaryIO): File to write into, its previous content is discarded
+            initial_size (int): Initial size of the mapping in bytes
+        """
+        self._fileno = file.fileno()
+        os.ftruncate(self._fileno, max(initial_size, 1))
+        self._map = mmap.mmap(self._fileno, max(initial_size, 1))
+        self.length = 0
+
+    def write(self, data: bytes) -> int:
+        end = self.length + len(data)
+        if end > len(self._map):
+            self._map.resize(max(end, 2 * len(self._map)))
+
+        self._map[self.length : end] = data
+        self.length = end
+        return len(data)
+
+    def getbuffer(self) -> memoryview:
+        """
+        View of the written bytes, sharing memory with the mapped file.
+
+        Returns:
+            memoryview: Written bytes
+        """
+        return memoryview(self._map)[: self.length]
+
+    def close(self) -> None:
+        """
+        Unmap the file and truncate it to the written length.
+        """
+        if self._map.closed:
+            return
+
+        self._map.close()
+        os.ftruncate(self._fileno, self.length)
+
+    def __enter__(self) -> "MmapSink":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+@contextmanager
+def atomic_write(path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file that replaces the given path once the block succeeds.
+
+    Missing parent directories are created. If the block raises, the temporary file
+    is removed and the target is left untouched.
+
+    Args:
+        path (Union[str, Path]): Target file path
+        buffer_size (int): Size of the write buffer in bytes
+
+    Yields:
+        BinaryIO: Binary file to write into
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        # the temporary file gets the permissions of a newly created file, filtered by the umask
+        temp_path = path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp"
+        try:
+            fd = os.open(temp_path, _TEMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with open(fd, "wb", buffering=buffer_size) as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save(
+    tag: "HTML",
+    filename: Union[str, Path],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    memory_map: bool = False,
+) -> Path:
+    """
+    Render a document straight into a file, replacing it atomically.
+
+    Args:
+        tag (HTML): Document to save
+        filename (Union[str, Path]): File path, relative paths are relative to the working directory
+        buffer_size (int): Size of the write buffer in bytes, or initial mapping size with ``memory_map``
+        memory_map (bool): Render into a memory-mapped file (see ``MmapSink``) instead of a buffered stream
+
+    Returns:
+        Path: Absolute path of the written file
+    """
+    path = Path(filename).absolute()
+    with atomic_write(path, buffer_size) as file:
+        if memory_map:
+            with MmapSink(file, buffer_size) as sink:
+                Renderer(tag).render_into(sink)
+        else:
+            Renderer(tag).render_into(file)
+
+    return path
+
+
+def save_many(
+    pages: Iterable[tuple["HTML", Union[str, Path]]],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    max_pending: int = 2,
+) -> list[Path]:
+    """
+    Save many documents, writing files on a background thread while rendering.
+
+    Pages are rendered one by one on the calling thread into a small pool of reused
+    ``BufferSink`` buffers; a writer thread saves each rendered page atomically. At most
+    ``max_pending`` rendered pages wait in memory at any time.
+
+    Args:
+        pages (Iterable[tuple[HTML, Union[str, Path]]]): Pairs of document and file path
+        buffer_size (int): Size of the file write buffer in bytes
+        max_pending (int): Number of rendered pages that can wait for the writer
+
+    Returns:
+        list[Path]: Absolute paths of the written files, in the order of ``pages``
+
+    Raises:
+        Exception: the first error raised while writing, once the writer thread stopped
+    """
+    free_buffers: queue.Queue = queue.Queue()
+    for _ in range(max_pending):
+        free_buffers.put(BufferSink(buffer_size))
+
+    jobs: queue.Queue = queue.Queue()
+    errors: list[BaseException] = []
+
+    def _writer() -> None:
+        while (job := jobs.get()) is not None:
+            path, buffer = job
+            try:
+                if not errors:
+                    with atomic_write(path, buffer_size) as file, buffer.getbuffer() as view:
+                        file.write(view)
+            except BaseException as error:
+                errors.append(error)
+            finally:
+                buffer.clear()
+                free_buffers.put(buffer)
+
+    writer = threading.Thread(target=_writer, name="html-codegen-writer", daemon=True)
+    writer.start()
+
+    paths = []
+    try:
+        for tag, filename in pages:
+            buffer = free_buffers.get()
+            if errors:
+                break
+
+            Renderer(tag).render_into(buffer)
+            paths.append(Path(filename).absolute())
+            jobs.put((paths[-1], buffer))
+    finally:
+        jobs.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+    return paths
@@ -0,0 +1,203 @@
+"""
+Multi-core rendering of large documents.
+
+``ParallelRenderer`` finds the element holding the bulk of the document, e.g. the
+"tbody" of a huge table, by descending from the root while one child holds most of
+the nodes. It splits the children of that element into contiguous chunks of about
+the same node count, renders the chunks in a process pool at the depth of the
+element, and joins them in order between the output of the rest of the document.
+The result is byte for byte the sequential output.
+
+Where processes are started by forking, workers read the document from the memory
+inherited from the parent process and only send their output back. Otherwise, or
+with an executor given by the caller, each chunk is copied and pickled, so the
+document must be picklable.
+"""
+
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+)
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from .core import HTML
+from .renderer import (
+    Renderer,
+    _BytesWriter,
+)
+
+if TYPE_CHECKING:
+    from .transforms import Transforms
+
+# documents of the renders in progress, read by forked workers: job id -> (renderer, container, layer)
+_forked_jobs: dict[int, tuple[Renderer, HTML, int]] = {}
+_job_ids = itertools.count()
+
+
+def _count_nodes(tag: HTML) -> int:
+    return sum(1 for _ in tag.walk())
+
+
+def _render_nodes(renderer: Renderer, container: HTML, start: int, stop: int, layer: int) -> bytes:
+    # children of the container in [start, stop), as written by _write_children
+    chunk = container._clone_node()
+    chunk._nodes = container._nodes[start:stop]
+    buffer = bytearray()
+    renderer._write_children(chunk, layer, _BytesWriter(renderer, buffer))
+    return bytes(buffer)
+
+
+def _render_forked_chunk(job_id: int, start: int, stop: int) -> bytes:
+    renderer, container, layer = _forked_jobs[job_id]
+    return _render_nodes(renderer, container, start, stop, layer)
+
+
+def _render_pickled_chunk(html_indent: int, transforms: Optional["Transforms"], chunk: HTML, layer: int) -> bytes:
+    return _render_nodes(Renderer(chunk, html_indent, transforms), chunk, 0, len(chunk._nodes), layer)
+
+
+class ParallelRenderer(Renderer):
+    """
+    ParallelRenderer - renderer spreading a large document over several processes.
+
+    Documents with fewer than ``min_nodes`` nodes, or without an element whose
+    children can be split, are rendered sequentially.
+    """
+
+    def __init__(
+        self,
+        tag: HTML,
+        html_indent: int = 2,
+        transforms: Optional["Transforms"] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        min_nodes: int = 50_000,
+    ) -> None:
+        """
+        Args:
+            tag (HTML): Element to render
+            html_indent (int): Indent width
+            transforms (Optional[Transforms]): Attribute hooks applied to elements while they are written,
+                picklable unless workers are forked
+            workers (Optional[int]): Number of processes, the number of CPUs by default; the document is split
+                in four chunks per worker
+            executor (Optional[Executor]): Executor rendering the chunks, which are then pickled;
+                a process pool for each render by default
+            min_nodes (int): Node count below which the document is rendered sequentially
+        """
+        super().__init__(tag, html_indent, transforms)
+        self.executor = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.min_nodes = min_nodes
+
+    def render(self) -> str:
+        return self.render_bytes().decode()
+
+    def render_into(self, buffer: Union[bytearray, BinaryIO]) -> None:
+        """
+        Render the document as UTF-8 into a ``bytearray`` or a binary stream.
+
+        Args:
+            buffer (Union[bytearray, BinaryIO]): Destination, e.g. ``io.BytesIO`` or a file opened in "wb" mode
+        """
+        write = buffer.extend if isinstance(buffer, bytearray) else buffer.write
+        for chunk in self.stream():
+            write(chunk)
+
+    def stream(self) -> Iterator[bytes]:
+        """
+        Render the document as UTF-8 chunks in document order, each sent as soon as it
+        and the chunks before it are rendered.
+
+        Yields:
+            bytes: Next part of the document
+        """
+        split = self._split()
+        if split is None:
+            buffer = bytearray()
+            super().render_into(buffer)
+            yield bytes(buffer)
+            return
+
+        path, container, bounds = split
+        head, tail = self._render_frame(path)
+        yield head
+        for future in self._submit(container, bounds, self.tag.layer + len(path)):
+            yield future.result()
+        yield tail
+
+    def _submit(self, container: HTML, bounds: list[tuple[int, int]], layer: int) -> Iterator[Future]:
+        if self.executor is not None:
+            yield from self._submit_pickled(self.executor, container, bounds, layer)
+            return
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(self.workers) as executor:
+                yield from self._submit_pickled(executor, container, bounds, layer)
+            return
+
+        job_id = next(_job_ids)
+        _forked_jobs[job_id] = (self, container, layer)
+        try:
+            # workers are forked after the job is registered, and see the document as it is now
+            with ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = [executor.submit(_render_forked_chunk, job_id, start, stop) for start, stop in bounds]
+                yield from futures
+        finally:
+            del _forked_jobs[job_id]
+
+    def _submit_pickled(
+        self, executor: Executor, container: HTML, bounds: list[tuple[int, int]], layer: int
+    ) -> Iterator[Future]:
+        futures = []
+        for start, stop in bounds:
+            # detached copy, so the rest of the document is not pickled along through parent pointers
+            chunk = container._clone_node()
+            chunk._nodes = container._nodes[start:stop]
+            futures.append(
+                executor.submit(_render_pickled_chunk, self.html_indent, self.transforms, chunk.clone(), layer)
+            )
+        yield from futures
+
+    def _split(self) -> Optional[tuple[list[int], HTML, list[tuple[int, int]]]]:
+        # path to the element holding most of the nodes, the element, and bounds of its chunks of children
+        if self.tag.is_text or self.workers < 2:
+            return None
+
+        path, container = [], self.tag
+        sizes = [_count_nodes(child) for child in container._nodes]
+        if not sizes or sum(sizes) + 1 < self.min_nodes:
+            return None
+
+        while True:
+            total = sum(sizes)
+            largest = max(sizes)
+            index = sizes.index(largest)
+            child = container._nodes[index]
+            if largest * 2 <= total or child.is_text or child.is_fragment or not child._nodes:
+                break
+            path.append(index)
+            container = child
+            sizes = [_count_nodes(child) for child in container._nodes]
+
+        bounds, start, size = [], 0, 0
+        target = total / (self.workers * 4)
+        for index, count in enumerate(sizes):
+            size += count
+            if size >= target:
+                bounds.append((start, index + 1))
+                start, size = index + 1, 0
+        if start < len(sizes):
+            bounds.append((start, len(sizes)))
+
+        return (path, container, bounds) if len(bounds) > 1 else None
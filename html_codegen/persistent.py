@@ -0,0 +1,228 @@
+"""
+Persistent document trees.
+
+``PersistentTree`` keeps successive versions of a document, e.g. for undo/redo or
+previews. Every version is a read-only tree (see ``HTML.share``): an edit copies
+only the elements on the path from the root to the changed node, and the versions
+share all other subtrees. Taking a snapshot costs nothing, an edit costs one copy
+per level of the path, and every version can be rendered by ``Renderer``.
+"""
+
+from typing import (
+    Callable,
+    Optional,
+    Sequence,
+)
+
+from .core import (
+    HTML,
+    FrozenAttributes,
+)
+from .exceptions import NodeAlreadyHasParentError
+
+Path = Sequence[int]  # child indexes leading from the root to a node
+
+
+def _freeze(tree: HTML) -> None:
+    # nodes of several versions have several parents, so they keep none
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if not node._frozen:
+            node._frozen = True
+            node._parent = None
+            if not node.is_text:
+                node._attrs = FrozenAttributes(node._attrs)
+                stack.extend(node._nodes)
+
+
+def _leave_with_block(node: HTML) -> None:
+    # without a parent pointer, the with block the node was created in would add it on exit
+    frame = node._ctx
+    if frame is not None:
+        frame.items.remove(node)
+        node._ctx = None
+
+
+class PersistentTree:
+    """
+    PersistentTree - document with cheap versioning by path copying.
+
+    Nodes are addressed by their path: the indexes of the children leading to them
+    from the root, the root itself having the empty path. Each edit makes a new
+    version current and returns it; earlier versions are left unchanged.
+
+    Attributes:
+        root (HTML): Current version
+    """
+
+    def __init__(self, root: HTML) -> None:
+        """
+        Args:
+            root (HTML): Document, copied to become the first version, and left unchanged
+
+        Raises:
+            NodeAlreadyHasParentError: if the element has a parent
+        """
+        if root.parent:
+            raise NodeAlreadyHasParentError("node already has parent")
+
+        self.root = root.clone()
+        _freeze(self.root)
+
+    def snapshot(self) -> HTML:
+        """
+        Current version, which later edits leave unchanged.
+
+        Returns:
+            HTML: Read-only root of the version
+        """
+        return self.root
+
+    def restore(self, version: HTML) -> None:
+        """
+        Make a version returned earlier current again, e.g. to undo edits.
+
+        Args:
+            version (HTML): Version returned by ``snapshot`` or an edit
+        """
+        self.root = version
+
+    def node(self, path: Path) -> HTML:
+        """
+        Node of the current version.
+
+        Args:
+            path (Path): Path of the node
+
+        Returns:
+            HTML: Read-only node
+        """
+        node = self.root
+        for index in path:
+            node = node._nodes[index]
+        return node
+
+    def add_node(self, path: Path, new_node: HTML, index: Optional[int] = None) -> HTML:
+        """
+        Add a child to an element, with the same validation as ``HTML.add_node``.
+
+        Args:
+            path (Path): Path of the element
+            new_node (HTML): New child, frozen in place
+            index (int, optional): Position of the child, after the last one by default
+
+        Returns:
+            HTML: New version
+        """
+
+        def change(element: HTML) -> None:
+            _leave_with_block(new_node)
+            element.add_node(new_node)
+            if index is not None:
+                element._nodes.insert(index, element._nodes.pop())
+
+        return self._edit(path, change)
+
+    def replace_node(self, path: Path, new_node: HTML) -> HTML:
+        """
+        Replace a node other than the root.
+
+        Args:
+            path (Path): Path of the node
+            new_node (HTML): Replacement, frozen in place
+
+        Returns:
+            HTML: New version
+        """
+        *parent_path, index = path
+
+        def change(element: HTML) -> None:
+            # removed first, so the replacement is validated without the replaced node
+            position = range(len(element._nodes))[index]
+            del element._nodes[position]
+            _leave_with_block(new_node)
+            element.add_node(new_node)
+            element._nodes.insert(position, element._nodes.pop())
+
+        return self._edit(parent_path, change)
+
+    def remove_node(self, path: Path) -> HTML:
+        """
+        Remove a node other than the root.
+
+        Args:
+            path (Path): Path of the node
+
+        Returns:
+            HTML: New version
+        """
+        *parent_path, index = path
+        return self._edit(parent_path, lambda element: element._nodes.pop(index))
+
+    def update_attributes(self, path: Path, attrs: dict) -> HTML:
+        """
+        Set attributes of an element.
+
+        Args:
+            path (Path): Path of the element
+            attrs (dict): Attributes to set
+
+        Returns:
+            HTML: New version
+        """
+        return self._edit(path, lambda element: element._attrs.update(attrs))
+
+    def remove_attribute(self, path: Path, name: str) -> HTML:
+        """
+        Remove an attribute of an element, if it is set.
+
+        Args:
+            path (Path): Path of the element
+            name (str): Attribute name
+
+        Returns:
+            HTML: New version
+        """
+        return self._edit(path, lambda element: element._attrs.pop(name, None))
+
+    def set_text(self, path: Path, content: str) -> HTML:
+        """
+        Change the content of a text node.
+
+        Args:
+            path (Path): Path of the text node
+            content (str): New text
+
+        Returns:
+            HTML: New version
+        """
+
+        def change(node: HTML) -> None:
+            if not node.is_text:
+                raise TypeError(f"node at {tuple(path)} is not text")
+            node.content = content
+
+        return self._edit(path, change)
+
+    def _edit(self, path: Path, change: Callable[[HTML], object]) -> HTML:
+        # copy the nodes on the path, each copy referencing the unchanged children; until the
+        # version is frozen, the copies point to their parents, so validation sees the ancestors
+        root = copy = self._copy(self.root)
+        for index in path:
+            child = self._copy(copy._nodes[index])
+            child._parent = copy
+            copy._nodes[index] = child
+            copy = child
+
+        change(copy)
+        _freeze(root)
+        self.root = root
+        return root
+
+    @staticmethod
+    def _copy(node: HTML) -> HTML:
+        copy = node._clone_node()
+        if not node.is_text:
+            copy._nodes = list(node._nodes)
+        return copy
@@ -1,39 +1,237 @@
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Sequence, Union
 
-from .core import HTML
+from .core import HTML, Attributes
+
+if TYPE_CHECKING:
+    from .transforms import Transforms
+
+_DOCTYPE = '<!DOCTYPE html>\n'
+_FLUSH_SIZE = 64 * 1024
+
+
+class _TextWriter:
+    """
+    Writer collecting the rendered document as ``str`` chunks.
+    """
+
+    def __init__(self, renderer: "Renderer") -> None:
+        self.chunks: list[str] = []
+        self._renderer = renderer
+        self._indent_str = ' ' * renderer.html_indent
+        self._indents: dict[int, str] = {}
+
+    def getvalue(self) -> str:
+        return ''.join(self.chunks)
+
+    def flush(self) -> None:
+        pass
+
+    def doctype(self) -> None:
+        self.chunks.append(_DOCTYPE)
+
+    def newline(self) -> None:
+        self.chunks.append('\n')
+
+    def indent(self, layer: int) -> None:
+        if layer:
+            self.chunks.append(self._indent(layer))
+
+    def open_tag(self, tag: HTML, attrs: Optional[Attributes] = None) -> None:
+        if attrs is None:
+            self.chunks.append(self._renderer.get_open_tag(tag))
+        else:
+            self.chunks.append(f'<{tag.tag_name}{attrs.fragment}>\n')
+
+    def close_tag(self, tag: HTML) -> None:
+        self.chunks.append(f'</{tag.tag_name}>\n')
+
+    def fragment(self, tag: HTML, layer: int) -> None:
+        self.chunks.append(tag.rendered(self._renderer.html_indent, layer))
+
+    def text(self, content: str, layer: int) -> None:
+        indent = self._indent(layer)
+        if indent:
+            content = indent + content.replace('\n', '\n' + indent)
+        self.chunks.append(content)
+
+    def _indent(self, layer: int) -> str:
+        indent = self._indents.get(layer)
+        if indent is None:
+            indent = self._indents[layer] = self._indent_str * layer
+        return indent
+
+
+class _BytesWriter:
+    """
+    Writer encoding the rendered document straight into a binary buffer.
+
+    Tag name tokens are encoded once per process and reused for every element
+    with the same name, attributes are encoded once per attribute set (see
+    ``Attributes.fragment_bytes``) and component fragments once per depth,
+    so only text is encoded while rendering.
+    Streams and sinks receive the output in blocks of about 64 KiB rather than
+    one call per token.
+    """
+
+    _open_tokens: dict[str, bytes] = {}  # 'div' -> b'<div'
+    _bare_open_tokens: dict[str, bytes] = {}  # 'div' -> b'<div>\n'
+    _close_tokens: dict[str, bytes] = {}  # 'div' -> b'</div>\n'
+
+    def __init__(self, renderer: "Renderer", buffer: Union[bytearray, BinaryIO]) -> None:
+        if isinstance(buffer, bytearray):
+            self.write = buffer.extend
+            self._pending = None
+        else:
+            self._pending = bytearray()
+            self.write = self._pending.extend
+            self._buffer_write = buffer.write
+        self._html_indent = renderer.html_indent
+        self._indent_bytes = b' ' * renderer.html_indent
+        self._indents: dict[int, bytes] = {}
+
+    def doctype(self) -> None:
+        self.write(b'<!DOCTYPE html>\n')
+
+    def newline(self) -> None:
+        self.write(b'\n')
+
+    def indent(self, layer: int) -> None:
+        if layer:
+            self.write(self._indent(layer))
+
+    def open_tag(self, tag: HTML, attrs: Optional[Attributes] = None) -> None:
+        name, write = tag.tag_name, self.write
+        if attrs is None:
+            attrs = tag._attrs
+
+        if not attrs:
+            token = self._bare_open_tokens.get(name)
+            if token is None:
+                token = self._bare_open_tokens[name] = f'<{name}>\n'.encode()
+            write(token)
+            return
+
+        token = self._open_tokens.get(name)
+        if token is None:
+            token = self._open_tokens[name] = f'<{name}'.encode()
+        write(token)
+        write(attrs.fragment_bytes)
+        write(b'>\n')
+
+    def close_tag(self, tag: HTML) -> None:
+        name = tag.tag_name
+        token = self._close_tokens.get(name)
+        if token is None:
+            token = self._close_tokens[name] = f'</{name}>\n'.encode()
+        self.write(token)
+        if self._pending is not None and len(self._pending) >= _FLUSH_SIZE:
+            self.flush()
+
+    def fragment(self, tag: HTML, layer: int) -> None:
+        self.write(tag.rendered_bytes(self._html_indent, layer))
+        if self._pending is not None and len(self._pending) >= _FLUSH_SIZE:
+            self.flush()
+
+    def text(self, content: str, layer: int) -> None:
+        indent = self._indent(layer)
+        if indent:
+            self.write(indent + content.encode().replace(b'\n', b'\n' + indent))
+        else:
+            self.write(content.encode())
+        if self._pending is not None and len(self._pending) >= _FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._buffer_write(self._pending)
+            self._pending.clear()
+
+    def _indent(self, layer: int) -> bytes:
+        indent = self._indents.get(layer)
+        if indent is None:
+            indent = self._indents[layer] = self._indent_bytes * layer
+        return indent
+
+
+class _Slot:
+    """
+    Empty text standing for the children left out of a frame, see ``Renderer._render_frame``.
+    """
+
+    is_text = True
+    reindent = False
+    content = ''
+
+
+class _FrameWriter(_BytesWriter):
+    """
+    Writer recording where the children of one element go.
+    """
+
+    def __init__(self, renderer: "Renderer", buffer: bytearray, container: HTML) -> None:
+        super().__init__(renderer, buffer)
+        self.offset = 0
+        self._length = buffer.__len__
+        self._container = container
+
+    def open_tag(self, tag: HTML, attrs: Optional[Attributes] = None) -> None:
+        super().open_tag(tag, attrs)
+        if tag is self._container:
+            self.offset = self._length()
 
 
 class Renderer:
-    
-    def __init__(self, tag: HTML, html_indent: int = 2) -> None:
+
+    def __init__(self, tag: HTML, html_indent: int = 2, transforms: Optional["Transforms"] = None) -> None:
+        """
+        Args:
+            tag (HTML): Element to render
+            html_indent (int): Indent width
+            transforms (Optional[Transforms]): Attribute hooks applied to elements while they are written
+        """
         self.tag: HTML = tag
         self.html_indent = html_indent
+        self.transforms = transforms
+        self._hooks = transforms.hooks if transforms is not None else None
         self._is_root: bool = tag == tag.root
 
     def render(self) -> str:
-        if self.tag.is_text:
-            return self.get_inner_text(self.tag)
-
-        open_tag = self.get_open_tag(self.tag)
-        close_tag = self.get_close_tag(self.tag)
-        html = open_tag + self.get_inner_html(self.tag) + close_tag
+        writer = _TextWriter(self)
+        self._render_document(writer)
+        return writer.getvalue()
 
-        if self._is_root:
-            html = f'<!DOCTYPE html>\n{html}'
+    def render_bytes(self) -> bytes:
+        """
+        Render the document straight to UTF-8 encoded bytes.
 
-        return html
+        Returns:
+            bytes: Encoded document, equal to ``render().encode()``
+        """
+        buffer = bytearray()
+        self.render_into(buffer)
+        return bytes(buffer)
 
-    def get_inner_text(self, tag: HTML) -> str:
-        inner_texts = []
+    def render_into(self, buffer: Union[bytearray, BinaryIO]) -> None:
+        """
+        Render the document as UTF-8 into a ``bytearray`` or a binary stream.
 
-        for string in tag._attrs.get('text', '').split('\n'):
-            layer_space = self._indent_str + self._layer_space(tag.parent)
-            inner_texts.append(layer_space + string)
+        Args:
+            buffer (Union[bytearray, BinaryIO]): Destination, e.g. ``io.BytesIO``, a file opened in "wb" mode
+                or a sink from ``html_codegen.output``
+        """
+        writer = _BytesWriter(self, buffer)
+        self._render_document(writer)
+        writer.flush()
 
-        return '\n'.join(inner_texts)
+    def get_inner_text(self, tag: HTML) -> str:
+        writer = _TextWriter(self)
+        writer.text(tag.content if tag.is_text else tag._attrs.get('text', ''), self._text_layer(tag))
+        return writer.getvalue()
 
     def get_inner_html(self, tag: HTML) -> str:
-        return ''.join(self._layer_space(node) + Renderer(node).render() for node in tag.children)
+        writer = _TextWriter(self)
+        self._write_children(tag, tag.layer, writer)
+        return writer.getvalue()
 
     def get_close_tag(self, tag: HTML) -> str:
         if tag.is_single:
@@ -46,11 +244,139 @@ class Renderer:
         return layer_space + f'</{tag.tag_name}>\n'
 
     def get_open_tag(self, tag: HTML) -> str:
-        attrs = ''.join([
-            f' {name}="{value}"'
-            for name, value in tag._attrs.items()
-        ])
-        return f'<{tag.tag_name}{attrs}>\n'
+        return f'<{tag.tag_name}{tag._attrs.fragment}>\n'
+
+    def _render_document(self, writer: Union[_TextWriter, _BytesWriter]) -> None:
+        if self.tag.is_text:
+            writer.text(self.tag.content, self._text_layer(self.tag))
+            return
+
+        if self._is_root:
+            writer.doctype()
+
+        self._write_tag(self.tag, self.tag.layer, writer)
+
+    def _render_frame(self, path: Sequence[int]) -> tuple[bytes, bytes]:
+        """
+        Render the document without the children of one of its elements.
+
+        Args:
+            path (Sequence[int]): Indexes of the children leading from the rendered element to that element
+
+        Returns:
+            tuple[bytes, bytes]: UTF-8 output before the place of the children, and after it
+        """
+        # copies of the elements on the path, the last one holding an empty slot in place of its children
+        original = self.tag
+        frame = root = original._clone_node()
+        frame._nodes = list(original._nodes)
+        for index in path:
+            original = original._nodes[index]
+            copy = original._clone_node()
+            copy._nodes = list(original._nodes)
+            frame._nodes[index] = copy
+            frame = copy
+        frame._nodes = [_Slot()] if original._nodes else []
+
+        buffer = bytearray()
+        writer = _FrameWriter(self, buffer, frame)
+        if self._is_root:
+            writer.doctype()
+        self._write_tag(root, self.tag.layer, writer)
+        return bytes(buffer[:writer.offset]), bytes(buffer[writer.offset:])
+
+    def _write_tag(self, tag: HTML, layer: int, writer: Union[_TextWriter, _BytesWriter]) -> None:
+        if tag.is_fragment:
+            self._write_fragment(tag, layer, writer)
+            return
+
+        if self._hooks is not None and tag.tag_name in self._hooks:
+            writer.open_tag(tag, self.transforms.attributes(tag))
+        else:
+            writer.open_tag(tag)
+        self._write_children(tag, layer, writer)
+
+        if tag.is_single:
+            return
+
+        if tag._nodes:
+            writer.newline()
+        writer.indent(layer)
+        writer.close_tag(tag)
+
+    def _write_children(self, tag: HTML, layer: int, writer: Union[_TextWriter, _BytesWriter]) -> None:
+        # explicit stacks of the open elements and of the iterators over their children rather than
+        # recursion, so that deep trees do not hit the recursion limit
+        hooks, transforms = self._hooks, self.transforms
+        text, indent, newline = writer.text, writer.indent, writer.newline
+        open_tag, close_tag = writer.open_tag, writer.close_tag
+        opened: list[HTML] = []
+        iterators: list[Iterator[HTML]] = []
+        nodes = iter(tag._nodes)
+        layer += 1
+        while True:
+            for node in nodes:
+                if node.is_text:
+                    text(node.content, layer if node.reindent else 0)
+                    continue
+
+                indent(layer)
+                if node.is_fragment:
+                    self._write_fragment(node, layer, writer)
+                    continue
+
+                if hooks is not None and node.tag_name in hooks:
+                    open_tag(node, transforms.attributes(node))
+                else:
+                    open_tag(node)
+
+                children = node._nodes
+                if not children:
+                    if not node.is_single:
+                        indent(layer)
+                        close_tag(node)
+                    continue
+
+                if len(children) == 1 and children[0].is_text:
+                    # elements holding only their text, the most common leaves, are written without descending
+                    child = children[0]
+                    text(child.content, layer + 1 if child.reindent else 0)
+                    if not node.is_single:
+                        newline()
+                        indent(layer)
+                        close_tag(node)
+                    continue
+
+                opened.append(node)
+                iterators.append(nodes)
+                nodes = iter(children)
+                layer += 1
+                break
+            else:
+                if not opened:
+                    return
+
+                node = opened.pop()
+                nodes = iterators.pop()
+                layer -= 1
+                if not node.is_single:
+                    newline()
+                    indent(layer)
+                    close_tag(node)
+
+    def _write_fragment(self, tag: HTML, layer: int, writer: Union[_TextWriter, _BytesWriter]) -> None:
+        if self._hooks is None:
+            writer.fragment(tag, layer)
+        else:
+            # hooks may match elements inside the component
+            self._write_tag(tag.source, layer, writer)
+
+    @staticmethod
+    def _text_layer(tag: HTML) -> int:
+        if not tag.reindent:
+            return 0
+        # text is indented one level deeper than its parent, even without one
+        return tag.layer if tag.parent else 1
 
     @property
     def _indent_str(self) -> str:
@@ -0,0 +1,128 @@
+"""
+Tree statistics and memory accounting.
+
+This module walks an HTML tree once, without recursion, and reports its size:
+node count, depth, text and attribute volume, per-tag counts, an estimate of
+the memory retained by the tree and the exact size of the rendered output.
+"""
+
+import sys
+from typing import (
+    TYPE_CHECKING,
+    NamedTuple,
+)
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+_DOCTYPE_SIZE = len("<!DOCTYPE html>\n")
+
+
+class TreeStats(NamedTuple):
+    """
+    TreeStats - size report of an HTML tree.
+
+    Attributes:
+        node_count (int): Number of nodes in the tree, text nodes included
+        max_depth (int): Depth of the deepest node, the inspected node being at depth 0
+        text_bytes (int): UTF-8 size of all text content
+        attr_bytes (int): UTF-8 size of all attribute names and values
+        tag_counts (dict[str, int]): Number of elements per tag name
+        memory_bytes (int): Estimated memory retained by the tree
+        rendered_bytes (int): UTF-8 size of the output of ``Renderer(tag).render()``
+    """
+
+    node_count: int
+    max_depth: int
+    text_bytes: int
+    attr_bytes: int
+    tag_counts: dict[str, int]
+    memory_bytes: int
+    rendered_bytes: int
+
+
+def _sizeof(obj: object, seen: set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    return sys.getsizeof(obj)
+
+
+def collect_stats(tag: "HTML", html_indent: int = 2) -> TreeStats:
+    """
+    Collect statistics of the tree rooted at the given element in a single pass.
+
+    Args:
+        tag (HTML): Element to inspect
+        html_indent (int): Indent width the output size is predicted for
+
+    Returns:
+        TreeStats: Statistics of the tree
+    """
+    node_count = max_depth = text_bytes = attr_bytes = memory_bytes = rendered_bytes = 0
+    tag_counts: dict[str, int] = {}
+    seen: set[int] = set()
+
+    base_layer = tag.layer
+    if tag.parent is None and not tag.is_text:
+        rendered_bytes += _DOCTYPE_SIZE
+
+    stack = [(tag, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_count += 1
+        max_depth = max(max_depth, depth)
+        layer = base_layer + depth
+        indent = html_indent * layer
+
+        memory_bytes += _sizeof(node, seen) + _sizeof(node.__dict__, seen)
+
+        if node.is_text:
+            content = node.content
+            size = len(content.encode())
+            text_bytes += size
+            memory_bytes += _sizeof(content, seen)
+            rendered_bytes += size
+            if node.reindent:
+                # a text node without a parent is still indented one level
+                rendered_bytes += html_indent * max(layer, 1) * (content.count("\n") + 1)
+            continue
+
+        memory_bytes += _sizeof(node._attrs, seen) + _sizeof(node._nodes, seen)
+
+        if node.is_fragment and (not node.is_placeholder or node.resolved):
+            # pre-rendered output of a component or built placeholder, preceded by the indent written by the
+            # parent; a placeholder not built yet is counted with its fallback rather than waited for
+            rendered_bytes += len(node.rendered_bytes(html_indent, layer)) + (indent if depth else 0)
+            continue
+
+        tag_counts[node.tag_name] = tag_counts.get(node.tag_name, 0) + 1
+        name_size = len(node.tag_name.encode())
+        memory_bytes += _sizeof(node.tag_name, seen)
+
+        for name, value in node._attrs.items():
+            value = str(value)
+            size = len(name.encode()) + len(value.encode())
+            attr_bytes += size
+            memory_bytes += _sizeof(name, seen) + _sizeof(value, seen)
+            # ' name="value"'
+            rendered_bytes += size + 4
+
+        # '<name>\n' preceded by the indent written by the parent
+        rendered_bytes += name_size + 3 + (indent if depth else 0)
+        if not node.is_single:
+            # '</name>\n', on a new line when the element has children
+            rendered_bytes += indent + name_size + 4 + (1 if node._nodes else 0)
+
+        stack.extend((child, depth + 1) for child in reversed(node._nodes))
+
+    return TreeStats(
+        node_count=node_count,
+        max_depth=max_depth,
+        text_bytes=text_bytes,
+        attr_bytes=attr_bytes,
+        tag_counts=tag_counts,
+        memory_bytes=memory_bytes,
+        rendered_bytes=rendered_bytes,
+    )
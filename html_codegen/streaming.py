@@ -0,0 +1,338 @@
+"""
+Out-of-order streaming of pages with slow sections.
+
+A ``Placeholder`` stands for a part of the page built later, e.g. from a slow data
+source; its own children are the fallback shown meanwhile. ``StreamingRenderer``
+sends the page shell at once, with each placeholder written as a marker element
+around its fallback, then sends every resolved section as soon as it is built, in
+completion order, inside a ``template`` element followed by a small inline script
+swapping it with the marker. ``Renderer`` waits for the placeholders instead and
+renders their content in place.
+"""
+
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from .core import (
+    HTML,
+    Attributes,
+    _build_state,
+)
+from .renderer import (
+    Renderer,
+    _BytesWriter,
+    _TextWriter,
+)
+from .tags.base_ import text
+
+if TYPE_CHECKING:
+    from .transforms import Transforms
+
+_SWAP_FUNCTION = (
+    "function htmlCodegenSwap(id) {"
+    " var marker = document.getElementById(id), section = document.getElementById(id + '-content');"
+    " marker.replaceWith(section.content); section.remove(); }"
+)
+
+
+def _element(tag_name: str, attrs: Optional[dict] = None) -> HTML:
+    # element of the rendered output only, never added to the with blocks open around rendering
+    token = _build_state.set(None)
+    try:
+        return HTML(tag_name, attrs)
+    finally:
+        _build_state.reset(token)
+
+
+class Placeholder(HTML):
+    """
+    Placeholder - part of the page resolved later.
+
+    The source is a function building the section, called at most once, or a future
+    of the section. Children added to the placeholder are the fallback content, e.g.
+    a spinner, rendered only while streaming.
+
+    Attributes:
+        source (HTML): Resolved section, waiting for it if needed
+    """
+
+    is_fragment = True
+    is_placeholder = True
+    _build: Optional[Callable[[], HTML]] = None
+    _future: Optional[Future] = None
+
+    def __init__(
+        self,
+        source: Union[Callable[[], HTML], "Future[HTML]"],
+        tag_name: str = "div",
+        attrs: Optional[dict] = None,
+    ) -> None:
+        """
+        Args:
+            source (Union[Callable[[], HTML], Future[HTML]]): Function building the section, or its future
+            tag_name (str): Tag name of the marker element written while streaming
+            attrs (dict, optional): Attributes of the marker element
+        """
+        super().__init__(tag_name, attrs)
+        self._lock = threading.Lock()
+        if isinstance(source, Future):
+            self._future = source
+        else:
+            self._build = source
+
+    @property
+    def source(self) -> HTML:
+        return self.result()
+
+    @property
+    def resolved(self) -> bool:
+        """
+        Whether the section was built successfully, checked without waiting for it.
+
+        Returns:
+            bool: True if ``result`` returns at once
+        """
+        future = self._future
+        return future is not None and future.done() and not future.cancelled() and future.exception() is None
+
+    def result(self, timeout: Optional[float] = None) -> HTML:
+        """
+        Resolved section, built on the calling thread if it was not started.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a section being built
+
+        Returns:
+            HTML: Root element of the section
+        """
+        with self._lock:
+            if self._future is None:
+                self._future = Future()
+                try:
+                    self._future.set_result(self._resolve())
+                except BaseException as error:
+                    self._future.set_exception(error)
+
+        return self._future.result(timeout)
+
+    def start(self, executor: Executor) -> "Future[HTML]":
+        """
+        Start building the section on an executor, unless it was started already.
+
+        Args:
+            executor (Executor): Executor running the build function
+
+        Returns:
+            Future[HTML]: Future of the section
+        """
+        with self._lock:
+            if self._future is None:
+                self._future = executor.submit(self._resolve)
+            return self._future
+
+    def _resolve(self) -> HTML:
+        # the section belongs to no with block, even when built on the calling thread
+        token = _build_state.set(None)
+        try:
+            tree = self._build()
+        finally:
+            _build_state.reset(token)
+
+        if not isinstance(tree, HTML) or tree.is_text:
+            raise TypeError(f"placeholder source must return an HTML element, not {tree!r}")
+
+        return tree
+
+    def rendered(self, html_indent: int, layer: int) -> str:
+        """
+        Output of the resolved section placed at the given depth, see ``Fragment.rendered``.
+
+        Args:
+            html_indent (int): Indent width
+            layer (int): Depth of the placeholder in the rendered tree
+
+        Returns:
+            str: Rendered section
+        """
+        tree = self.result()
+        renderer = Renderer(tree, html_indent)
+        writer = _TextWriter(renderer)
+        renderer._write_tag(tree, layer, writer)
+        return writer.getvalue()
+
+    def rendered_bytes(self, html_indent: int, layer: int) -> bytes:
+        """
+        UTF-8 encoded ``rendered`` output.
+
+        Args:
+            html_indent (int): Indent width
+            layer (int): Depth of the placeholder in the rendered tree
+
+        Returns:
+            bytes: Rendered section
+        """
+        return self.rendered(html_indent, layer).encode()
+
+
+class StreamingRenderer(Renderer):
+    """
+    StreamingRenderer - renderer sending the page shell before the placeholders are resolved.
+
+    Resolved sections are inserted before the closing tag of "body", the rendered
+    element or one of its children, or at the end of the output if there is none.
+    Their ids are the id prefix followed by the order in which the markers were
+    written. Placeholders inside a resolved section are streamed the same way.
+    """
+
+    def __init__(
+        self,
+        tag: HTML,
+        html_indent: int = 2,
+        transforms: Optional["Transforms"] = None,
+        executor: Optional[Executor] = None,
+        id_prefix: str = "html-codegen-",
+    ) -> None:
+        """
+        Args:
+            tag (HTML): Element to render
+            html_indent (int): Indent width
+            transforms (Optional[Transforms]): Attribute hooks applied to elements while they are written,
+                the generated "template" and "script" elements included
+            executor (Optional[Executor]): Executor building the sections, a thread pool for each stream by default
+            id_prefix (str): Prefix of the ids of the marker elements
+        """
+        super().__init__(tag, html_indent, transforms)
+        self.executor = executor
+        self.id_prefix = id_prefix
+        self._executor: Optional[Executor] = None
+        self._markers: list[tuple[Future, str]] = []  # future of the section and id of each marker written
+
+    def stream(self) -> Iterator[bytes]:
+        """
+        Render the document as UTF-8 chunks: the shell, one chunk per resolved section
+        in completion order, and the end of the document.
+
+        Yields:
+            bytes: Next part of the document
+
+        Raises:
+            Exception: the error raised while building a section, once the previous sections were sent
+        """
+        executor = self.executor or ThreadPoolExecutor(thread_name_prefix="html-codegen-placeholder")
+        self._executor = executor
+        self._markers = []
+        try:
+            path = self._body_path()
+            shell = bytearray()
+            if path is None:
+                self._render_document(_BytesWriter(self, shell))
+                tail, layer = b"", 0
+            else:
+                # sections go after the last child of the body
+                head, tail = self._render_frame(path)
+                body = self.tag
+                for index in path:
+                    body = body._nodes[index]
+                layer = self.tag.layer + len(path)
+                shell += head
+                self._write_children(body, layer, _BytesWriter(self, shell))
+                layer += 1
+            yield bytes(shell)
+
+            pending: dict[Future, list[str]] = {}
+            registered, define_swap = 0, True
+            while True:
+                # sections may contain placeholders too, registered while they are rendered
+                for future, marker_id in self._markers[registered:]:
+                    pending.setdefault(future, []).append(marker_id)
+                registered = len(self._markers)
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for marker_id in pending.pop(future):
+                        yield self._render_section(marker_id, future.result(), layer, define_swap)
+                        define_swap = False
+
+            yield tail
+        finally:
+            if executor is not self.executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def render_into(self, buffer: Union[bytearray, BinaryIO]) -> None:
+        """
+        Stream the document into a ``bytearray`` or a binary stream, flushing the stream after each chunk.
+
+        Args:
+            buffer (Union[bytearray, BinaryIO]): Destination, e.g. the response stream
+        """
+        if isinstance(buffer, bytearray):
+            for chunk in self.stream():
+                buffer.extend(chunk)
+            return
+
+        for chunk in self.stream():
+            buffer.write(chunk)
+            buffer.flush()
+
+    def render(self) -> str:
+        return self.render_bytes().decode()
+
+    def _write_fragment(self, tag: HTML, layer: int, writer: Union[_TextWriter, _BytesWriter]) -> None:
+        if not isinstance(tag, Placeholder):
+            super()._write_fragment(tag, layer, writer)
+            return
+
+        # marker around the fallback content
+        marker_id = f"{self.id_prefix}{len(self._markers)}"
+        self._markers.append((tag.start(self._executor), marker_id))
+
+        attrs = self.transforms.attributes(tag) if self._hooks is not None else None
+        attrs = Attributes(tag._attrs if attrs is None else attrs)
+        attrs["id"] = marker_id
+        writer.open_tag(tag, attrs)
+        self._write_children(tag, layer, writer)
+        if tag._nodes:
+            writer.newline()
+        writer.indent(layer)
+        writer.close_tag(tag)
+
+    def _body_path(self) -> Optional[list[int]]:
+        # indexes leading to the "body" element, the rendered element itself or one of its children
+        if self.tag.is_text:
+            return None
+        if self.tag.tag_name == "body":
+            return []
+        for index, child in enumerate(self.tag._nodes):
+            if not child.is_text and child.tag_name == "body":
+                return [index]
+        return None
+
+    def _render_section(self, marker_id: str, tree: HTML, layer: int, define_swap: bool) -> bytes:
+        section = _element("template", {"id": f"{marker_id}-content"})
+        section._nodes.append(tree)
+        swap = _element("script")
+        call = f"htmlCodegenSwap('{marker_id}');"
+        swap._nodes.append(text._detached(f"{_SWAP_FUNCTION}\n{call}" if define_swap else call))
+
+        buffer = bytearray()
+        writer = _BytesWriter(self, buffer)
+        for element in (section, swap):
+            writer.indent(layer)
+            self._write_tag(element, layer, writer)
+        return bytes(buffer)
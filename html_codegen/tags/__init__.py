@@ -16,122 +16,137 @@ Categories:
 - Media tags
 - Metadata tags
 - Interactive elements
-"""
-
-# Базовые классы и миксины
-from .base_ import text, OnlyOneInHTMLTagMixin, OnlyTextTagMixin, Tag, SingleTag
 
-# Структурные теги документа
-from .document_ import html, head, body
+Tag modules are imported lazily, on first access to one of their tags.
+"""
 
-# Семантические теги
-from .semantic_ import (
-    main,
-    nav,
-    article,
-    section,
-    header,
-    footer,
-    aside,
-    figure,
-    figcaption,
-    details,
-    summary,
-    dialog,
-    mark,
-    time,
-    progress,
-    meter,
-)
+import importlib
 
-# Текстовые теги и форматирование
-from .text_ import (
-    h1,
-    h2,
-    h3,
-    h4,
-    h5,
-    h6,
-    p,
-    b,
-    strong,
-    i,
-    em,
-    u,
-    s,
-    del_,
-    ins,
-    small,
-    sub,
-    sup,
-    code,
-    pre,
-    kbd,
-    samp,
-    var,
-    cite,
-    q,
-    blockquote,
-    address,
-    span,
-    br,
-    wbr,
-)
+# Модуль, в котором определен каждый тег. Модули загружаются при первом
+# обращении к одному из их тегов (см. __getattr__), а не при импорте пакета.
+_TAG_MODULES = {
+    # Базовые классы и миксины
+    **dict.fromkeys(["text", "OnlyOneInHTMLTagMixin", "OnlyTextTagMixin", "Tag", "SingleTag"], "base_"),
+    # Структурные теги документа
+    **dict.fromkeys(["html", "head", "body"], "document_"),
+    # Семантические теги
+    **dict.fromkeys(
+        [
+            "main",
+            "nav",
+            "article",
+            "section",
+            "header",
+            "footer",
+            "aside",
+            "figure",
+            "figcaption",
+            "details",
+            "summary",
+            "dialog",
+            "mark",
+            "time",
+            "progress",
+            "meter",
+        ],
+        "semantic_",
+    ),
+    # Текстовые теги и форматирование
+    **dict.fromkeys(
+        [
+            "h1",
+            "h2",
+            "h3",
+            "h4",
+            "h5",
+            "h6",
+            "p",
+            "b",
+            "strong",
+            "i",
+            "em",
+            "u",
+            "s",
+            "del_",
+            "ins",
+            "small",
+            "sub",
+            "sup",
+            "code",
+            "pre",
+            "kbd",
+            "samp",
+            "var",
+            "cite",
+            "q",
+            "blockquote",
+            "address",
+            "span",
+            "br",
+            "wbr",
+        ],
+        "text_",
+    ),
+    # Теги списков
+    **dict.fromkeys(["ul", "ol", "li", "dl", "dt", "dd", "menu", "menuitem"], "lists_"),
+    # Теги таблиц
+    **dict.fromkeys(["table", "caption", "colgroup", "col", "thead", "tbody", "tfoot", "tr", "th", "td"], "tables_"),
+    # Теги форм
+    **dict.fromkeys(
+        [
+            "form",
+            "fieldset",
+            "legend",
+            "label",
+            "input_",
+            "textarea",
+            "button",
+            "select",
+            "option",
+            "optgroup",
+            "datalist",
+        ],
+        "forms_",
+    ),
+    # Медиа теги
+    **dict.fromkeys(
+        [
+            "img",
+            "audio",
+            "video",
+            "source",
+            "track",
+            "iframe",
+            "embed",
+            "object_",
+            "param",
+            "canvas",
+            "svg",
+            "map_",
+            "area",
+        ],
+        "media_",
+    ),
+    # Метаданные теги
+    **dict.fromkeys(["title", "meta", "link", "base", "style", "script", "noscript", "pyscript"], "metadata_"),
+    # Интерактивные элементы
+    **dict.fromkeys(["a", "hr", "div", "data"], "interactive_"),
+}
 
-# Теги списков
-from .lists_ import ul, ol, li, dl, dt, dd, menu, menuitem
 
-# Теги таблиц
-from .tables_ import (
-    table,
-    caption,
-    colgroup,
-    col,
-    thead,
-    tbody,
-    tfoot,
-    tr,
-    th,
-    td,
-)
+def __getattr__(name: str):
+    module_name = _TAG_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Теги форм
-from .forms_ import (
-    form,
-    fieldset,
-    legend,
-    label,
-    input_,
-    textarea,
-    button,
-    select,
-    option,
-    optgroup,
-    datalist,
-)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# Медиа теги
-from .media_ import (
-    img,
-    audio,
-    video,
-    source,
-    track,
-    iframe,
-    embed,
-    object_,
-    param,
-    canvas,
-    svg,
-    map_,
-    area,
-)
 
-# Метаданные теги
-from .metadata_ import title, meta, link, base, style, script, noscript, pyscript
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-# Интерактивные элементы
-from .interactive_ import a, hr, div, data
 
 # Экспорт всех тегов для обратной совместимости
 __all__ = [
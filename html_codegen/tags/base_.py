@@ -1,7 +1,7 @@
 from operator import attrgetter
 from typing import Optional
 
-from ..core import HTML
+from ..core import HTML, Attributes, FrozenAttributes, _intern_pool
 from ..exceptions import (
     DuplicateTagError,
     OnlyTextContentError,
@@ -11,24 +11,107 @@ from ..exceptions import (
 )
 
 
-class text(HTML):
+class _TextAttributes(Attributes):
+    """
+    Attributes of a text node, whose "text" attribute is its content.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: "text", attrs=()) -> None:
+        self._node = None
+        super().__init__(attrs)
+        self._node = node
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        if key == "text":
+            self._node.content = value
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        if self._node is not None and "text" in self:
+            self._node.content = dict.__getitem__(self, "text")
 
-    def __init__(self, text: str, /) -> None:
-        super().__init__("", {"text": text})
-        self.is_text = True
+    def __reduce__(self) -> tuple:
+        # bound again to the node on first use after unpickling
+        return Attributes, (dict(self),)
+
+
+class text(HTML):
+    """
+    text - text node.
+
+    Text is the most common node, so it only stores its content: everything else is
+    a class attribute, and the instance gets a parent, construction state and an
+    attribute dictionary (whose "text" attribute is the content) only once it uses them.
+
+    Attributes:
+        content (str): Text of the node
+    """
+
+    tag_name = ""
+    is_single = False
+    is_text = True
+    _nodes = ()
+
+    def __init__(self, text: str, /, reindent: bool = True) -> None:
+        pool = _intern_pool.get()
+        self.content = text if pool is None else pool.intern(text)
+        if not reindent:
+            # written as is, e.g. minified code or text whose indentation matters
+            self.reindent = False
+        self._add_to_ctx()
+
+    @classmethod
+    def _detached(cls, content: str) -> "text":
+        # text node created outside of the with blocks, for strings added as children
+        pool = _intern_pool.get()
+        node = cls.__new__(cls)
+        node.content = content if pool is None else pool.intern(content)
+        return node
+
+    @property
+    def _attrs(self) -> Attributes:
+        # created on first use, for code expecting the content in attributes
+        attrs = self.__dict__.get("_text_attrs")
+        if type(attrs) is not _TextAttributes or attrs._node is not self:
+            # first use, or attributes unpickled or copied along with the node
+            attrs = self.__dict__["_text_attrs"] = _TextAttributes(self, attrs or ())
+        if dict.get(attrs, "text") is not self.content:
+            dict.__setitem__(attrs, "text", self.content)
+            attrs._invalidate()
+        return FrozenAttributes(attrs) if self._frozen else attrs
+
+    @_attrs.setter
+    def _attrs(self, attrs: dict) -> None:
+        self.__dict__["_text_attrs"] = _TextAttributes(self, attrs)
+
+    def add_node(self, new_node: "HTML") -> None:
+        # text has no list of children, so even trusted builds cannot add one
+        raise TextNodeNestingError("Text cannot have nested tags")
 
     def add_node_validation(self, new_node: "HTML") -> None:
         raise TextNodeNestingError("Text cannot have nested tags")
 
+    def _clone_node(self) -> "text":
+        node = self.__class__.__new__(self.__class__)
+        node.__dict__ = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_parent", "_ctx", "_created_in_with_context", "_frozen")
+        }
+        return node
+
     def __repr__(self) -> str:
-        return self._attrs["text"]
+        return self.content
 
 
 class OnlyOneInHTMLTagMixin:
     tag_name: str
     parent: HTML
 
-    def _execute_parent_callback(self) -> None:
+    def _validate_placement(self) -> None:
         html_tag = self._find_html_tag()
         
         if not html_tag:
@@ -1,11 +1,19 @@
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .base_ import OnlyTextTagMixin, SingleTag, Tag
+from ..build import record_dependency
+from ..bundler import get_module_source
 from ..exceptions import BrythonNotEnabledError
+from ..minify import minify_css, minify_js
+
+if TYPE_CHECKING:
+    from ..assets import AssetPipeline
+    from ..bundler import Bundle
 
 
 def _read_file_content(path: str) -> str:
+    record_dependency(path)
     with open(Path(path), "r") as file:
         return file.read().strip()
 
@@ -22,9 +30,16 @@ class meta(SingleTag):
     pass
 
 
+def _is_local_file(path: str) -> bool:
+    return "://" not in path and not path.startswith("//") and Path(path).is_file()
+
+
 class link(SingleTag):
 
-    def __init__(self, href: str, /, rel: str, **kwargs) -> None:
+    def __init__(self, href: str, /, rel: str, assets: Optional["AssetPipeline"] = None, **kwargs) -> None:
+        if assets is not None and _is_local_file(href):
+            href = assets.emit(href)
+
         attrs = kwargs.get("attrs", {})
         attrs.update({"href": href, "rel": rel})
         kwargs["attrs"] = attrs
@@ -36,6 +51,8 @@ class base(SingleTag):
 
 
 class style(OnlyTextTagMixin, Tag):
+    # file of the inlined stylesheet, see css.prune_unused_css
+    _source_path: Optional[str] = None
 
     def __init__(
         self,
@@ -43,24 +60,50 @@ class style(OnlyTextTagMixin, Tag):
         *,
         media: Optional[str] = None,
         style_type: Optional[str] = None,
+        assets: Optional["AssetPipeline"] = None,
+        minify: bool = False,
     ) -> None:
         attrs = {}
+        if assets is not None and (href := assets.emit_or_inline(style_path)):
+            attrs.update({"href": href, "rel": "stylesheet"})
         if media:
             attrs["media"] = media
         if style_type:
             attrs["type"] = style_type
         super().__init__(attrs)
 
+        if "href" in self._attrs:
+            # an external stylesheet is referenced with a "link" tag
+            self.tag_name = "link"
+            self.is_single = True
+            return
+
         from .base_ import text
-        self.add_node(text(_read_file_content(style_path)))
+        self._source_path = style_path
+        content = _read_file_content(style_path)
+        if minify:
+            self.add_node(text(minify_css(content), reindent=False))
+        else:
+            self.add_node(text(content))
 
 
 class script(OnlyTextTagMixin, Tag):
 
-    def __init__(self, script_path: Optional[str] = None, **kwargs) -> None:
+    def __init__(
+        self,
+        script_path: Optional[str] = None,
+        assets: Optional["AssetPipeline"] = None,
+        minify: bool = False,
+        **kwargs,
+    ) -> None:
+        if script_path and assets is not None and (src := assets.emit_or_inline(script_path)):
+            kwargs["src"] = src
+            script_path = None
         super().__init__(kwargs)
 
-        if script_path:
+        if script_path and minify:
+            self.text(minify_js(_read_file_content(script_path)), reindent=False)
+        elif script_path:
             self.text(_read_file_content(script_path))
 
 
@@ -70,15 +113,19 @@ class noscript(Tag):
 
 class pyscript(OnlyTextTagMixin, Tag):
 
-    def __init__(self, module: str, /, **kwargs) -> None:
+    def __init__(self, module: str, /, bundle: Optional["Bundle"] = None, minify: bool = False, **kwargs) -> None:
         attrs = kwargs.pop("attrs", {})
         attrs["type"] = "text/python"
+        if bundle is not None and (src := bundle.add(module)):
+            attrs["src"] = src
         kwargs["attrs"] = attrs
         super().__init__(**kwargs)
         self.tag_name = "script"
-        self.text(self._get_module_code(module))
+        if "src" not in self._attrs:
+            # stripped code is written without indentation, which Python is sensitive to
+            self.text(self._get_module_code(module, minify), reindent=not minify)
 
-    def _execute_parent_callback(self) -> None:
+    def _validate_placement(self) -> None:
         html_tag = self._find_html_tag()
         
         if not html_tag or not html_tag.use_brython:
@@ -87,9 +134,8 @@ class pyscript(OnlyTextTagMixin, Tag):
                 "example: `document = html(use_brython=True)`"
             )
 
-    def _get_module_code(self, module_name: str) -> str:
-        try:
-            module_path = Path(module_name.replace(".", "/") + ".py")
-            return _read_file_content(str(module_path))
-        except FileNotFoundError:
+    def _get_module_code(self, module_name: str, strip: bool = False) -> str:
+        source = get_module_source(module_name, strip)
+        if source is None:
             return f"# Module {module_name} not found"
+        return source
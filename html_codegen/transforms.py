@@ -0,0 +1,130 @@
+"""
+Render-time transforms.
+
+A ``Transforms`` table maps tag names to hooks adjusting the attributes of matching
+elements while ``Renderer`` writes them, so post-processing such as rewriting asset
+URLs, adding CSP nonces or ``rel="noopener"`` takes no walk of its own and leaves the
+tree unchanged. Elements whose tag name has no hook are written as usual.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+)
+
+from .core import Attributes
+
+if TYPE_CHECKING:
+    from .core import HTML
+
+Hook = Callable[["HTML", Attributes], None]
+
+
+class Transforms:
+    """
+    Transforms - table of attribute hooks by tag name.
+
+    A hook receives the element and a copy of its attributes, which it changes in
+    place; the copy is what gets rendered. Hooks of a tag name run in the order they
+    were registered.
+
+    Attributes:
+        hooks (dict[str, list[Hook]]): Hooks by tag name
+    """
+
+    def __init__(self) -> None:
+        self.hooks: dict[str, list[Hook]] = {}
+
+    def add(self, tag_name: str, hook: Hook) -> None:
+        """
+        Register a hook for a tag name.
+
+        Args:
+            tag_name (str): Rendered tag name, e.g. "a" or "script"
+            hook (Hook): Function changing the attributes of the element
+        """
+        self.hooks.setdefault(tag_name, []).append(hook)
+
+    def register(self, *tag_names: str) -> Callable[[Hook], Hook]:
+        """
+        Register the decorated function as a hook for the given tag names.
+
+        Args:
+            *tag_names (str): Rendered tag names
+
+        Returns:
+            Callable[[Hook], Hook]: Decorator returning the hook unchanged
+        """
+
+        def decorator(hook: Hook) -> Hook:
+            for tag_name in tag_names:
+                self.add(tag_name, hook)
+            return hook
+
+        return decorator
+
+    def attributes(self, tag: "HTML") -> Optional[Attributes]:
+        """
+        Attributes of an element after its hooks ran.
+
+        Args:
+            tag (HTML): Element being rendered
+
+        Returns:
+            Optional[Attributes]: Transformed copy of the attributes, None if no hook matches the element
+        """
+        hooks = self.hooks.get(tag.tag_name)
+        if not hooks:
+            return None
+
+        attrs = Attributes(tag._attrs)
+        for hook in hooks:
+            hook(tag, attrs)
+        return attrs
+
+
+def add_noopener(tag: "HTML", attrs: Attributes) -> None:
+    """
+    Hook adding "noopener" to the "rel" attribute of links, e.g. for "a" and "area" tags.
+    """
+    rel = str(attrs.get("rel", "")).split()
+    if "noopener" not in rel:
+        attrs["rel"] = " ".join([*rel, "noopener"])
+
+
+def csp_nonce(nonce: str) -> Hook:
+    """
+    Hook setting the "nonce" attribute, e.g. for "script" and "style" tags.
+
+    Args:
+        nonce (str): Content Security Policy nonce of the response
+
+    Returns:
+        Hook: Transform hook
+    """
+
+    def hook(tag: "HTML", attrs: Attributes) -> None:
+        attrs["nonce"] = nonce
+
+    return hook
+
+
+def rewrite_urls(rewrite: Callable[[str], str], names: tuple[str, ...] = ("href", "src")) -> Hook:
+    """
+    Hook rewriting URL attributes, e.g. to point assets at a CDN.
+
+    Args:
+        rewrite (Callable[[str], str]): Function mapping an URL to the rendered one
+        names (tuple[str, ...]): Names of the URL attributes
+
+    Returns:
+        Hook: Transform hook
+    """
+
+    def hook(tag: "HTML", attrs: Attributes) -> None:
+        for name in names:
+            if name in attrs:
+                attrs[name] = rewrite(str(attrs[name]))
+
+    return hook
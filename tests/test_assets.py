@@ -0,0 +1,83 @@
+import pytest
+
+from html_codegen import (
+    Renderer,
+    head,
+    html,
+)
+from html_codegen.assets import (
+    AssetPipeline,
+    file_digest,
+)
+from html_codegen.tags import (
+    link,
+    script,
+    style,
+)
+
+CSS = "body {\n  height: 100vh;\n}"
+
+
+@pytest.fixture
+def css_file(tmp_path):
+    path = tmp_path / "main.css"
+    path.write_text(CSS)
+    return path
+
+
+class TestAssetPipeline:
+    def test_emit_copies_file_with_hash(self, css_file, tmp_path):
+        pipeline = AssetPipeline(tmp_path / "static", url_prefix="/static/")
+        url = pipeline.emit(css_file)
+
+        assert url == f"/static/main.{file_digest(css_file)}.css"
+        assert (tmp_path / "static" / url.removeprefix("/static/")).read_text() == CSS
+
+    def test_changed_file_gets_new_name(self, css_file, tmp_path):
+        pipeline = AssetPipeline(tmp_path / "static")
+        first = pipeline.emit(css_file)
+        css_file.write_text(CSS + "\ndiv {}")
+        assert pipeline.emit(css_file) != first
+
+    def test_inline_threshold(self, css_file, tmp_path):
+        assert AssetPipeline(tmp_path, inline_threshold=len(CSS)).emit_or_inline(css_file) is None
+        assert AssetPipeline(tmp_path, inline_threshold=len(CSS) - 1).emit_or_inline(css_file)
+
+
+class TestAssetTags:
+    def test_style_is_inlined_without_pipeline(self, css_file):
+        tag = style(str(css_file))
+        assert tag.tag_name == "style"
+        assert tag.children[0]._attrs["text"] == CSS
+
+    def test_style_becomes_link(self, css_file, tmp_path):
+        with html() as doc:
+            with head():
+                style(str(css_file), media="screen", assets=AssetPipeline(tmp_path / "static"))
+
+        rendered = Renderer(doc).render()
+        assert f'<link href="main.{file_digest(css_file)}.css" rel="stylesheet" media="screen">' in rendered
+        assert "</link>" not in rendered
+        assert "height" not in rendered
+
+    def test_small_style_stays_inline(self, css_file, tmp_path):
+        tag = style(str(css_file), assets=AssetPipeline(tmp_path / "static", inline_threshold=1024))
+        assert tag.tag_name == "style"
+        assert not (tmp_path / "static").exists()
+
+    def test_script_src(self, tmp_path):
+        js_file = tmp_path / "app.js"
+        js_file.write_text("console.log(1);")
+        tag = script(str(js_file), assets=AssetPipeline(tmp_path / "static"), type="module")
+
+        assert tag._attrs == {"type": "module", "src": f"app.{file_digest(js_file)}.js"}
+        assert tag.children == []
+
+    def test_link_to_local_file(self, css_file, tmp_path):
+        tag = link(str(css_file), rel="stylesheet", assets=AssetPipeline(tmp_path / "static"))
+        assert tag._attrs["href"] == f"main.{file_digest(css_file)}.css"
+
+    def test_link_to_url_is_kept(self, tmp_path):
+        url = "https://cdn.example.com/normalize.css"
+        tag = link(url, rel="stylesheet", assets=AssetPipeline(tmp_path / "static"))
+        assert tag._attrs["href"] == url
@@ -0,0 +1,286 @@
+"""
+Relative performance checks.
+
+Each benchmark compares two ways of doing the same work on a few thousand nodes and
+asserts the optimized path wins by a margin far below the one measured locally, so
+the checks stay stable on slow or noisy machines. They still depend on the machine,
+so they only run when the HTML_CODEGEN_BENCHMARKS environment variable is set,
+e.g. with ``make benchmarks``.
+"""
+
+import os
+import subprocess
+import sys
+import tracemalloc
+from timeit import repeat
+
+import pytest
+
+from html_codegen import (
+    ParallelRenderer,
+    PersistentTree,
+    Renderer,
+    component,
+    div,
+    intern_strings,
+    p,
+    span,
+    table,
+    td,
+    text,
+    tr,
+)
+from html_codegen.output import BufferSink
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get("HTML_CODEGEN_BENCHMARKS"), reason="set HTML_CODEGEN_BENCHMARKS=1 to run benchmarks"
+)
+
+
+def _best_time(func, number: int = 3) -> float:
+    return min(repeat(func, number=number, repeat=5))
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _build_table(rows: int = 500) -> table:
+    with table() as result:
+        for index in range(rows):
+            with tr(attrs={"class": "row"}):
+                td().text(f"cell {index}")
+                td(attrs={"class": "value"}).text("value")
+
+    return result
+
+
+def _import_time(statement: str) -> float:
+    code = f"from time import perf_counter; start = perf_counter(); {statement}; print(perf_counter() - start)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(5)
+    )
+
+
+@benchmark
+class TestCloneBenchmark:
+    def test_clone_is_faster_than_rebuild(self):
+        original = _build_table()
+
+        rebuild_time = _best_time(_build_table)
+        clone_time = _best_time(original.clone)
+
+        assert clone_time * 1.5 < rebuild_time
+
+
+@benchmark
+class TestSinkBenchmark:
+    def test_buffer_sink_uses_less_memory_than_str_render(self):
+        document = _build_table(2000)
+        size = document.stats().rendered_bytes
+
+        str_peak = _peak_memory(lambda: Renderer(document).render().encode())
+        sink_peak = _peak_memory(lambda: Renderer(document).render_into(BufferSink(size)))
+
+        assert sink_peak * 2 < str_peak
+
+    def test_buffer_sink_is_not_slower_than_str_render(self):
+        document = _build_table(2000)
+        sink = BufferSink()
+
+        def render_into_sink():
+            sink.clear()
+            Renderer(document).render_into(sink)
+
+        # measured in turns, so that a slow spell of the machine does not fall on one side only
+        str_times, sink_times = [], []
+        for _ in range(5):
+            str_times.append(_best_time(lambda: Renderer(document).render().encode(), number=1))
+            sink_times.append(_best_time(render_into_sink, number=1))
+
+        assert min(sink_times) < min(str_times) * 1.5
+
+
+def _product_card(title: str, price: int) -> div:
+    with div(attrs={"class": "card"}) as result:
+        with div(attrs={"class": "body"}):
+            p(attrs={"class": "title"}).text(title)
+            span(attrs={"class": "price"}).text(f"{price} $")
+            span(attrs={"class": "badge"}).text("new")
+
+    return result
+
+
+def _render_listing(card) -> str:
+    with div() as listing:
+        for index in range(1000):
+            card(f"product {index % 20}", index % 20)
+
+    return Renderer(listing).render()
+
+
+@benchmark
+class TestComponentBenchmark:
+    def test_memoized_component_is_faster_than_rebuild(self):
+        cached_card = component(_product_card)
+
+        rebuild_time = _best_time(lambda: _render_listing(_product_card))
+        cached_time = _best_time(lambda: _render_listing(cached_card))
+
+        assert cached_time * 2 < rebuild_time
+
+
+@benchmark
+class TestRawTextBenchmark:
+    def test_raw_text_is_faster_than_reindented(self):
+        script = "\n".join(f"let value{index} = compute({index});" for index in range(20000))
+        with div() as reindented:
+            text(script)
+        with div() as raw:
+            text(script, reindent=False)
+
+        reindented_time = _best_time(lambda: Renderer(reindented).render())
+        raw_time = _best_time(lambda: Renderer(raw).render())
+
+        assert raw_time * 2 < reindented_time
+
+
+@benchmark
+class TestTextMemoryBenchmark:
+    def test_text_node_is_lighter_than_element(self):
+        contents = [f"cell {index}" for index in range(10000)]
+
+        def add_elements():
+            parent = div()
+            for content in contents:
+                parent.add_node(span())
+
+        def add_strings():
+            parent = div()
+            for content in contents:
+                parent.add_node(content)
+
+        assert _peak_memory(add_strings) * 2 < _peak_memory(add_elements)
+
+
+@benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+class TestParallelBenchmark:
+    def test_parallel_render_is_faster_than_sequential(self):
+        document = _build_table(100_000)
+
+        sequential_time = _best_time(lambda: Renderer(document).render_bytes(), number=1)
+        parallel_time = _best_time(lambda: ParallelRenderer(document, workers=4).render_bytes(), number=1)
+
+        assert parallel_time * 1.5 < sequential_time
+
+
+@benchmark
+class TestPersistentBenchmark:
+    def test_version_edit_is_faster_than_copy(self):
+        original = _build_table(2000)
+        tree = PersistentTree(_build_table(2000))
+
+        def copy_and_edit():
+            version = original.clone()
+            version.children[1000]._attrs["id"] = "selected"
+
+        def edit_version():
+            tree.update_attributes((1000,), {"id": "selected"})
+
+        assert _best_time(edit_version) * 10 < _best_time(copy_and_edit)
+
+
+@benchmark
+class TestInternBenchmark:
+    _labels = ["Pending review by the finance department", "Approved by the regional manager", "Rejected"]
+
+    def _build_report(self) -> table:
+        with table() as result:
+            for index in range(5000):
+                # new string objects, as values read from a database
+                with tr(attrs={"class": f"row status-{index % 3}"}):
+                    td().text(self._labels[index % 3].lower())
+
+        return result
+
+    def _retained_memory(self, func) -> int:
+        tracemalloc.start()
+        try:
+            tree = func()  # noqa: F841, kept alive while measured
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    def test_interned_tree_uses_less_memory(self):
+        def build_interned() -> table:
+            with intern_strings():
+                return self._build_report()
+
+        interned = self._retained_memory(build_interned)
+        plain = self._retained_memory(self._build_report)
+
+        assert interned * 1.1 < plain
+
+    def test_interning_does_not_slow_construction(self):
+        def build_interned() -> table:
+            with intern_strings():
+                return self._build_report()
+
+        assert _best_time(build_interned, number=1) < _best_time(self._build_report, number=1) * 1.3
+
+
+def _chains(count: int, depth: int) -> div:
+    # "count" chains of nested elements "depth" levels deep, each ending with a text
+    root = div()
+    for _ in range(count):
+        node = root
+        for _ in range(depth):
+            child = div()
+            node.add_node(child)
+            node = child
+        node.add_node("leaf")
+    return root
+
+
+@benchmark
+class TestDeepTreeBenchmark:
+    # a chain 10k levels deep costs about as much per node as a hundred chains 100 levels deep
+    def test_walk_time_does_not_depend_on_depth(self):
+        deep, shallow = _chains(1, 10_000), _chains(100, 100)
+
+        deep_time = _best_time(lambda: sum(1 for _ in deep.walk()))
+        shallow_time = _best_time(lambda: sum(1 for _ in shallow.walk()))
+
+        assert deep_time < shallow_time * 1.5
+
+    def test_post_order_walk_time_does_not_depend_on_depth(self):
+        deep, shallow = _chains(1, 10_000), _chains(100, 100)
+
+        deep_time = _best_time(lambda: sum(1 for _ in deep.walk(order="post")))
+        shallow_time = _best_time(lambda: sum(1 for _ in shallow.walk(order="post")))
+
+        assert deep_time < shallow_time * 1.5
+
+    def test_render_time_does_not_depend_on_depth(self):
+        deep, shallow = _chains(1, 10_000), _chains(100, 100)
+
+        deep_time = _best_time(lambda: Renderer(deep, html_indent=0).render_bytes())
+        shallow_time = _best_time(lambda: Renderer(shallow, html_indent=0).render_bytes())
+
+        assert deep_time < shallow_time * 1.5
+
+
+@benchmark
+class TestImportBenchmark:
+    def test_lazy_import_is_faster_than_loading_all_tags(self):
+        lazy_time = _import_time("import html_codegen")
+        eager_time = _import_time("from html_codegen import *; import html_codegen.output")
+
+        assert lazy_time * 1.5 < eager_time
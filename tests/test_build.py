@@ -0,0 +1,148 @@
+import pytest
+
+from html_codegen import (
+    body,
+    component,
+    head,
+    html,
+    p,
+    style,
+)
+from html_codegen.build import Site
+
+
+def _styled_page(css_path: str) -> html:
+    with html() as doc:
+        with head():
+            style(css_path)
+        with body():
+            p().text("styled")
+    return doc
+
+
+def _product_page(products: list) -> html:
+    with html() as doc:
+        with body():
+            p().text(f"{len(products)} products")
+    return doc
+
+
+@component
+def _theme(css_path: str) -> style:
+    return style(css_path)
+
+
+def _themed_page(css_path: str, title: str) -> html:
+    with html() as doc:
+        with head():
+            _theme(css_path)
+        with body():
+            p().text(title)
+    return doc
+
+
+def _make_site(tmp_path) -> Site:
+    css = tmp_path / "main.css"
+    if not css.exists():
+        css.write_text("p { color: red; }")
+
+    site = Site(tmp_path / "public", data={"products": ["a", "b"]})
+    site.add("styled.html", _styled_page, str(css))
+    site.add("products.html", _product_page, data=("products",))
+    return site
+
+
+class TestSiteBuild:
+    def test_first_build_writes_every_page(self, tmp_path):
+        report = _make_site(tmp_path).build()
+
+        assert report.rebuilt == report.written == ["styled.html", "products.html"]
+        assert "color: red" in (tmp_path / "public" / "styled.html").read_text()
+
+    def test_unchanged_pages_are_skipped(self, tmp_path):
+        _make_site(tmp_path).build()
+        report = _make_site(tmp_path).build()
+
+        assert report.rebuilt == []
+        assert report.skipped == ["styled.html", "products.html"]
+
+    def test_changed_file_rebuilds_its_page(self, tmp_path):
+        _make_site(tmp_path).build()
+        (tmp_path / "main.css").write_text("p { color: blue; }")
+        report = _make_site(tmp_path).build()
+
+        assert report.rebuilt == report.written == ["styled.html"]
+        assert "color: blue" in (tmp_path / "public" / "styled.html").read_text()
+
+    def test_file_read_by_cached_component_rebuilds_every_page(self, tmp_path):
+        css = tmp_path / "theme.css"
+        css.write_text("p { color: red; }")
+
+        def make_site() -> Site:
+            site = Site(tmp_path / "public")
+            site.add("first.html", _themed_page, str(css), "first")
+            site.add("second.html", _themed_page, str(css), "second")
+            return site
+
+        _theme.cache_clear()
+        make_site().build()
+        css.write_text("p { color: blue; }")
+        _theme.cache_clear()
+        report = make_site().build()
+
+        assert report.rebuilt == ["first.html", "second.html"]
+        assert "color: blue" in (tmp_path / "public" / "second.html").read_text()
+
+    def test_changed_data_rebuilds_its_page(self, tmp_path):
+        _make_site(tmp_path).build()
+        site = _make_site(tmp_path)
+        site.data["products"] = ["a", "b", "c"]
+        report = site.build()
+
+        assert report.rebuilt == report.written == ["products.html"]
+
+    def test_same_output_is_not_written(self, tmp_path):
+        _make_site(tmp_path).build()
+        site = _make_site(tmp_path)
+        site.data["products"] = ["c", "d"]
+        report = site.build()
+
+        assert report.rebuilt == ["products.html"]
+        assert report.written == []
+
+    def test_missing_output_is_rebuilt(self, tmp_path):
+        _make_site(tmp_path).build()
+        (tmp_path / "public" / "products.html").unlink()
+        report = _make_site(tmp_path).build()
+
+        assert report.written == ["products.html"]
+
+    def test_force(self, tmp_path):
+        _make_site(tmp_path).build()
+        report = _make_site(tmp_path).build(force=True)
+
+        assert report.rebuilt == ["styled.html", "products.html"]
+        assert report.written == []
+
+    def test_failed_page_is_rebuilt_next_time(self, tmp_path):
+        _make_site(tmp_path).build()
+        site = _make_site(tmp_path)
+        site.data["products"] = None
+
+        with pytest.raises(TypeError):
+            site.build()
+
+        site.data["products"] = ["a", "b"]
+        report = site.build()
+        assert report.skipped == ["styled.html"]
+        assert report.rebuilt == ["products.html"]
+
+    def test_page_decorator(self, tmp_path):
+        site = Site(tmp_path)
+
+        @site.page("index.html")
+        def index() -> html:
+            return html()
+
+        assert site.build().written == ["index.html"]
+        assert (tmp_path / "index.html").read_text() == "<!DOCTYPE html>\n<html>\n</html>\n"
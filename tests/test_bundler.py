@@ -0,0 +1,115 @@
+import importlib
+import sys
+
+import pytest
+
+from html_codegen import (
+    Renderer,
+    body,
+    html,
+)
+from html_codegen.bundler import (
+    Bundle,
+    get_module_source,
+    resolve_module,
+    strip_python_source,
+)
+from html_codegen.tags import pyscript
+
+MODULE_SOURCE = '''"""Module docstring."""
+from browser import document  # comment
+
+
+def attach(label):
+    """Attach a label to every div."""
+    for div in document.select("div"):
+        div.attach(label)
+'''
+
+
+@pytest.fixture
+def module_name(tmp_path, monkeypatch):
+    package = tmp_path / "bundled_scripts"
+    package.mkdir()
+    (package / "widgets.py").write_text(MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return "bundled_scripts.widgets"
+
+
+class TestModuleSource:
+    def test_resolve_module_uses_import_system(self, module_name, tmp_path):
+        assert resolve_module(module_name) == tmp_path / "bundled_scripts" / "widgets.py"
+
+    def test_missing_module(self):
+        assert resolve_module("missing_package.missing_module") is None
+        assert get_module_source("missing_package.missing_module") is None
+
+    def test_package_is_not_imported(self, tmp_path, monkeypatch):
+        package = tmp_path / "brython_package"
+        package.mkdir()
+        (package / "__init__.py").write_text("from browser import document\n")
+        (package / "mod.py").write_text(MODULE_SOURCE)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert resolve_module("brython_package.mod") == package / "mod.py"
+        assert get_module_source("brython_package.mod") == MODULE_SOURCE.strip()
+        assert "brython_package" not in sys.modules
+
+    def test_nested_namespace_packages(self, tmp_path, monkeypatch):
+        package = tmp_path / "namespace_root" / "namespace_child"
+        package.mkdir(parents=True)
+        (package / "mod.py").write_text(MODULE_SOURCE)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert resolve_module("namespace_root.namespace_child.mod") == package / "mod.py"
+        assert "namespace_root" not in sys.modules
+
+    def test_module_has_no_submodules(self, module_name):
+        assert resolve_module(f"{module_name}.attach") is None
+
+    def test_new_module_is_found(self, module_name, tmp_path):
+        assert resolve_module("bundled_scripts.added") is None
+        (tmp_path / "bundled_scripts" / "added.py").write_text("x = 1\n")
+        importlib.invalidate_caches()
+        assert resolve_module("bundled_scripts.added") == tmp_path / "bundled_scripts" / "added.py"
+
+    def test_source_is_cached(self, module_name):
+        assert get_module_source(module_name) is get_module_source(module_name)
+
+    def test_strip_python_source(self):
+        stripped = strip_python_source(MODULE_SOURCE)
+        assert "docstring" not in stripped
+        assert "comment" not in stripped
+        assert "div.attach(label)" in stripped
+        compile(stripped, "<stripped>", "exec")
+
+
+class TestBundle:
+    def test_pyscript_inlines_source_without_bundle(self, module_name):
+        with html(use_brython=True) as doc:
+            with body():
+                pyscript(module_name)
+
+        assert "div.attach(label)" in Renderer(doc).render()
+
+    def test_pyscript_references_bundle_file(self, module_name, tmp_path):
+        bundle = Bundle(tmp_path / "static", url_prefix="/static/")
+        with html(use_brython=True) as doc:
+            with body():
+                script_tag = pyscript(module_name, bundle=bundle)
+
+        url = script_tag._attrs["src"]
+        assert url.startswith("/static/bundled_scripts.widgets.") and url.endswith(".py")
+        assert script_tag.children == []
+        assert f'<script type="text/python" src="{url}">' in Renderer(doc).render()
+        assert (tmp_path / "static" / url.removeprefix("/static/")).read_text() == MODULE_SOURCE.strip()
+
+    def test_bundle_writes_module_once(self, module_name, tmp_path):
+        bundle = Bundle(tmp_path / "static")
+        assert bundle.add(module_name) == bundle.add(module_name)
+        assert len(list((tmp_path / "static").iterdir())) == 1
+
+    def test_stripped_bundle(self, module_name, tmp_path):
+        bundle = Bundle(tmp_path / "static", strip=True)
+        content = (tmp_path / "static" / bundle.add(module_name)).read_text()
+        assert "docstring" not in content
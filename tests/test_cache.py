@@ -0,0 +1,182 @@
+import threading
+
+import pytest
+
+from html_codegen import (
+    RenderCache,
+    Renderer,
+    body,
+    html,
+    p,
+)
+from html_codegen.cache import (
+    CacheBackend,
+    DirectoryBackend,
+    MemoryBackend,
+    SQLiteBackend,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_page(cache: RenderCache):
+    builds = []
+
+    @cache.page
+    def page(slug: str) -> html:
+        builds.append(slug)
+        with html() as doc:
+            with body():
+                p().text(f"{slug} {len(builds)}")
+        return doc
+
+    return page, builds
+
+
+@pytest.fixture(params=["memory", "directory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend(maxsize=2)
+    if request.param == "directory":
+        return DirectoryBackend(tmp_path / "cache", maxsize=2)
+    return SQLiteBackend(tmp_path / "cache.sqlite3", maxsize=2)
+
+
+class TestBackends:
+    def test_roundtrip(self, backend):
+        backend.set("a", 1.5, b"content")
+
+        assert backend.get("a") == (1.5, b"content")
+        assert backend.get("b") is None
+
+    def test_delete_and_clear(self, backend):
+        backend.set("a", 1, b"a")
+        backend.set("b", 1, b"b")
+        backend.delete("a")
+
+        assert backend.get("a") is None
+        backend.clear()
+        assert backend.get("b") is None
+
+    def test_lru_eviction(self, backend):
+        backend.set("a", 1, b"a")
+        backend.set("b", 1, b"b")
+        backend.get("a")
+        backend.set("c", 1, b"c")
+
+        assert backend.get("a") is not None
+        assert backend.get("b") is None
+        assert backend.get("c") is not None
+
+    def test_directory_is_sharded(self, tmp_path):
+        DirectoryBackend(tmp_path, shard_width=3).set("a", 1, b"a")
+
+        (shard,) = tmp_path.iterdir()
+        assert len(shard.name) == 3
+        assert next(shard.iterdir()).name.startswith(shard.name)
+
+    def test_backend_must_implement_every_method(self):
+        class Incomplete(CacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestRenderCache:
+    def test_render_is_cached(self, backend):
+        page, builds = _make_page(RenderCache(backend))
+
+        first = page.render("home")
+        assert page.render("home") == first
+        assert builds == ["home"]
+        assert "home 1" in first
+
+    def test_output_matches_renderer(self):
+        page, _ = _make_page(RenderCache())
+
+        assert page.render_bytes("home") == Renderer(page.builder("home")).render_bytes().replace(b" 2", b" 1")
+
+    def test_key_function(self):
+        cache = RenderCache()
+        builds = []
+
+        @cache.page(key=lambda slug, lang="ru": slug)
+        def page(slug: str, lang: str = "ru") -> html:
+            builds.append(lang)
+            return html()
+
+        page("home", "ru")
+        page("home", "en")
+        assert builds == ["ru"]
+        assert page.key("home") == f"{__name__}.TestRenderCache.test_key_function.<locals>.page:home"
+
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        page, builds = _make_page(RenderCache(ttl=10, clock=clock))
+
+        page.render("home")
+        clock.now += 10
+        page.render("home")
+        clock.now += 1
+        assert "home 2" in page.render("home")
+        assert len(builds) == 2
+
+    def test_stale_while_revalidate(self):
+        clock = _Clock()
+        cache = RenderCache(ttl=10, stale_while_revalidate=20, clock=clock)
+        page, builds = _make_page(cache)
+
+        page.render("home")
+        clock.now += 15
+        assert "home 1" in page.render("home")
+        cache.wait()
+        assert "home 2" in page.render("home")
+
+        clock.now += 40
+        assert "home 3" in page.render("home")
+        cache.close()
+
+    def test_revalidation_runs_in_background(self):
+        clock = _Clock()
+        cache = RenderCache(ttl=10, stale_while_revalidate=20, clock=clock)
+        release = threading.Event()
+        threads = []
+
+        @cache.page
+        def page() -> html:
+            threads.append(threading.current_thread())
+            if len(threads) > 1:
+                release.wait(5)
+            return html()
+
+        page()
+        clock.now += 15
+        page()
+        page()
+        release.set()
+        cache.close()
+
+        assert len(threads) == 2
+        assert threads[1] is not threading.current_thread()
+
+    def test_invalidate(self):
+        page, builds = _make_page(RenderCache())
+
+        page.render("home")
+        page.invalidate("home")
+        page.render("home")
+        assert len(builds) == 2
+
+    def test_save(self, tmp_path):
+        page, _ = _make_page(RenderCache())
+
+        path = page.save(tmp_path / "index.html", "home")
+        assert path.read_bytes() == page.render_bytes("home")
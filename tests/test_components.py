@@ -0,0 +1,160 @@
+import pytest
+
+from html_codegen import (
+    Fragment,
+    Renderer,
+    body,
+    component,
+    div,
+    html,
+    li,
+    p,
+    span,
+    ul,
+)
+from html_codegen.exceptions import SharedNodeError
+
+
+def _card_tree(title: str, price: int) -> div:
+    with div(attrs={"class": "card"}) as result:
+        p().text(title)
+        span(attrs={"class": "price"}).text(f"{price}\n$")
+
+    return result
+
+
+def _make_card(maxsize: int = 1024):
+    calls = []
+
+    @component(maxsize=maxsize)
+    def card(title: str, price: int) -> div:
+        calls.append((title, price))
+        return _card_tree(title, price)
+
+    return card, calls
+
+
+def _render_list(make_item) -> html:
+    with html() as doc:
+        with body():
+            with ul():
+                for index in range(3):
+                    with li():
+                        make_item("Товар", index % 2)
+            make_item("Товар", 0)
+
+    return doc
+
+
+class TestComponentRender:
+    def test_render_matches_inline_subtree(self):
+        card, _ = _make_card()
+
+        expected = Renderer(_render_list(_card_tree)).render()
+        assert Renderer(_render_list(card)).render() == expected
+
+    def test_render_bytes_and_indent(self):
+        card, _ = _make_card()
+
+        inline, cached = _render_list(_card_tree), _render_list(card)
+        assert Renderer(cached, 4).render() == Renderer(inline, 4).render()
+        assert Renderer(cached).render_bytes() == Renderer(inline).render_bytes()
+
+    def test_stats_rendered_bytes(self):
+        card, _ = _make_card()
+        doc = _render_list(card)
+
+        assert doc.stats().rendered_bytes == len(Renderer(doc).render_bytes())
+
+    def test_nested_components(self):
+        card, _ = _make_card()
+
+        @component
+        def row(title: str) -> div:
+            with div() as result:
+                card(title, 1)
+                card(title, 2)
+            return result
+
+        @component
+        def row_inline(title: str) -> div:
+            with div() as result:
+                _card_tree(title, 1)
+                _card_tree(title, 2)
+            return result
+
+        assert (
+            Renderer(_render_list(lambda title, _: row(title))).render()
+            == Renderer(_render_list(lambda title, _: row_inline(title))).render()
+        )
+
+    def test_fragment_is_added_to_with_block(self):
+        card, _ = _make_card()
+
+        with div() as parent:
+            fragment = card("Товар", 1)
+
+        assert isinstance(fragment, Fragment)
+        assert parent.children == [fragment]
+        assert fragment.parent is parent
+        assert fragment.source.children[0].parent is fragment.source
+
+    def test_fragment_cannot_have_children(self):
+        card, _ = _make_card()
+
+        with pytest.raises(SharedNodeError):
+            card("Товар", 1).add_node(p())
+
+
+class TestComponentCache:
+    def test_builds_once_per_props(self):
+        card, calls = _make_card()
+        _render_list(card)
+
+        assert calls == [("Товар", 0), ("Товар", 1)]
+        assert card.cache_info() == (2, 2, 1024, 2)
+
+    def test_keyword_props_and_types(self):
+        card, calls = _make_card()
+        card(title="Товар", price=1)
+        card(price=1, title="Товар")
+        card(title="Товар", price=True)
+
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        card, calls = _make_card(maxsize=2)
+        card("a", 1)
+        card("b", 1)
+        card("a", 1)
+        card("c", 1)
+        card("b", 1)
+
+        assert [title for title, _ in calls] == ["a", "b", "c", "b"]
+        assert card.cache_info().currsize == 2
+
+    def test_invalidate_and_clear(self):
+        card, calls = _make_card()
+        card("a", 1)
+
+        assert card.invalidate("a", 1)
+        assert not card.invalidate("a", 1)
+        card("a", 1)
+        assert len(calls) == 2
+
+        card.cache_clear()
+        assert card.cache_info() == (0, 0, 1024, 0)
+
+    def test_unhashable_props(self):
+        card, _ = _make_card()
+
+        with pytest.raises(TypeError):
+            card(["Товар"], 1)
+
+    def test_builder_must_return_element(self):
+        @component
+        def nothing():
+            return None
+
+        with pytest.raises(TypeError):
+            nothing()
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from html_codegen import HTML, HTMLNode, html, head, body, div, p, text
@@ -51,6 +54,33 @@ class TestText:
         t = text("Hello World")
         assert t._attrs.get("text") == "Hello World"
 
+    def test_text_attributes_can_be_set(self):
+        from html_codegen import Renderer
+
+        t = text("Hello")
+        t._attrs["data-note"] = "kept"
+        t._attrs["text"] = "Changed"
+
+        assert t.content == "Changed"
+        assert t._attrs == {"text": "Changed", "data-note": "kept"}
+        assert Renderer(t).render() == "  Changed"
+
+        t.content = "Again"
+        assert t._attrs["text"] == "Again"
+        assert t.clone()._attrs == {"text": "Again", "data-note": "kept"}
+
+    def test_text_attributes_survive_pickling(self):
+        import pickle
+
+        t = text("Hello")
+        t._attrs["data-note"] = "kept"
+        copy = pickle.loads(pickle.dumps(t))
+        copy._attrs["text"] = "Changed"
+
+        assert copy.content == "Changed"
+        assert copy._attrs["data-note"] == "kept"
+        assert t.content == "Hello"
+
     def test_text_is_text(self):
         t = text("Hello")
         assert t.is_text is True
@@ -60,6 +90,47 @@ class TestText:
         with pytest.raises(TextNodeNestingError):
             t.add_node(HTMLNode())
 
+    def test_text_stores_only_content(self):
+        t = text("Hello")
+        assert t.content == "Hello"
+        assert t.__dict__ == {"content": "Hello"}
+
+    def test_string_child_renders_as_text(self):
+        from html_codegen import Renderer
+
+        with_string = div()
+        with_string.add_node("Hello\nWorld")
+        with_text = div()
+        with_text.add_node(text("Hello\nWorld"))
+
+        assert with_string.children[0].is_text
+        assert with_string.children[0].parent is with_string
+        assert Renderer(with_string).render() == Renderer(with_text).render()
+
+    def test_string_child_is_not_added_to_context(self):
+        with div() as parent:
+            child = p()
+            parent.add_node("tail")
+
+        # nodes of the with block are added when it exits
+        assert [node.tag_name for node in parent.children] == ["", "p"]
+        assert child.parent is parent
+
+    def test_text_clone_and_pickle(self):
+        import pickle
+
+        from html_codegen import Renderer
+
+        with div() as parent:
+            text("Hello", reindent=False)
+        parent.add_node("World")
+
+        copies = [parent.clone(), pickle.loads(pickle.dumps(parent)), parent.share()]
+        for copy in copies:
+            assert Renderer(copy).render() == Renderer(parent).render()
+        assert copies[0].children[0].parent is copies[0]
+        assert copies[0].children[0].reindent is False
+
 
 class TestSingleTag:
     def test_single_tag_is_single(self):
@@ -113,3 +184,388 @@ class TestExceptions:
             parent2.add_node(child)
         
         assert "already has parent" in str(exc_info.value)
+
+
+class TestSharedNode:
+    def test_shared_node_under_many_parents(self):
+        from html_codegen import Renderer
+        from html_codegen.tags import span
+
+        icon = span(attrs={"class": "icon"}).share()
+        outer, inner = div(), div()
+        outer.add_node(inner)
+        outer.add_node(icon)
+        inner.add_node(icon)
+
+        assert icon.parent is None
+        assert outer.children[1] is inner.children[0] is icon
+        assert Renderer(outer).render() == (
+            '<!DOCTYPE html>\n<div>\n'
+            '  <div>\n    <span class="icon">\n    </span>\n\n  </div>\n'
+            '  <span class="icon">\n  </span>\n\n</div>\n'
+        )
+
+    def test_shared_node_created_in_with_block(self):
+        from html_codegen import Renderer
+        from html_codegen.tags import span
+
+        with div() as outer:
+            icon = span(attrs={"class": "icon"}).share()
+            with div() as inner:
+                inner.add_node(icon)
+            outer.add_node(icon)
+
+        assert outer.children == [icon, inner]
+        assert Renderer(outer).render().count('<span class="icon">') == 2
+
+    def test_shared_node_is_immutable(self):
+        from html_codegen import SharedNodeError
+
+        shared = div(attrs={"class": "icon"})
+        shared.p()
+        shared.share()
+
+        with pytest.raises(SharedNodeError):
+            shared.add_node(p())
+        with pytest.raises(SharedNodeError):
+            shared.children[0].add_node(text("x"))
+        with pytest.raises(SharedNodeError):
+            shared._attrs["id"] = "icon"
+
+    def test_node_with_parent_cannot_be_shared(self):
+        parent = div()
+        child = parent.p()
+        with pytest.raises(NodeAlreadyHasParentError):
+            child.share()
+
+    def test_parent_dependent_tag_cannot_be_shared(self):
+        from html_codegen import SharedNodeError
+
+        with pytest.raises(SharedNodeError):
+            body().share()
+
+
+class TestClone:
+    def _build_tree(self):
+        with html() as doc:
+            with body():
+                with div(attrs={"class": "row"}) as row:
+                    p().text("Hello")
+                    p().text("World")
+        return doc, row
+
+    def test_clone_copies_subtree_only(self):
+        from html_codegen import Renderer
+
+        doc, row = self._build_tree()
+        copy = row.clone()
+
+        assert copy.parent is None
+        assert copy is not row
+        assert copy.children[0] is not row.children[0]
+        assert copy.children[0].parent is copy
+        assert repr(copy) == repr(row)
+        assert Renderer(doc.clone()).render() == Renderer(doc).render()
+
+    def test_clone_is_independent(self):
+        doc, row = self._build_tree()
+        copy = row.clone()
+        copy._attrs["id"] = "copy"
+        copy.p()
+
+        assert "id" not in row._attrs
+        assert len(row.children) == 2
+        assert len(copy.children) == 3
+
+    def test_shallow_clone_has_no_children(self):
+        doc, row = self._build_tree()
+        assert row.clone(deep=False).children == []
+
+    def test_clone_can_be_added_to_another_parent(self):
+        doc, row = self._build_tree()
+        doc.children[0].add_node(row.clone())
+        assert len(doc.children[0].children) == 2
+
+    def test_clone_references_shared_nodes(self):
+        shared = p().share()
+        parent = div()
+        parent.add_node(shared)
+        assert parent.clone().children[0] is shared
+
+    def test_deepcopy_uses_clone(self):
+        import copy
+
+        doc, row = self._build_tree()
+        copied = copy.deepcopy(row)
+        assert copied.parent is None
+        assert len(copied.children) == 2
+        assert len(row.children) == 2
+
+
+def _deep_tree(depth: int) -> div:
+    root = node = div()
+    for _ in range(depth):
+        child = div()
+        node.add_node(child)
+        node = child
+    node.add_node("leaf")
+    return root
+
+
+class TestTraversal:
+    def _build_tree(self):
+        with div() as root:
+            with div(attrs={"class": "first"}) as first:
+                p().text("one")
+                p().text("two")
+            with div(attrs={"class": "second"}):
+                p().text("three")
+        return root, first
+
+    @staticmethod
+    def _names(nodes) -> list[str]:
+        return [node.content if node.is_text else node.tag_name for node in nodes]
+
+    def test_pre_order(self):
+        root, _ = self._build_tree()
+        assert self._names(root.walk()) == ["div", "div", "p", "one", "p", "two", "div", "p", "three"]
+
+    def test_post_order(self):
+        root, _ = self._build_tree()
+        assert self._names(root.walk(order="post")) == ["one", "p", "two", "p", "div", "three", "p", "div", "div"]
+
+    @pytest.mark.parametrize("order", ["pre", "post"])
+    def test_pruned_subtree_is_skipped(self, order):
+        root, first = self._build_tree()
+        nodes = list(root.walk(order, prune=lambda node: node is first))
+
+        assert first in nodes
+        assert first.children[0] not in nodes
+        assert self._names(nodes)[-3:] == (["div", "p", "three"] if order == "pre" else ["p", "div", "div"])
+
+    def test_unknown_order_is_rejected(self):
+        with pytest.raises(ValueError):
+            div().walk("level")
+
+    def test_descendants_exclude_node(self):
+        root, first = self._build_tree()
+        first_p, second_p = first.children
+        assert list(first.descendants()) == [first_p, first_p.children[0], second_p, second_p.children[0]]
+        assert list(root.descendants(prune=lambda node: True)) == root.children
+
+    def test_ancestors(self):
+        root, first = self._build_tree()
+        assert list(first.children[0].children[0].ancestors()) == [first.children[0], first, root]
+        assert list(root.ancestors()) == []
+
+    def test_iter_text(self):
+        root, first = self._build_tree()
+        assert list(root.iter_text()) == ["one", "two", "three"]
+        assert list(first.children[1].children[0].iter_text()) == ["two"]
+
+    def test_deep_tree_is_walked_without_recursion(self):
+        root = _deep_tree(sys.getrecursionlimit() * 10)
+
+        assert sum(1 for _ in root.walk(order="post")) == sys.getrecursionlimit() * 10 + 2
+        assert list(root.iter_text()) == ["leaf"]
+        root.validate()
+
+
+class TestConcurrentConstruction:
+    @staticmethod
+    def _build(number: int):
+        from html_codegen.core import _build_state
+
+        with html() as doc:
+            with head():
+                pass
+            with body():
+                for index in range(number % 7):
+                    with div(attrs={"id": f"{number}-{index}"}):
+                        p().text(str(number))
+
+        return doc, _build_state.get()
+
+    def test_thousands_of_documents_in_thread_pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(self._build, range(2000)))
+
+        for number, (doc, state) in enumerate(results):
+            assert state is None
+            assert [child.tag_name for child in doc.children] == ["head", "body"]
+
+            divs = doc.children[1].children
+            assert [tag._attrs["id"] for tag in divs] == [f"{number}-{index}" for index in range(number % 7)]
+            assert all(tag.children[0].children[0]._attrs["text"] == str(number) for tag in divs)
+
+    def test_state_is_released_after_outermost_with(self):
+        from html_codegen.core import _build_state
+
+        with html():
+            with body():
+                assert len(_build_state.get().stack) == 2
+
+        assert _build_state.get() is None
+
+    def test_state_is_released_after_error(self):
+        from html_codegen.core import _build_state
+
+        with pytest.raises(ZeroDivisionError):
+            with html():
+                with body():
+                    1 / 0
+
+        assert _build_state.get() is None
+
+
+class TestDeferredCallbacks:
+    def test_duplicate_tag_error_is_raised(self):
+        with pytest.raises(DuplicateTagError):
+            with html():
+                head()
+                head()
+
+    def test_brython_error_is_raised(self):
+        from html_codegen.tags import pyscript
+
+        with pytest.raises(BrythonNotEnabledError):
+            with html():
+                with body():
+                    pyscript("missing.module")
+
+    def test_callbacks_run_once_in_creation_order(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            div, "_execute_parent_callback", lambda self: calls.append(self._attrs["id"]), raising=False
+        )
+
+        with html():
+            with body():
+                div(attrs={"id": "first"})
+                with div(attrs={"id": "second"}):
+                    div(attrs={"id": "nested"})
+                div(attrs={"id": "third"})
+
+        assert calls == ["nested", "first", "second", "third"]
+
+    def test_callback_runs_when_its_block_exits(self):
+        with html(use_brython=True) as doc:
+            outer = body()
+            doc.add_node(outer)
+            with div():
+                pass
+            assert "onload" not in outer._attrs
+
+        assert outer._attrs["onload"] == "brython()"
+
+    def test_collect_errors(self):
+        from html_codegen.core import collect_errors
+        from html_codegen.tags import pyscript
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            with collect_errors():
+                with html():
+                    head()
+                    head()
+                    with body():
+                        pyscript("missing.module")
+
+        errors = exc_info.value.exceptions
+        assert [type(error) for error in errors] == [BrythonNotEnabledError, DuplicateTagError, DuplicateTagError]
+
+
+class TestTrustedBuild:
+    def test_trusted_build_skips_validation(self):
+        from html_codegen.core import trusted
+
+        with trusted():
+            with html() as doc:
+                head()
+                head()
+
+        assert [child.tag_name for child in doc.children] == ["head", "head"]
+
+    def test_text_cannot_have_children_in_trusted_build(self):
+        from html_codegen.core import trusted
+
+        with trusted():
+            with pytest.raises(TextNodeNestingError):
+                text("a").add_node(text("b"))
+
+    def test_trusted_build_keeps_parent_effects(self):
+        from html_codegen.core import trusted
+
+        with trusted():
+            with html(use_brython=True) as doc:
+                head()
+                body()
+
+        assert doc.children[1]._attrs["onload"] == "brython()"
+        assert [child._attrs["src"] for child in doc.children[0].children][0].endswith("brython.min.js")
+
+    def test_validate_valid_tree(self):
+        with html(use_brython=True) as doc:
+            head()
+            with body():
+                div().p().text("Hello")
+
+        doc.validate()
+
+    def test_validate_finds_skipped_errors(self):
+        from html_codegen.core import trusted
+
+        with trusted():
+            with html() as doc:
+                head()
+                head()
+
+        with pytest.raises(DuplicateTagError):
+            doc.validate()
+
+    def test_validate_collects_errors(self):
+        from html_codegen.core import collect_errors, trusted
+        from html_codegen.tags import img
+
+        with trusted():
+            with html() as doc:
+                head()
+                head()
+                img().add_node(p())
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            with collect_errors():
+                doc.validate()
+
+        assert sorted(type(error).__name__ for error in exc_info.value.exceptions) == [
+            "DuplicateTagError",
+            "DuplicateTagError",
+            "SingleTagNestingError",
+        ]
+
+
+class TestLazyImport:
+    def test_import_does_not_load_tag_modules(self):
+        code = (
+            "import sys, html_codegen; "
+            "print(sorted(name for name in sys.modules if name.startswith('html_codegen.')))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        assert "html_codegen.tags.text_" not in output
+        assert "html_codegen.renderer" not in output
+        assert "html_codegen.output" not in output
+
+    def test_tags_are_loaded_on_access(self):
+        import html_codegen
+        from html_codegen.tags import text_
+
+        assert html_codegen.span is text_.span
+        assert "span" in dir(html_codegen)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import html_codegen
+
+        with pytest.raises(AttributeError):
+            html_codegen.no_such_tag
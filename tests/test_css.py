@@ -0,0 +1,141 @@
+import os
+
+from html_codegen import (
+    body,
+    component,
+    div,
+    head,
+    html,
+    p,
+    span,
+    style,
+)
+from html_codegen.css import (
+    Stylesheet,
+    parse_stylesheet,
+    prune_unused_css,
+)
+
+CSS = """
+/* layout */
+body { margin: 0; }
+.card, .unused { padding: 1px; }
+.missing > p { color: red; }
+#main p:not(.absent) { color: blue; }
+:is(.absent, .other) span { color: green; }
+a[href$=".pdf"]::after { content: "{pdf}"; }
+.md\\:flex { display: flex; }
+@import url("fonts.css");
+@font-face { font-family: x; src: url(x.woff); }
+@media (max-width: 600px) {
+  .card { padding: 0; }
+  .missing { display: none; }
+}
+@media print {
+  .missing { display: none; }
+}
+"""
+
+
+def _prune(css: str, tags=(), classes=(), ids=()) -> str:
+    return Stylesheet(css).prune(set(tags), set(classes), set(ids))
+
+
+class TestStylesheet:
+    def test_unused_rules_are_removed(self):
+        result = _prune(CSS, tags={"body", "p", "span"}, classes={"card"}, ids={"main"})
+
+        assert "body { margin: 0; }" in result
+        assert ".card, .unused" in result
+        assert ".missing" not in result
+        assert "#main p:not(.absent)" in result
+        assert "layout" not in result
+
+    def test_pseudo_class_arguments_do_not_remove(self):
+        result = _prune(CSS, tags={"span"})
+
+        assert ":is(.absent, .other) span" in result
+        assert "#main" not in result
+
+    def test_unparsed_rules_are_kept(self):
+        result = _prune(CSS)
+
+        assert 'content: "{pdf}"' not in result
+        assert ".md\\:flex" in result
+        assert '@import url("fonts.css");' in result
+        assert "@font-face" in result
+
+    def test_media_rules_are_pruned(self):
+        result = _prune(CSS, classes={"card"})
+
+        assert "@media (max-width: 600px) {\n.card { padding: 0; }\n}" in result
+        assert "@media print" not in result
+
+    def test_non_ascii_names(self):
+        css = ".élan { color: red; }\n#naïve { color: blue; }"
+
+        assert _prune(css, classes={"élan"}, ids={"naïve"}) == css
+        assert _prune(css, tags={"lan"}) == ""
+
+    def test_commas_in_attribute_selectors(self):
+        css = "a[href=\"x,y\"] { color: red; }\na[title='a,]b'] { color: blue; }"
+
+        assert _prune(css, tags={"a"}) == css
+        assert _prune(css) == ""
+
+
+class TestParseStylesheet:
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text(".a { color: red; }")
+        first = parse_stylesheet(path)
+
+        assert parse_stylesheet(str(path)) is first
+
+        path.write_text(".b { color: blue; }")
+        os.utime(path, ns=(1, 1))
+        assert parse_stylesheet(path).prune(set(), {"b"}, set()) == ".b { color: blue; }"
+
+
+class TestPruneUnusedCss:
+    def _build(self, css_path: str, content) -> html:
+        with html() as doc:
+            with head():
+                style(css_path)
+            with body():
+                content()
+        return doc
+
+    def test_prunes_inlined_style(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text(CSS)
+        doc = self._build(str(path), lambda: div(attrs={"class": "card extra"}).text("x"))
+        inlined = doc.children[0].children[0].children[0]
+        before = len(inlined._attrs["text"])
+
+        removed = prune_unused_css(doc)
+
+        assert removed == before - len(inlined._attrs["text"]) > 0
+        assert ".card, .unused" in inlined._attrs["text"]
+        assert ".missing" not in inlined._attrs["text"]
+
+    def test_fragment_elements_count_as_used(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text(".card { padding: 1px; }\n.other { padding: 2px; }")
+
+        @component
+        def card() -> div:
+            with div(attrs={"class": "card"}) as result:
+                span().text("x")
+            return result
+
+        doc = self._build(str(path), card)
+        prune_unused_css(doc)
+
+        assert doc.children[0].children[0].children[0]._attrs["text"] == ".card { padding: 1px; }"
+
+    def test_nothing_to_prune(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text("p { margin: 0; }")
+
+        assert prune_unused_css(self._build(str(path), lambda: p().text("x"))) == 0
@@ -0,0 +1,123 @@
+import threading
+
+from html_codegen import (
+    InternPool,
+    Renderer,
+    div,
+    intern_strings,
+    p,
+    span,
+    text,
+)
+
+
+def _copy(value: str) -> str:
+    # equal string that is a different object, as read from a file or a database
+    return "".join(list(value))
+
+
+def _build_list(labels: list[str]) -> div:
+    with div() as result:
+        for label in labels:
+            span(attrs={"class": _copy("label status"), "data-count": 1})
+            p(attrs={"class": _copy("row")}).text(_copy(label))
+
+    return result
+
+
+class TestInternPool:
+    def test_equal_values_are_identical(self):
+        pool = InternPool()
+        first, second = _copy("status"), _copy("status")
+
+        assert first is not second
+        assert pool.intern(first) is pool.intern(second) is first
+        assert pool.info() == (1, 1, 65536, 1)
+
+    def test_full_pool_keeps_new_values(self):
+        pool = InternPool(maxsize=1)
+        pool.intern("first")
+        second = _copy("second")
+
+        assert pool.intern(second) is second
+        assert pool.intern(_copy("first")) == "first"
+        assert pool.info().currsize == 1
+
+    def test_long_values_are_not_pooled(self):
+        pool = InternPool(max_length=4)
+        pool.intern("longer")
+        assert pool.info().currsize == 0
+
+    def test_attributes_share_fragment(self):
+        pool = InternPool()
+        first = pool.attributes({"class": _copy("row"), "id": _copy("main")})
+        second = pool.attributes({"class": _copy("row"), "id": _copy("main")})
+
+        assert first is not second
+        assert first["class"] is second["class"]
+        assert first.fragment_bytes is second.fragment_bytes
+        assert first.fragment == ' class="row" id="main"'
+
+    def test_changed_attributes_are_not_shared(self):
+        pool = InternPool()
+        first = pool.attributes({"class": "row"})
+        first["class"] = "changed"
+
+        assert pool.attributes({"class": "row"}).fragment == ' class="row"'
+        assert first.fragment == ' class="changed"'
+
+    def test_non_string_values_keep_their_type(self):
+        pool = InternPool()
+        assert pool.attributes({"value": 1}).fragment == ' value="1"'
+        assert pool.attributes({"value": True}).fragment == ' value="True"'
+
+    def test_clear_resets_statistics(self):
+        pool = InternPool()
+        pool.intern("value")
+        pool.intern("value")
+        pool.clear()
+        assert pool.info() == (0, 0, 65536, 0)
+
+
+class TestInterning:
+    def test_nodes_use_pooled_values(self):
+        with intern_strings() as pool:
+            first = p(attrs={"class": _copy("row")})
+            second = p(attrs={"class": _copy("row")})
+            with div() as parent:
+                text(_copy("Hello"))
+            parent.add_node(_copy("Hello"))
+
+        assert first._attrs["class"] is second._attrs["class"]
+        assert parent.children[0].content is parent.children[1].content
+        assert pool.info().hits == 2
+
+    def test_render_is_unchanged(self):
+        labels = ["Новый", "Оплачен", "Новый"]
+        with intern_strings():
+            interned = _build_list(labels)
+
+        assert Renderer(interned).render() == Renderer(_build_list(labels)).render()
+        assert Renderer(interned).render_bytes() == Renderer(_build_list(labels)).render_bytes()
+
+    def test_values_outside_block_are_not_pooled(self):
+        with intern_strings() as pool:
+            pass
+
+        p(attrs={"class": "row"}).text("Hello")
+        assert pool.info() == (0, 0, 65536, 0)
+
+    def test_pool_can_be_shared_by_threads(self):
+        pool = InternPool()
+
+        def build() -> None:
+            with intern_strings(pool):
+                _build_list(["Новый"] * 50)
+
+        threads = [threading.Thread(target=build) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pool.info().currsize == 3  # "label status", "row" and "Новый"
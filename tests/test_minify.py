@@ -0,0 +1,141 @@
+import textwrap
+
+from html_codegen import (
+    Renderer,
+    body,
+    div,
+    head,
+    html,
+    script,
+    style,
+    text,
+)
+from html_codegen.css import prune_unused_css
+from html_codegen.minify import (
+    minify_css,
+    minify_js,
+)
+from html_codegen.tags import pyscript
+
+CSS = """
+/* layout */
+body {
+    margin : 0;
+}
+
+a > b, .x  :hover {
+    content: "a  /* kept */ ;}";
+    width: calc(1px + 2px);
+}
+
+@media (min-width: 600px) {
+    .card { color: red; }
+}
+"""
+
+JS = """
+// comment
+const a = 1; /* block
+comment */ let re = /\\/\\*[a/]*/g;
+
+function f(x) {
+    return /ab+c/.test(x) ? `line
+    ${ "x" + `}` }  kept` : a / 2 / 3;
+}
+const s = "// not a comment";
+"""
+
+
+class TestMinifyCss:
+    def test_comments_and_whitespace_removed(self):
+        assert minify_css(CSS) == (
+            'body{margin :0}a>b,.x :hover{content:"a  /* kept */ ;}";width:calc(1px + 2px)}'
+            "@media (min-width:600px){.card{color:red}}"
+        )
+
+    def test_cached_by_content(self):
+        minify_css.cache_clear()
+        minify_css(CSS)
+        minify_css("".join(CSS))
+
+        assert minify_css.cache_info().hits == 1
+
+
+class TestMinifyJs:
+    def test_comments_and_indentation_removed(self):
+        assert minify_js(JS) == textwrap.dedent(
+            """\
+            const a = 1; let re = /\\/\\*[a/]*/g;
+            function f(x) {
+            return /ab+c/.test(x) ? `line
+                ${ "x" + `}` }  kept` : a / 2 / 3;
+            }
+            const s = "// not a comment";"""
+        )
+
+    def test_line_breaks_are_kept(self):
+        assert minify_js("a = b\n\n  ++c") == "a = b\n++c"
+
+    def test_regex_after_condition(self):
+        assert minify_js("if (f(a)) /re  x/.test(b)") == "if (f(a)) /re  x/.test(b)"
+        assert minify_js("x = (a  +  b) /  2") == "x = (a + b) / 2"
+
+    def test_division_after_increment(self):
+        source = 'x = i++ / 2; s = "/"; t = "// keep";\ny = i-- /  2'
+
+        assert minify_js(source) == 'x = i++ / 2; s = "/"; t = "// keep";\ny = i-- / 2'
+
+
+class TestMinifiedTags:
+    def test_style_is_written_without_indentation(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text(CSS)
+        with html() as doc:
+            with head():
+                style(str(path), minify=True)
+
+        output = Renderer(doc).render()
+        assert "<style>\n" + minify_css(CSS) + "\n    </style>" in output
+        assert doc.stats().rendered_bytes == len(output.encode())
+
+    def test_script_is_written_without_indentation(self, tmp_path):
+        path = tmp_path / "main.js"
+        path.write_text(JS)
+        with html() as doc:
+            with body():
+                script(str(path), minify=True)
+
+        assert "<script>\n" + minify_js(JS) + "\n    </script>" in Renderer(doc).render()
+        assert Renderer(doc).render_bytes() == Renderer(doc).render().encode()
+
+    def test_pyscript_is_stripped(self, tmp_path, monkeypatch):
+        (tmp_path / "minified_module.py").write_text('"""Docstring."""\nif True:\n    x = 1  # comment\n')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        with html(use_brython=True) as doc:
+            with body():
+                pyscript("minified_module", minify=True)
+
+        assert '<script type="text/python">\nif True:\n    x = 1\n    </script>' in Renderer(doc).render()
+
+    def test_raw_text_node(self):
+        node = text("a\n  b", reindent=False)
+
+        with div() as parent:
+            parent.add_node(node)
+
+        assert Renderer(parent).get_inner_html(parent) == "a\n  b"
+        assert Renderer(node).render() == "a\n  b"
+
+    def test_pruned_style_stays_minified(self, tmp_path):
+        path = tmp_path / "main.css"
+        path.write_text(CSS)
+        with html() as doc:
+            with head():
+                style(str(path), minify=True)
+            with body():
+                div(attrs={"class": "card"})
+
+        prune_unused_css(doc)
+        assert doc.children[0].children[0].children[0]._attrs["text"] == (
+            "body{margin :0}@media (min-width:600px){.card{color:red}}"
+        )
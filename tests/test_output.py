@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from html_codegen import (
+    Renderer,
+    body,
+    html,
+    p,
+    save_many,
+)
+from html_codegen.output import (
+    BufferSink,
+    MmapSink,
+    atomic_write,
+)
+
+
+def _build_page(number: int) -> html:
+    with html() as doc:
+        with body():
+            p().text(f"page {number}")
+
+    return doc
+
+
+class TestSave:
+    def test_relative_path_is_kept(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = _build_page(1).save("pages/first.html")
+
+        assert path == tmp_path / "pages" / "first.html"
+        assert path.read_text() == Renderer(_build_page(1)).render()
+
+    def test_absolute_path(self, tmp_path):
+        path = _build_page(1).save(tmp_path / "index.html", buffer_size=16)
+        assert path.read_bytes() == Renderer(_build_page(1)).render_bytes()
+
+    def test_no_temporary_files_left(self, tmp_path):
+        _build_page(1).save(tmp_path / "index.html")
+        assert os.listdir(tmp_path) == ["index.html"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX only")
+    def test_file_mode_follows_umask(self, tmp_path):
+        umask = os.umask(0o027)
+        try:
+            path = _build_page(1).save(tmp_path / "index.html")
+        finally:
+            os.umask(umask)
+        assert path.stat().st_mode & 0o777 == 0o640
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        target = tmp_path / "index.html"
+        target.write_text("previous")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(target) as file:
+                file.write(b"partial")
+                raise RuntimeError
+
+        assert target.read_text() == "previous"
+        assert os.listdir(tmp_path) == ["index.html"]
+
+
+class TestSinks:
+    def test_buffer_sink_grows(self):
+        sink = BufferSink(initial_size=8)
+        Renderer(_build_page(1)).render_into(sink)
+
+        assert sink.getbuffer() == Renderer(_build_page(1)).render_bytes()
+
+    def test_buffer_sink_clear_keeps_capacity(self):
+        sink = BufferSink(initial_size=8)
+        Renderer(_build_page(1)).render_into(sink)
+        sink.clear()
+        Renderer(_build_page(2)).render_into(sink)
+
+        assert sink.getbuffer() == Renderer(_build_page(2)).render_bytes()
+
+    def test_mmap_sink(self, tmp_path):
+        path = tmp_path / "page.html"
+        with open(path, "w+b") as file:
+            with MmapSink(file, initial_size=16) as sink:
+                Renderer(_build_page(1)).render_into(sink)
+                with sink.getbuffer() as view:
+                    assert view == Renderer(_build_page(1)).render_bytes()
+
+        assert path.read_bytes() == Renderer(_build_page(1)).render_bytes()
+
+    def test_save_with_memory_map(self, tmp_path):
+        path = _build_page(1).save(tmp_path / "index.html", buffer_size=16, memory_map=True)
+        assert path.read_bytes() == Renderer(_build_page(1)).render_bytes()
+        assert os.listdir(tmp_path) == ["index.html"]
+
+
+class TestSaveMany:
+    def test_save_many_writes_every_page(self, tmp_path):
+        pages = [(_build_page(number), tmp_path / f"{number}.html") for number in range(20)]
+        paths = save_many(pages)
+
+        assert paths == [path for _, path in pages]
+        for number, path in enumerate(paths):
+            assert path.read_text() == Renderer(_build_page(number)).render()
+
+    def test_save_many_raises_write_errors(self, tmp_path):
+        (tmp_path / "taken").write_text("file, not a directory")
+        pages = [(_build_page(1), tmp_path / "taken" / "index.html")]
+
+        with pytest.raises(OSError):
+            save_many(pages)
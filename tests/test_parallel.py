@@ -0,0 +1,116 @@
+import io
+import multiprocessing
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import pytest
+
+from html_codegen import (
+    ParallelRenderer,
+    Renderer,
+    body,
+    component,
+    div,
+    head,
+    html,
+    p,
+    table,
+    tbody,
+    td,
+    tr,
+)
+from html_codegen.transforms import (
+    Transforms,
+    add_noopener,
+)
+
+
+@component
+def _badge(label: str) -> div:
+    with div(attrs={"class": "badge"}) as result:
+        p().text(label)
+    return result
+
+
+def _build_report(rows: int = 200) -> html:
+    with html() as doc:
+        head()
+        with body():
+            p().text("Report")
+            with table():
+                with tbody():
+                    for index in range(rows):
+                        with tr(attrs={"class": "row"}):
+                            td().text(f"cell {index}\nsecond line")
+                            with td():
+                                _badge(str(index % 3))
+            p().text("End")
+
+    return doc
+
+
+class TestSplit:
+    def test_bulk_element_is_split(self):
+        path, container, bounds = ParallelRenderer(_build_report(), workers=2, min_nodes=10)._split()
+
+        assert path == [1, 1, 0]
+        assert container.tag_name == "tbody"
+        assert len(bounds) == 8
+        assert bounds[0][0] == 0
+        assert bounds[-1][1] == 200
+        assert all(previous[1] == following[0] for previous, following in zip(bounds, bounds[1:]))
+
+    def test_small_document_is_not_split(self):
+        assert ParallelRenderer(_build_report(), workers=2)._split() is None
+
+    def test_single_worker_is_not_split(self):
+        assert ParallelRenderer(_build_report(), workers=1, min_nodes=10)._split() is None
+
+
+class TestParallelRender:
+    @pytest.mark.parametrize("html_indent", [2, 0])
+    def test_forked_output_matches_sequential(self, html_indent):
+        doc = _build_report()
+        expected = Renderer(doc, html_indent).render_bytes()
+        assert ParallelRenderer(doc, html_indent, workers=2, min_nodes=10).render_bytes() == expected
+
+    def test_pickled_output_matches_sequential(self):
+        doc = _build_report()
+        context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            output = ParallelRenderer(doc, workers=2, executor=executor, min_nodes=10).render()
+
+        assert output == Renderer(doc).render()
+
+    def test_subtree_keeps_its_depth(self):
+        subtree = _build_report().children[1].children[1]
+        with ThreadPoolExecutor(2) as executor:
+            output = ParallelRenderer(subtree, workers=2, executor=executor, min_nodes=10).render()
+
+        assert output == Renderer(subtree).render()
+
+    def test_transforms_are_applied(self):
+        transforms = Transforms()
+        transforms.add("tr", add_noopener)
+        doc = _build_report()
+
+        with ThreadPoolExecutor(2) as executor:
+            output = ParallelRenderer(doc, transforms=transforms, workers=2, executor=executor, min_nodes=10).render()
+
+        assert output == Renderer(doc, transforms=transforms).render()
+
+    def test_stream_yields_chunks_in_order(self):
+        doc = _build_report()
+        with ThreadPoolExecutor(2) as executor:
+            chunks = list(ParallelRenderer(doc, workers=2, executor=executor, min_nodes=10).stream())
+
+        assert len(chunks) == 10
+        assert b"".join(chunks) == Renderer(doc).render_bytes()
+
+    def test_render_into_stream(self):
+        doc = _build_report()
+        buffer = io.BytesIO()
+        ParallelRenderer(doc, workers=2, min_nodes=10).render_into(buffer)
+        assert buffer.getvalue() == Renderer(doc).render_bytes()
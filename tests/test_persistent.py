@@ -0,0 +1,185 @@
+import pickle
+
+import pytest
+
+from html_codegen import (
+    PersistentTree,
+    Renderer,
+    body,
+    div,
+    head,
+    html,
+    p,
+    pyscript,
+    span,
+)
+from html_codegen.exceptions import (
+    NodeAlreadyHasParentError,
+    SharedNodeError,
+    TextNodeNestingError,
+)
+
+
+def _build_document() -> html:
+    with html() as doc:
+        head()
+        with body():
+            for index in range(3):
+                with div(attrs={"class": "row"}):
+                    p().text(f"row {index}")
+
+    return doc
+
+
+def _new_span(content: str) -> span:
+    result = span()
+    result.text(content)
+    return result
+
+
+class TestVersions:
+    def test_first_version_renders_like_the_tree(self):
+        doc = _build_document()
+        expected = Renderer(doc).render()
+
+        tree = PersistentTree(doc)
+        assert Renderer(tree.snapshot()).render() == expected
+
+    def test_document_is_left_unchanged(self):
+        doc = _build_document()
+        row = doc.children[1].children[0]
+        tree = PersistentTree(doc)
+        tree.update_attributes((1, 0), {"id": "first"})
+
+        assert tree.snapshot().children[1].children[0] is not row
+        assert row.root is doc
+        assert row.in_body
+        row.add_node(_new_span("added"))
+        assert "id" not in row._attrs
+        assert len(tree.node((1, 0)).children) == 1
+
+    def test_edit_leaves_previous_version_unchanged(self):
+        doc = _build_document()
+        expected = Renderer(doc).render()
+        tree = PersistentTree(doc)
+
+        first = tree.snapshot()
+        second = tree.update_attributes((1, 0), {"id": "first"})
+
+        assert tree.snapshot() is second
+        assert Renderer(first).render() == expected
+        assert '<div class="row" id="first">' in Renderer(second).render()
+
+    def test_unchanged_subtrees_are_shared(self):
+        tree = PersistentTree(_build_document())
+        first = tree.snapshot()
+        second = tree.set_text((1, 1, 0, 0), "changed")
+
+        assert second is not first
+        assert second.children[0] is first.children[0]
+        assert second.children[1].children[0] is first.children[1].children[0]
+        assert second.children[1].children[1] is not first.children[1].children[1]
+        assert first.children[1].children[1].children[0].children[0].content == "row 1"
+
+    def test_restore_previous_version(self):
+        tree = PersistentTree(_build_document())
+        first = tree.snapshot()
+        tree.remove_node((1, 0))
+        tree.restore(first)
+
+        assert len(tree.node((1,)).children) == 3
+
+    def test_versions_are_read_only(self):
+        tree = PersistentTree(_build_document())
+        with pytest.raises(SharedNodeError):
+            tree.node((1, 0)).add_node(p())
+        with pytest.raises(SharedNodeError):
+            tree.node((1, 0))._attrs["id"] = "row"
+
+    def test_version_can_be_pickled(self):
+        tree = PersistentTree(_build_document())
+        tree.add_node((1,), _new_span("new"))
+
+        version = tree.snapshot()
+        assert Renderer(pickle.loads(pickle.dumps(version))).render() == Renderer(version).render()
+
+    def test_tree_with_parent_is_rejected(self):
+        doc = _build_document()
+        with pytest.raises(NodeAlreadyHasParentError):
+            PersistentTree(doc.children[1])
+
+
+class TestEdits:
+    def test_add_node_at_position(self):
+        tree = PersistentTree(_build_document())
+        tree.add_node((1, 2), _new_span("first"), index=0)
+
+        assert [child.tag_name for child in tree.node((1, 2)).children] == ["span", "p"]
+
+    def test_add_node_is_validated(self):
+        tree = PersistentTree(_build_document())
+        first = tree.snapshot()
+        with pytest.raises(TextNodeNestingError):
+            tree.add_node((1, 0, 0, 0), p())
+
+        assert tree.snapshot() is first
+
+    def test_add_node_sees_ancestors(self):
+        with html(use_brython=True) as doc:
+            head()
+            body()
+
+        tree = PersistentTree(doc)
+        tree.add_node((1,), pyscript("missing.module"))
+        assert 'type="text/python"' in Renderer(tree.snapshot()).render()
+
+    def test_version_nodes_have_no_parent(self):
+        tree = PersistentTree(_build_document())
+        tree.add_node((1, 0), _new_span("new"))
+        assert tree.node((1, 0)).parent is None
+        assert tree.node((1, 0, 1)).parent is None
+
+    def test_node_created_in_with_block(self):
+        tree = PersistentTree(_build_document())
+        with div() as outer:
+            tree.add_node((1,), span())
+            tree.replace_node((1, 0), p())
+
+        assert outer.children == []
+        assert [child.tag_name for child in tree.node((1,)).children] == ["p", "div", "div", "span"]
+
+    def test_replace_node(self):
+        tree = PersistentTree(_build_document())
+        tree.replace_node((1, 1), _new_span("replaced"))
+
+        rendered = Renderer(tree.snapshot()).render()
+        assert "replaced" in rendered
+        assert "row 1" not in rendered
+
+    def test_replace_node_is_validated_without_replaced_node(self):
+        tree = PersistentTree(_build_document())
+        tree.replace_node((0,), head())
+        assert [child.tag_name for child in tree.snapshot().children] == ["head", "body"]
+
+    def test_remove_attribute(self):
+        tree = PersistentTree(_build_document())
+        tree.remove_attribute((1, 0), "class")
+        assert "class" not in tree.node((1, 0))._attrs
+
+    def test_set_text_requires_text_node(self):
+        tree = PersistentTree(_build_document())
+        with pytest.raises(TypeError):
+            tree.set_text((1, 0), "text")
+
+    def test_render_matches_tree_built_directly(self):
+        tree = PersistentTree(_build_document())
+        tree.update_attributes((1, 2), {"id": "last"})
+        tree.add_node((1, 2), _new_span("new"))
+
+        expected = _build_document()
+        last = expected.children[1].children[2]
+        last._attrs["id"] = "last"
+        last.add_node(_new_span("new"))
+
+        assert Renderer(tree.snapshot()).render() == Renderer(expected).render()
+        assert Renderer(tree.snapshot()).render_bytes() == Renderer(expected).render_bytes()
@@ -0,0 +1,105 @@
+import io
+import sys
+
+from html_codegen import (
+    Renderer,
+    body,
+    div,
+    head,
+    html,
+    p,
+    title,
+)
+
+
+def _build_document() -> html:
+    with html() as doc:
+        with head():
+            title("Заголовок")
+        with body():
+            with div(attrs={"class": "row", "id": "main"}):
+                p().text("first line\nsecond line")
+            div(attrs={"class": "row"})
+
+    return doc
+
+
+class TestRenderer:
+    def test_render_starts_with_doctype(self):
+        assert Renderer(_build_document()).render().startswith("<!DOCTYPE html>\n<html>\n")
+
+    def test_render_indents_nested_tags(self):
+        html_text = Renderer(_build_document()).render()
+        assert '\n    <div class="row" id="main">\n' in html_text
+        assert "\n        first line\n        second line\n" in html_text
+
+    def test_subtree_render_has_no_doctype(self):
+        doc = _build_document()
+        assert Renderer(doc.children[1]).render().startswith("<body>\n")
+
+
+class TestBytesRender:
+    def test_render_bytes_matches_encoded_render(self):
+        doc = _build_document()
+        assert Renderer(doc).render_bytes() == Renderer(doc).render().encode()
+
+    def test_render_into_bytearray(self):
+        doc = _build_document()
+        buffer = bytearray(b"prefix")
+        Renderer(doc).render_into(buffer)
+        assert buffer == b"prefix" + Renderer(doc).render().encode()
+
+    def test_render_into_stream(self):
+        doc = _build_document()
+        stream = io.BytesIO()
+        Renderer(doc).render_into(stream)
+        assert stream.getvalue() == Renderer(doc).render().encode()
+
+    def test_render_bytes_respects_indent(self):
+        doc = _build_document()
+        assert Renderer(doc, html_indent=4).render_bytes() == Renderer(doc, html_indent=4).render().encode()
+
+
+class TestDeepTree:
+    def test_deep_tree_is_rendered_without_recursion(self):
+        depth = sys.getrecursionlimit() * 10
+        root = node = div()
+        for _ in range(depth):
+            child = div()
+            node.add_node(child)
+            node = child
+        node.add_node("leaf")
+
+        output = Renderer(root, html_indent=0).render()
+        assert output == "<!DOCTYPE html>\n" + "<div>\n" * (depth + 1) + "leaf\n</div>\n" + "\n</div>\n" * depth
+        assert Renderer(root, html_indent=0).render_bytes() == output.encode()
+
+
+class TestAttributesCache:
+    def test_equal_attributes_share_fragment(self):
+        first, second = div(attrs={"class": "row"}), div(attrs={"class": "row"})
+        assert first._attrs.fragment is second._attrs.fragment
+
+    def test_mutation_invalidates_fragment(self):
+        tag = div(attrs={"class": "row"})
+        assert repr(tag) == '<div class="row"></div>'
+
+        tag._attrs["id"] = "main"
+        assert repr(tag) == '<div class="row" id="main"></div>'
+
+        del tag._attrs["class"]
+        assert Renderer(tag).render_bytes() == b'<!DOCTYPE html>\n<div id="main">\n</div>\n'
+
+    def test_unhashable_attribute_value(self):
+        tag = div(attrs={"data-items": ["a", "b"]})
+        assert repr(tag) == "<div data-items=\"['a', 'b']\"></div>"
+
+    def test_body_onload_is_rendered(self):
+        with html(use_brython=True) as doc:
+            body()
+
+        assert '<body onload="brython()">' in Renderer(doc).render()
+
+    def test_equal_non_str_values_are_not_mixed(self):
+        assert repr(div(attrs={"value": 1})) == '<div value="1"></div>'
+        assert repr(div(attrs={"value": True})) == '<div value="True"></div>'
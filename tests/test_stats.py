@@ -0,0 +1,61 @@
+from html_codegen import (
+    Renderer,
+    TreeStats,
+    body,
+    div,
+    head,
+    html,
+    p,
+    text,
+    title,
+)
+
+
+def _build_document() -> html:
+    with html() as doc:
+        with head():
+            title("Заголовок")
+        with body():
+            with div(attrs={"class": "row", "id": "main"}):
+                p().text("first line\nsecond line")
+            div(attrs={"class": "row"})
+
+    return doc
+
+
+class TestTreeStats:
+    def test_stats_type(self):
+        assert isinstance(_build_document().stats(), TreeStats)
+
+    def test_node_count_and_depth(self):
+        stats = _build_document().stats()
+        # html, head, title, text, body, div, p, text, div
+        assert stats.node_count == 9
+        assert stats.max_depth == 4
+
+    def test_tag_counts(self):
+        stats = _build_document().stats()
+        assert stats.tag_counts["div"] == 2
+        assert stats.tag_counts["p"] == 1
+        assert "" not in stats.tag_counts
+
+    def test_text_and_attr_bytes(self):
+        stats = _build_document().stats()
+        assert stats.text_bytes == len("Заголовок".encode()) + len("first line\nsecond line")
+        assert stats.attr_bytes == len("classrow") * 2 + len("idmain")
+
+    def test_memory_estimate_is_positive(self):
+        assert _build_document().stats().memory_bytes > 0
+
+    def test_rendered_bytes_matches_render(self):
+        doc = _build_document()
+        assert doc.stats().rendered_bytes == len(Renderer(doc).render().encode())
+
+    def test_rendered_bytes_of_subtree(self):
+        doc = _build_document()
+        subtree = doc.children[1].children[0]
+        assert subtree.stats().rendered_bytes == len(Renderer(subtree).render().encode())
+
+    def test_rendered_bytes_of_text(self):
+        node = text("a\nb")
+        assert node.stats().rendered_bytes == len(Renderer(node).render().encode())
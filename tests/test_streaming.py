@@ -0,0 +1,192 @@
+import io
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from html_codegen import (
+    Placeholder,
+    Renderer,
+    StreamingRenderer,
+    body,
+    div,
+    head,
+    html,
+    p,
+    style,
+)
+from html_codegen.css import prune_unused_css
+from html_codegen.transforms import (
+    Transforms,
+    csp_nonce,
+)
+
+
+def _section(label: str, started: threading.Event = None, release: threading.Event = None):
+    def build() -> div:
+        if started is not None:
+            started.set()
+        if release is not None:
+            assert release.wait(5)
+        with div(attrs={"class": label}) as result:
+            p().text(label)
+        return result
+
+    return build
+
+
+def _page(*sources) -> html:
+    with html() as doc:
+        head()
+        with body():
+            p().text("shell")
+            for source in sources:
+                with Placeholder(source):
+                    p().text("Loading")
+
+    return doc
+
+
+class TestPlainRender:
+    def test_placeholder_renders_resolved_section(self):
+        with html() as expected:
+            head()
+            with body():
+                p().text("shell")
+                _section("reviews")()
+
+        assert Renderer(_page(_section("reviews"))).render() == Renderer(expected).render()
+
+    def test_placeholder_from_future(self):
+        future = Future()
+        future.set_result(_section("price")())
+        assert 'class="price"' in Renderer(_page(future)).render()
+
+    def test_source_is_built_once(self):
+        calls = []
+
+        def build() -> div:
+            calls.append(1)
+            return div()
+
+        doc = _page(build)
+        Renderer(doc).render()
+        Renderer(doc).render_bytes()
+        assert calls == [1]
+
+    def test_source_must_return_element(self):
+        with pytest.raises(TypeError):
+            Renderer(_page(lambda: "text")).render()
+
+
+class TestTreeTools:
+    def test_stats_do_not_wait_for_section(self):
+        release = threading.Event()
+        doc = _page(_section("slow", release=release))
+
+        stats = doc.stats()
+        assert stats.tag_counts["div"] == 1
+        assert stats.tag_counts["p"] == 2
+        release.set()
+
+    def test_stats_of_built_section(self):
+        doc = _page(_section("price"))
+        doc.children[1].children[1].result()
+
+        stats = doc.stats()
+        assert stats.tag_counts["p"] == 1
+        assert stats.rendered_bytes == len(Renderer(doc).render_bytes())
+
+    def test_css_pruning_does_not_wait_for_section(self, tmp_path):
+        css = tmp_path / "page.css"
+        css.write_text(".slow { color: red; }\n.price { color: blue; }\n.unused { color: green; }")
+        release = threading.Event()
+        built = Placeholder(_section("price"))
+        built.result()
+
+        with html() as doc:
+            with head():
+                style(str(css))
+            with body():
+                Placeholder(_section("slow", release=release))
+        doc.children[1].add_node(built)
+
+        prune_unused_css(doc)
+        output = Renderer(doc.children[0]).render()
+        assert ".price" in output
+        assert ".slow" not in output
+        assert ".unused" not in output
+        release.set()
+
+
+class TestStreaming:
+    def test_shell_is_sent_before_sections_resolve(self):
+        release = threading.Event()
+        chunks = StreamingRenderer(_page(_section("slow", release=release))).stream()
+
+        shell = next(chunks).decode()
+        assert "shell" in shell
+        assert '<div id="html-codegen-0">' in shell
+        assert "Loading" in shell
+        assert "</body>" not in shell
+
+        release.set()
+        section, end = list(chunks)
+        assert '<template id="html-codegen-0-content">' in section.decode()
+        assert "htmlCodegenSwap('html-codegen-0');" in section.decode()
+        assert end.decode().strip().startswith("</body>")
+
+    def test_sections_are_sent_in_completion_order(self):
+        first_release, second_release = threading.Event(), threading.Event()
+        second_started = threading.Event()
+        chunks = StreamingRenderer(
+            _page(_section("first", release=first_release), _section("second", second_started, second_release))
+        ).stream()
+        next(chunks)
+
+        assert second_started.wait(5)
+        second_release.set()
+        assert "html-codegen-1-content" in next(chunks).decode()
+        first_release.set()
+        assert "html-codegen-0-content" in next(chunks).decode()
+
+    def test_swap_function_is_defined_once(self):
+        output = StreamingRenderer(_page(_section("first"), _section("second"))).render()
+        assert output.count("function htmlCodegenSwap") == 1
+        assert output.index("function htmlCodegenSwap") < output.index("htmlCodegenSwap('html-codegen-")
+
+    def test_nested_placeholder_is_streamed(self):
+        def outer() -> div:
+            with div() as result:
+                Placeholder(_section("inner"))
+            return result
+
+        output = StreamingRenderer(_page(outer)).render()
+        assert "html-codegen-1-content" in output
+        assert output.index("html-codegen-0-content") < output.index("html-codegen-1-content")
+
+    def test_error_is_raised_after_shell(self):
+        def failing() -> div:
+            raise ValueError("source unavailable")
+
+        chunks = StreamingRenderer(_page(failing)).stream()
+        assert "shell" in next(chunks).decode()
+        with pytest.raises(ValueError):
+            next(chunks)
+
+    def test_transforms_apply_to_generated_script(self):
+        transforms = Transforms()
+        transforms.add("script", csp_nonce("abc"))
+
+        output = StreamingRenderer(_page(_section("price")), transforms=transforms).render()
+        assert '<script nonce="abc">' in output
+
+    def test_render_into_stream(self):
+        buffer = io.BytesIO()
+        renderer = StreamingRenderer(_page(_section("price")))
+        renderer.render_into(buffer)
+        assert buffer.getvalue().decode() == StreamingRenderer(_page(_section("price"))).render()
+
+    def test_without_placeholders_output_matches_renderer(self):
+        doc = _page()
+        assert StreamingRenderer(doc).render() == Renderer(doc).render()
@@ -0,0 +1,78 @@
+from html_codegen import (
+    Renderer,
+    a,
+    body,
+    component,
+    div,
+    html,
+    p,
+    script,
+)
+from html_codegen.transforms import (
+    Transforms,
+    add_noopener,
+    csp_nonce,
+    rewrite_urls,
+)
+
+
+def _build_document() -> html:
+    with html() as doc:
+        with body():
+            a(attrs={"href": "/static/page.html", "rel": "external"}).text("link")
+            with div(attrs={"class": "row"}):
+                a(attrs={"href": "https://example.com"}).text("out")
+            script(src="/static/app.js")
+
+    return doc
+
+
+def _make_transforms() -> Transforms:
+    transforms = Transforms()
+    transforms.register("a")(add_noopener)
+    transforms.add("script", csp_nonce("abc"))
+    transforms.register("a", "script")(rewrite_urls(lambda url: url.replace("/static/", "https://cdn/")))
+    return transforms
+
+
+class TestTransforms:
+    def test_hooks_are_applied(self):
+        output = Renderer(_build_document(), transforms=_make_transforms()).render()
+
+        assert '<a href="https://cdn/page.html" rel="external noopener">' in output
+        assert '<a href="https://example.com" rel="noopener">' in output
+        assert '<script src="https://cdn/app.js" nonce="abc">' in output
+
+    def test_tree_is_not_changed(self):
+        doc = _build_document()
+        expected = Renderer(doc).render()
+        Renderer(doc, transforms=_make_transforms()).render()
+
+        assert Renderer(doc).render() == expected
+
+    def test_bytes_match_text(self):
+        renderer = Renderer(_build_document(), transforms=_make_transforms())
+
+        assert renderer.render_bytes() == renderer.render().encode()
+
+    def test_unregistered_tags_render_unchanged(self):
+        doc = _build_document()
+        transforms = Transforms()
+        transforms.add("img", csp_nonce("abc"))
+
+        assert Renderer(doc, transforms=transforms).render() == Renderer(doc).render()
+
+    def test_hooks_apply_inside_components(self):
+        @component
+        def card(url: str) -> div:
+            with div() as result:
+                a(attrs={"href": url}).text("more")
+            return result
+
+        with div() as doc:
+            card("/static/x.html")
+            p().text("after")
+
+        output = Renderer(doc, transforms=_make_transforms()).render()
+        assert '<a href="https://cdn/x.html" rel="noopener">' in output
+        assert output.replace(' rel="noopener"', "").replace("https://cdn/", "/static/") == Renderer(doc).render()
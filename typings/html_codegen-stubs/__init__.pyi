@@ -0,0 +1,16 @@
+"""
+This type stub file was generated by pyright.
+"""
+
+from typing import Any
+
+from .assets import AssetPipeline as AssetPipeline
+from .bundler import Bundle as Bundle
+from .core import HTML as HTML
+from .core import HTMLNode as HTMLNode
+from .renderer import Renderer as Renderer
+from .stats import TreeStats as TreeStats
+from .tags import *
+
+# остальные имена пакета пока не описаны в заглушках
+def __getattr__(name: str) -> Any: ...
@@ -0,0 +1,47 @@
+"""
+This type stub file was generated by pyright.
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Хеш содержимого файла, который читается заново только при изменении размера или времени изменения.
+    """
+    ...
+
+class AssetPipeline:
+    """
+    AssetPipeline - каталог файлов ресурсов, названных по хешу содержимого.
+
+    Attributes:
+        output_dir (Path): каталог, в который копируются ресурсы
+        url_prefix (str): префикс URL в атрибутах "href"/"src"
+        inline_threshold (int): размер в байтах, до которого файлы встраиваются
+    """
+    output_dir: Path
+    url_prefix: str
+    inline_threshold: int
+    def __init__(self, output_dir: Union[str, Path], url_prefix: str = ..., inline_threshold: int = ...) -> None:
+        ...
+    
+    def should_inline(self, path: Union[str, Path]) -> bool:
+        """
+        Проверяет, достаточно ли мал файл для встраивания.
+        """
+        ...
+    
+    def emit(self, path: Union[str, Path]) -> str:
+        """
+        Копирует файл в каталог ресурсов и возвращает его URL.
+        """
+        ...
+    
+    def emit_or_inline(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        Копирует файл, если он слишком велик для встраивания; иначе возвращает None.
+        """
+        ...
+    
+
@@ -0,0 +1,54 @@
+"""
+This type stub file was generated by pyright.
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+def resolve_module(module_name: str) -> Optional[Path]:
+    """
+    Находит файл исходного кода модуля по его имени, не импортируя его.
+    """
+    ...
+
+def strip_python_source(source: str) -> str:
+    """
+    Удаляет комментарии и строки документации из исходного кода Python.
+    """
+    ...
+
+def get_module_source(module_name: str, strip: bool = ...) -> Optional[str]:
+    """
+    Исходный код модуля, читаемый с диска только при изменении файла.
+    """
+    ...
+
+class Bundle:
+    """
+    Bundle - каталог файлов модулей Brython, названных по хешу содержимого.
+
+    Attributes:
+        output_dir (Path): каталог, в который записываются модули
+        url_prefix (str): префикс URL в атрибутах "src"
+        strip (bool): удалять комментарии и строки документации
+    """
+    output_dir: Path
+    url_prefix: str
+    strip: bool
+    def __init__(self, output_dir: Union[str, Path], url_prefix: str = ..., strip: bool = ...) -> None:
+        ...
+    
+    def add(self, module_name: str) -> Optional[str]:
+        """
+        Записывает модуль в каталог и возвращает его URL, None если модуль не найден.
+        """
+        ...
+    
+    @property
+    def files(self) -> list[str]:
+        """
+        URL добавленных модулей в порядке их первого добавления.
+        """
+        ...
+    
+
@@ -3,7 +3,9 @@ This type stub file was generated by pyright.
 """
 
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional, Union
+
+from .stats import TreeStats
 
 """
 Этот модуль содержит классы HTMLNode и HTML для создания иерархии узлов HTML-документа.
@@ -20,6 +22,32 @@ from typing import Callable, Optional
 
 Класс HTML также позволяет динамически создавать дочерние элементы с помощью вызовов методов с названиями тегов.
 """
+class Attributes(dict):
+    """
+    Attributes - словарь атрибутов элемента с кэшированной отрендеренной формой.
+    """
+    @property
+    def fragment(self) -> str:
+        """
+        Отрендеренные атрибуты, например ' class="row" id="main"'.
+        """
+        ...
+    
+    @property
+    def fragment_bytes(self) -> bytes:
+        """
+        Отрендеренные атрибуты в кодировке UTF-8.
+        """
+        ...
+    
+    def copy(self) -> Attributes:
+        """
+        Копирует атрибуты вместе с кэшированной отрендеренной формой.
+        """
+        ...
+    
+
+
 class HTMLNode:
     """
     HTMLNode - базовый класс для всех узлов HTML-дерева.
@@ -30,7 +58,6 @@ class HTMLNode:
         _ctx: Контекст текущего узла.
     """
     frame = ...
-    _with_contexts = ...
     def __init__(self) -> None:
         ...
     
@@ -98,6 +125,39 @@ class HTMLNode:
         """
         ...
     
+    def walk(
+        self, order: str = ..., prune: Optional[Callable[[HTMLNode], bool]] = ...
+    ) -> Iterator[HTMLNode]:
+        """
+        Обход узла и его поддерева в порядке документа без рекурсии.
+        
+        Args:
+            order (str): "pre" - узел перед потомками, "post" - после них.
+            prune (Optional[Callable[[HTMLNode], bool]]): Проверка узлов, потомки которых пропускаются.
+        
+        Returns:
+            Iterator[HTMLNode]: Узлы поддерева.
+        """
+        ...
+    
+    def descendants(self, prune: Optional[Callable[[HTMLNode], bool]] = ...) -> Iterator[HTMLNode]:
+        """
+        Обход поддерева узла без самого узла в прямом порядке.
+        """
+        ...
+    
+    def ancestors(self) -> Iterator[HTMLNode]:
+        """
+        Обход предков узла от родителя до корня.
+        """
+        ...
+    
+    def iter_text(self) -> Iterator[str]:
+        """
+        Содержимое текстовых узлов поддерева в порядке документа.
+        """
+        ...
+    
     def add_node_validation(self, new_node: HTMLNode) -> None:
         """
         Метод для проверки дочернего узла перед добавлением в текущий узел HTML.
@@ -110,12 +170,13 @@ class HTMLNode:
         """
         ...
     
-    def add_node(self, new_node: HTMLNode) -> None:
+    def add_node(self, new_node: Union[HTMLNode, str]) -> None:
         """
         Метод для добавления дочернего узла в текущий узел HTML.
+        Строка добавляется как текстовый узел.
         
         Args:
-            new_node (HTMLNode): Новый дочерний узел, который нужно добавить.
+            new_node (Union[HTMLNode, str]): Новый дочерний узел, который нужно добавить.
         
         Returns:
             None
@@ -132,12 +193,16 @@ class HTML(HTMLNode):
         tag_name (str): имя тега элемента
         is_single (bool): флаг, указывающий, является ли элемент одиночным (например, <img>)
         is_text (bool): флаг, указывающий, является ли элемент текстовым
+        is_fragment (bool): флаг, указывающий, является ли элемент заранее отрендеренным фрагментом компонента
+        is_placeholder (bool): флаг, указывающий, является ли элемент заполнителем, вычисляемым позже
         _attrs (dict): словарь атрибутов элемента
         parent (HTML): родительский элемент
         root (HTML): корневой элемент
         _nodes (list): список дочерних элементов
 
     """
+    is_fragment: bool
+    is_placeholder: bool
     def __init__(self, tag_name: str, attrs: Optional[dict] = ...) -> None:
         """
         Инициализирует экземпляр класса HTML.
@@ -207,12 +272,67 @@ class HTML(HTMLNode):
         """
         ...
     
-    def save(self, filename: str) -> Path:
+    def validate(self) -> None:
+        """
+        Проверяет всё дерево за один проход, включая проверки, пропущенные внутри trusted().
+
+        Raises:
+            HTMLCodeGenError: первый найденный некорректный узел или все они внутри collect_errors()
+
+        """
+        ...
+    
+    def clone(self, deep: bool = ...) -> HTML:
+        """
+        Копирует элемент без родителя, а при deep - и его поддерево.
+
+        Args:
+            deep (bool): копировать также дочерние элементы
+
+        Returns:
+            HTML: отсоединённая копия элемента
+
+        """
+        ...
+    
+    def share(self) -> HTML:
+        """
+        Делает элемент неизменяемым общим узлом, который можно добавлять в любое число родителей.
+
+        Returns:
+            HTML: сам элемент
+
+        Raises:
+            NodeAlreadyHasParentError: если у элемента уже есть родитель
+            SharedNodeError: если элемент зависит от обратных вызовов родителя (например, "head", "body")
+
+        """
+        ...
+    
+    def stats(self, html_indent: int = ...) -> TreeStats:
+        """
+        Собирает статистику размера дерева с корнем в этом элементе.
+
+        Args:
+            html_indent (int): ширина отступа, для которой предсказывается размер вывода
+
+        Returns:
+            TreeStats: число узлов, глубина, объём текста и атрибутов, число элементов по тегам,
+                оценка памяти и размер отрендеренного документа
+
+        """
+        ...
+    
+    def save(self, filename: Union[str, Path], buffer_size: int = ..., memory_map: bool = ...) -> Path:
         """
         Сохраняет HTML-документ в файл.
 
+        Документ записывается во временный файл рядом с целевым, который затем атомарно его заменяет.
+
         Args:
-            filename (str): имя файла
+            filename (Union[str, Path]): имя файла
+            buffer_size (int): размер буфера записи в байтах или начальный размер отображения при memory_map
+            memory_map (bool): записывать через отображённый в память файл вместо буферизованного потока
 
         Returns:
             Path: объект класса Path, представляющий путь к файлу
@@ -2,15 +2,24 @@
 This type stub file was generated by pyright.
 """
 
+from typing import BinaryIO, Optional, Union
+
 from .core import HTML
+from .transforms import Transforms
 
 class Renderer:
-    def __init__(self, tag: HTML, html_indent: int = ...) -> None:
+    def __init__(self, tag: HTML, html_indent: int = ..., transforms: Optional[Transforms] = ...) -> None:
         ...
     
     def render(self) -> str:
         ...
     
+    def render_bytes(self) -> bytes:
+        ...
+    
+    def render_into(self, buffer: Union[bytearray, BinaryIO]) -> None:
+        ...
+    
     def get_inner_text(self, tag: HTML) -> str:
         ...
     
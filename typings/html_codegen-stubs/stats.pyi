@@ -0,0 +1,33 @@
+"""
+This type stub file was generated by pyright.
+"""
+
+from typing import NamedTuple
+
+from .core import HTML
+
+class TreeStats(NamedTuple):
+    """
+    TreeStats - отчёт о размере HTML-дерева.
+
+    Attributes:
+        node_count (int): число узлов дерева, включая текстовые
+        max_depth (int): глубина самого глубокого узла, проверяемый узел на глубине 0
+        text_bytes (int): размер всего текста в UTF-8
+        attr_bytes (int): размер имён и значений всех атрибутов в UTF-8
+        tag_counts (dict[str, int]): число элементов по именам тегов
+        memory_bytes (int): оценка памяти, занимаемой деревом
+        rendered_bytes (int): размер вывода Renderer(tag).render() в UTF-8
+    """
+    node_count: int
+    max_depth: int
+    text_bytes: int
+    attr_bytes: int
+    tag_counts: dict[str, int]
+    memory_bytes: int
+    rendered_bytes: int
+
+
+def collect_stats(tag: HTML, html_indent: int = ...) -> TreeStats:
+    ...
+
@@ -4,6 +4,8 @@ This type stub file was generated by pyright.
 
 from typing import Optional
 
+from .assets import AssetPipeline
+from .bundler import Bundle
 from .core import HTML
 
 class text(HTML):
@@ -12,16 +14,21 @@ class text(HTML):
 
     Attributes:
         is_text (bool): Indicates whether this node is a text node.
+        content (str): Text of the node.
     """
 
-    def __init__(self, text: str, /) -> None:
+    content: str
+
+    def __init__(self, text: str, /, reindent: bool = ...) -> None:
         """
         Инициализирует объект текста с заданным текстом.
 
         Параметры:
             text (str): Текст, который будет установлен для этого узла.
+            reindent (bool): Добавлять ли отступ к каждой строке текста при рендеринге.
         """
         ...
+    def add_node(self, new_node: HTML) -> None: ...
     def add_node_validation(self, *args) -> None: ...
     def __repr__(self): ...
 
@@ -154,6 +161,8 @@ class style(_OnlyTextTagMixin, _Tag):
         *,
         media: Optional[str] = ...,
         style_type: Optional[str] = ...,
+        assets: Optional[AssetPipeline] = ...,
+        minify: bool = ...,
     ) -> None:
         """
         Инициализирует объект style тега с заданным путем к стилю и необязательными медиа и типом стиля.
@@ -162,6 +171,8 @@ class style(_OnlyTextTagMixin, _Tag):
             style_path (str): Путь к файлу стиля.
             media (Optional[str]): Медиа, для которых предназначен этот стиль.
             style_type (Optional[str]): Тип этого стиля.
+            assets (Optional[AssetPipeline]): Каталог, в который выносится файл стиля вместо встраивания.
+            minify (bool): Встраивать стиль без комментариев и лишних пробелов.
         """
         ...
 
@@ -170,12 +181,20 @@ class script(_OnlyTextTagMixin, _Tag):
     This class represents a script tag in HTML. It inherits from the _OnlyTextTagMixin and _Tag classes.
     """
 
-    def __init__(self, script_path: Optional[str] = ..., **kwargs) -> None:
+    def __init__(
+        self,
+        script_path: Optional[str] = ...,
+        assets: Optional[AssetPipeline] = ...,
+        minify: bool = ...,
+        **kwargs,
+    ) -> None:
         """
         Инициализирует объект script тега с заданным путем к скрипту.
 
         Параметры:
             script_path (Optional[str]): Путь к файлу скрипта.
+            assets (Optional[AssetPipeline]): Каталог, в который выносится файл скрипта вместо встраивания.
+            minify (bool): Встраивать скрипт без комментариев и отступов.
             **kwargs: Дополнительные именованные аргументы, которые будут переданы в родительский класс.
         """
         ...
@@ -409,12 +428,14 @@ class pyscript(_OnlyTextTagMixin, _Tag):
     This class represents a pyscript tag in HTML. It inherits from the _OnlyTextTagMixin and _Tag classes.
     """
 
-    def __init__(self, module: str, /, **kwargs) -> None:
+    def __init__(self, module: str, /, bundle: Optional[Bundle] = ..., minify: bool = ..., **kwargs) -> None:
         """
         Инициализирует объект pyscript тега с заданным модулем Python.
 
         Параметры:
             module (str): Модуль Python, который будет использован в этом теге.
+            bundle (Optional[Bundle]): Каталог, в который выносится модуль вместо встраивания.
+            minify (bool): Встраивать модуль без комментариев и строк документации.
             **kwargs: Дополнительные именованные аргументы, которые будут переданы в родительский класс.
         """
         ...
@@ -445,13 +466,14 @@ class link(_SingleTag):
     This class represents a link tag in HTML. It inherits from the _SingleTag class.
     """
 
-    def __init__(self, href: str, /, rel: str, **kwargs) -> None:
+    def __init__(self, href: str, /, rel: str, assets: Optional[AssetPipeline] = ..., **kwargs) -> None:
         """
         Инициализирует объект link тега с заданными параметрами.
 
         Параметры:
             href (str): URL, на который должен указывать ссылка.
             rel (str): Отношение между текущим документом и целевым документом.
+            assets (Optional[AssetPipeline]): Каталог, в который копируется локальный файл из href.
             **kwargs: Дополнительные именованные аргументы, которые будут переданы в родительский класс.
         """
         ...
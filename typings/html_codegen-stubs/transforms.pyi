@@ -0,0 +1,52 @@
+"""
+This type stub file was generated by pyright.
+"""
+
+from typing import Callable, Optional
+
+from .core import HTML, Attributes
+
+Hook = Callable[[HTML, Attributes], None]
+
+class Transforms:
+    """
+    Transforms - таблица хуков атрибутов по именам тегов.
+
+    Хук получает элемент и копию его атрибутов, которую изменяет на месте; рендерится именно копия.
+
+    Attributes:
+        hooks (dict[str, list[Hook]]): хуки по именам тегов
+    """
+    hooks: dict[str, list[Hook]]
+    def __init__(self) -> None:
+        ...
+    
+    def add(self, tag_name: str, hook: Hook) -> None:
+        """
+        Регистрирует хук для имени тега.
+        """
+        ...
+    
+    def register(self, *tag_names: str) -> Callable[[Hook], Hook]:
+        """
+        Декоратор, регистрирующий функцию как хук для указанных имён тегов.
+        """
+        ...
+    
+    def attributes(self, tag: HTML) -> Optional[Attributes]:
+        """
+        Атрибуты элемента после выполнения его хуков, None если ни один хук не подходит.
+        """
+        ...
+    
+
+
+def add_noopener(tag: HTML, attrs: Attributes) -> None:
+    ...
+
+def csp_nonce(nonce: str) -> Hook:
+    ...
+
+def rewrite_urls(rewrite: Callable[[str], str], names: tuple[str, ...] = ...) -> Hook:
+    ...
+